@@ -5,7 +5,18 @@ This module provides advanced wait conditions for deployment orchestration,
 including resource readiness, custom conditions, and complex dependencies.
 """
 
-from typing import Dict, List, Any, Optional, Union
+import asyncio
+import shlex
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Dict, List, Any, Optional, Union, Iterator, Tuple, Callable
 from enum import Enum
 from ..core.base_builder import BaseBuilder
 from ..utils.decorators import kubernetes_only
@@ -22,6 +33,20 @@ class WaitType(Enum):
     METRIC_THRESHOLD = "metric_threshold"
 
 
+# Kubernetes-style boolean strings for ConfigMap data
+_BOOL_STR = {True: "true", False: "false"}
+
+# Accepted values, checked when a condition is configured
+_FAILURE_POLICIES = frozenset({"fail_fast", "continue_on_failure"})
+_COMPARISONS = frozenset({">=", "<=", "==", "!=", ">", "<"})
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "HEAD", "PATCH", "OPTIONS"})
+
+
+def _interned(value: Optional[str]) -> Optional[str]:
+    """Intern strings repeated across conditions (namespaces, timeouts)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class WaitCondition(BaseBuilder):
     """
     Builder class for sophisticated wait conditions.
@@ -40,6 +65,43 @@ class WaitCondition(BaseBuilder):
         ```
     """
     
+    # Condition types that execute() can probe from the current process
+    _PROBES = {
+        WaitType.TCP_CONNECT.value: "_probe_tcp",
+        WaitType.HTTP_SUCCESS.value: "_probe_http",
+        WaitType.CUSTOM_COMMAND.value: "_probe_command",
+    }
+    
+    # Seconds between attempts while a probe is not yet successful
+    _PROBE_INTERVAL = 1.0
+    
+    # Wait Job script; each condition renders to one helper call in {body}
+    _SCRIPT_TEMPLATE = (
+        "#!/bin/sh\n"
+        "set -e\n"
+        "wait_tcp() {{\n"
+        "  until nc -z \"$1\" \"$2\"; do echo \"Waiting for $1:$2 to be ready\"; sleep 5; done\n"
+        "  echo \"TCP connection to $1:$2 is ready\"\n"
+        "}}\n"
+        "wait_http() {{\n"
+        "  until curl -s -f \"$1\" > /dev/null; do echo \"Waiting for $1 to return success\"; sleep 10; done\n"
+        "  echo \"HTTP endpoint $1 is ready\"\n"
+        "}}\n"
+        "echo 'Starting wait conditions...'\n"
+        "{body}\n"
+        "echo 'All wait conditions completed successfully!'\n"
+    )
+    
+    __slots__ = (
+        "_wait_conditions",
+        "_timeout",
+        "_parallel_execution",
+        "_failure_policy",
+        "_retry_config",
+        "_success_threshold",
+        "_failure_threshold",
+    )
+    
     def __init__(self, name: str):
         """
         Initialize the WaitCondition builder.
@@ -52,7 +114,8 @@ class WaitCondition(BaseBuilder):
         self._timeout: str = "5m"
         self._parallel_execution: bool = False
         self._failure_policy: str = "fail_fast"
-        self._retry_config: Dict[str, Any] = {}
+        # Allocated by enable_retry(); most wait conditions never retry
+        self._retry_config: Optional[Dict[str, Any]] = None
         self._success_threshold: int = 1
         self._failure_threshold: int = 3
     
@@ -79,9 +142,9 @@ class WaitCondition(BaseBuilder):
             "type": WaitType.RESOURCE_READY.value,
             "resource": "pod",
             "name": name,
-            "namespace": namespace or self._namespace,
+            "namespace": _interned(namespace or self._namespace),
             "selector": selector,
-            "timeout": timeout or self._timeout
+            "timeout": _interned(timeout or self._timeout)
         }
         self._wait_conditions.append(condition)
         return self
@@ -107,8 +170,8 @@ class WaitCondition(BaseBuilder):
             "type": WaitType.RESOURCE_READY.value,
             "resource": "service",
             "name": name,
-            "namespace": namespace or self._namespace,
-            "timeout": timeout or self._timeout
+            "namespace": _interned(namespace or self._namespace),
+            "timeout": _interned(timeout or self._timeout)
         }
         self._wait_conditions.append(condition)
         return self
@@ -134,8 +197,8 @@ class WaitCondition(BaseBuilder):
             "type": WaitType.RESOURCE_READY.value,
             "resource": "deployment",
             "name": name,
-            "namespace": namespace or self._namespace,
-            "timeout": timeout or self._timeout
+            "namespace": _interned(namespace or self._namespace),
+            "timeout": _interned(timeout or self._timeout)
         }
         self._wait_conditions.append(condition)
         return self
@@ -160,14 +223,20 @@ class WaitCondition(BaseBuilder):
             
         Returns:
             WaitCondition: Self for method chaining
+            
+        Raises:
+            ValueError: If the HTTP method is not supported
         """
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"HTTP method must be one of: {', '.join(sorted(_HTTP_METHODS))}")
+        
         condition = {
             "type": WaitType.HTTP_SUCCESS.value,
             "url": url,
             "method": method,
             "headers": headers or {},
             "expected_status": expected_status,
-            "timeout": timeout or self._timeout
+            "timeout": _interned(timeout or self._timeout)
         }
         self._wait_conditions.append(condition)
         return self
@@ -193,7 +262,7 @@ class WaitCondition(BaseBuilder):
             "type": WaitType.TCP_CONNECT.value,
             "host": host,
             "port": port,
-            "timeout": timeout or self._timeout
+            "timeout": _interned(timeout or self._timeout)
         }
         self._wait_conditions.append(condition)
         return self
@@ -221,7 +290,7 @@ class WaitCondition(BaseBuilder):
             "type": WaitType.CUSTOM_COMMAND.value,
             "command": command,
             "expected_exit_code": expected_exit_code,
-            "timeout": timeout or self._timeout,
+            "timeout": _interned(timeout or self._timeout),
             "description": description
         }
         self._wait_conditions.append(condition)
@@ -252,9 +321,9 @@ class WaitCondition(BaseBuilder):
             "type": WaitType.LOG_PATTERN.value,
             "resource_name": resource_name,
             "pattern": pattern,
-            "namespace": namespace or self._namespace,
+            "namespace": _interned(namespace or self._namespace),
             "container": container,
-            "timeout": timeout or self._timeout
+            "timeout": _interned(timeout or self._timeout)
         }
         self._wait_conditions.append(condition)
         return self
@@ -279,14 +348,20 @@ class WaitCondition(BaseBuilder):
             
         Returns:
             WaitCondition: Self for method chaining
+            
+        Raises:
+            ValueError: If the comparison operator is not supported
         """
+        if comparison not in _COMPARISONS:
+            raise ValueError(f"Comparison must be one of: {', '.join(sorted(_COMPARISONS))}")
+        
         condition = {
             "type": WaitType.METRIC_THRESHOLD.value,
             "metric_query": metric_query,
             "threshold": threshold,
             "comparison": comparison,
             "prometheus_url": prometheus_url,
-            "timeout": timeout or self._timeout
+            "timeout": _interned(timeout or self._timeout)
         }
         self._wait_conditions.append(condition)
         return self
@@ -320,8 +395,8 @@ class WaitCondition(BaseBuilder):
             "resource_name": resource_name,
             "condition_type": condition_type,
             "status": status,
-            "namespace": namespace or self._namespace,
-            "timeout": timeout or self._timeout
+            "namespace": _interned(namespace or self._namespace),
+            "timeout": _interned(timeout or self._timeout)
         }
         self._wait_conditions.append(condition)
         return self
@@ -361,7 +436,12 @@ class WaitCondition(BaseBuilder):
             
         Returns:
             WaitCondition: Self for method chaining
+            
+        Raises:
+            ValueError: If the failure policy is not supported
         """
+        if policy not in _FAILURE_POLICIES:
+            raise ValueError("Failure policy must be 'fail_fast' or 'continue_on_failure'")
         self._failure_policy = policy
         return self
     
@@ -408,6 +488,266 @@ class WaitCondition(BaseBuilder):
         self._failure_threshold = failure_threshold
         return self
     
+    def execute(self) -> bool:
+        """
+        Check the wait conditions from the current process.
+        
+        TCP, HTTP and custom command conditions are polled locally until they
+        succeed or their timeout expires. With parallel checks enabled every
+        condition runs on its own worker thread, so the total wait is bounded
+        by the slowest probe instead of the sum of all probes. The global
+        timeout caps the whole run and the failure policy decides whether the
+        first failing condition ends it. Running probes are stopped and their
+        threads joined before returning.
+        
+        Returns:
+            bool: True if all conditions succeeded
+            
+        Raises:
+            ValueError: If a condition can only be checked inside the cluster
+        """
+        self._check_probe_support()
+        
+        if not self._wait_conditions:
+            return True
+        
+        max_workers = len(self._wait_conditions) if self._parallel_execution else 1
+        deadline = time.monotonic() + self._parse_duration(self._timeout)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [
+            executor.submit(getattr(self, self._PROBES[condition["type"]]), condition, deadline, stop)
+            for condition in self._wait_conditions
+        ]
+        
+        success = True
+        try:
+            for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+                if not future.result():
+                    success = False
+                    if self._failure_policy == "fail_fast":
+                        break
+        except FuturesTimeoutError:
+            success = False
+        finally:
+            # Drop probes that have not started and stop running ones at their next
+            # attempt; every attempt ends by the global deadline, so the join is bounded
+            stop.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+        
+        return success
+    
+    async def execute_async(self) -> bool:
+        """
+        Check the wait conditions on an asyncio event loop.
+        
+        HTTP conditions share one aiohttp ClientSession whose keep-alive pool
+        is reused for every poll, so retries against the same host skip the
+        connection handshake. Other condition types run their blocking probes
+        on the loop's default executor. All conditions are checked
+        concurrently, bounded by the global timeout; executor probes are
+        stopped when the run ends, so they do not outlive it.
+        
+        Returns:
+            bool: True if all conditions succeeded
+            
+        Raises:
+            ImportError: If aiohttp is not installed
+            ValueError: If a condition can only be checked inside the cluster
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("aiohttp is required for async wait condition execution")
+        
+        self._check_probe_support()
+        
+        if not self._wait_conditions:
+            return True
+        
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self._parse_duration(self._timeout)
+        stop = threading.Event()
+        connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [
+                asyncio.ensure_future(
+                    self._poll_http_async(session, condition)
+                    if WaitType(condition["type"]) is WaitType.HTTP_SUCCESS
+                    else loop.run_in_executor(
+                        None, getattr(self, self._PROBES[condition["type"]]), condition, deadline, stop
+                    )
+                )
+                for condition in self._wait_conditions
+            ]
+            try:
+                return await asyncio.wait_for(
+                    self._collect_async(tasks),
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                # Executor probes ignore task cancellation; the event ends their polling
+                stop.set()
+                for task in tasks:
+                    task.cancel()
+    
+    async def _collect_async(self, tasks: List["asyncio.Future[bool]"]) -> bool:
+        """Await probe tasks as they finish, applying the failure policy."""
+        success = True
+        for next_done in asyncio.as_completed(tasks):
+            if not await next_done:
+                success = False
+                if self._failure_policy == "fail_fast":
+                    break
+        return success
+    
+    async def _poll_http_async(self, session: Any, condition: Dict[str, Any]) -> bool:
+        """Poll an HTTP endpoint through a shared aiohttp session."""
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._parse_duration(condition.get("timeout", self._timeout))
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                async with session.request(
+                    condition["method"],
+                    condition["url"],
+                    headers=condition["headers"],
+                    timeout=aiohttp.ClientTimeout(total=remaining)
+                ) as response:
+                    if response.status == condition["expected_status"]:
+                        return True
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+            await asyncio.sleep(max(0.0, min(self._PROBE_INTERVAL, deadline - loop.time())))
+    
+    def _check_probe_support(self) -> None:
+        """Raise if any condition cannot be probed from the current process."""
+        unsupported = sorted({
+            c["type"] for c in self._wait_conditions if c["type"] not in self._PROBES
+        })
+        if unsupported:
+            raise ValueError(
+                f"Wait condition types cannot be checked in-process: {', '.join(unsupported)}"
+            )
+    
+    def _poll(
+        self,
+        check: Callable[[float], bool],
+        timeout: str,
+        deadline: Optional[float] = None,
+        stop: Optional[threading.Event] = None
+    ) -> bool:
+        """
+        Call a check until it succeeds or the timeout expires.
+        
+        Args:
+            check: Callable receiving the remaining seconds, returns success
+            timeout: Timeout duration (e.g., "30s")
+            deadline: Optional time.monotonic() value that also ends polling
+            stop: Optional event that ends polling once set
+            
+        Returns:
+            bool: True if the check succeeded before the deadline
+        """
+        poll_deadline = time.monotonic() + self._parse_duration(timeout)
+        if deadline is not None:
+            poll_deadline = min(poll_deadline, deadline)
+        while stop is None or not stop.is_set():
+            remaining = poll_deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if check(remaining):
+                return True
+            delay = max(0.0, min(self._PROBE_INTERVAL, poll_deadline - time.monotonic()))
+            if stop is None:
+                time.sleep(delay)
+            else:
+                stop.wait(delay)
+        return False
+    
+    def _probe_tcp(
+        self,
+        condition: Dict[str, Any],
+        deadline: Optional[float] = None,
+        stop: Optional[threading.Event] = None
+    ) -> bool:
+        """Poll a TCP endpoint until it accepts connections."""
+        def check(remaining: float) -> bool:
+            try:
+                with socket.create_connection((condition["host"], condition["port"]), timeout=remaining):
+                    return True
+            except OSError:
+                return False
+        
+        return self._poll(check, condition.get("timeout", self._timeout), deadline, stop)
+    
+    def _probe_http(
+        self,
+        condition: Dict[str, Any],
+        deadline: Optional[float] = None,
+        stop: Optional[threading.Event] = None
+    ) -> bool:
+        """Poll an HTTP endpoint until it returns the expected status."""
+        def check(remaining: float) -> bool:
+            request = urllib.request.Request(
+                condition["url"],
+                method=condition["method"],
+                headers=condition["headers"]
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=remaining) as response:
+                    status = response.status
+            except urllib.error.HTTPError as e:
+                status = e.code
+            except (OSError, ValueError):
+                return False
+            return status == condition["expected_status"]
+        
+        return self._poll(check, condition.get("timeout", self._timeout), deadline, stop)
+    
+    def _probe_command(
+        self,
+        condition: Dict[str, Any],
+        deadline: Optional[float] = None,
+        stop: Optional[threading.Event] = None
+    ) -> bool:
+        """Run a command until it exits with the expected code."""
+        def check(remaining: float) -> bool:
+            try:
+                result = subprocess.run(
+                    condition["command"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=remaining
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                return False
+            return result.returncode == condition["expected_exit_code"]
+        
+        return self._poll(check, condition.get("timeout", self._timeout), deadline, stop)
+    
+    def _parse_duration(self, duration: str) -> float:
+        """Parse duration string to seconds."""
+        duration = duration.strip().lower()
+        
+        if duration.endswith('s'):
+            return float(duration[:-1])
+        elif duration.endswith('m'):
+            return float(duration[:-1]) * 60
+        elif duration.endswith('h'):
+            return float(duration[:-1]) * 3600
+        else:
+            # Assume seconds if no unit
+            return float(duration)
+    
     # Preset configurations
     
     @classmethod
@@ -463,14 +803,17 @@ class WaitCondition(BaseBuilder):
         Generate Kubernetes resources for wait conditions.
         
         Returns:
-            List[Dict[str, Any]]: List of Kubernetes resources
+            List[Dict[str, Any]]: List of Kubernetes resources (empty when
+            no wait conditions have been registered)
         """
-        resources = []
+        # Nothing to wait for, so skip the no-op ConfigMap and Job
+        if not self._wait_conditions:
+            return []
         
         # Generate ConfigMap for wait configuration
         config_data = {
             "timeout": self._timeout,
-            "parallel_execution": str(self._parallel_execution).lower(),
+            "parallel_execution": _BOOL_STR[bool(self._parallel_execution)],
             "failure_policy": self._failure_policy,
             "success_threshold": str(self._success_threshold),
             "failure_threshold": str(self._failure_threshold),
@@ -479,35 +822,17 @@ class WaitCondition(BaseBuilder):
         
         # Add retry configuration
         if self._retry_config:
-            config_data["retry_enabled"] = "true"
+            config_data["retry_enabled"] = _BOOL_STR[True]
             config_data["retry_max_attempts"] = str(self._retry_config["max_attempts"])
             config_data["retry_delay"] = self._retry_config["delay"]
             config_data["retry_backoff_multiplier"] = str(self._retry_config["backoff_multiplier"])
         
         # Add individual wait conditions
-        for i, condition in enumerate(self._wait_conditions):
-            prefix = f"condition_{i}"
-            config_data[f"{prefix}_type"] = condition["type"]
-            config_data[f"{prefix}_timeout"] = condition.get("timeout", self._timeout)
-            
-            if condition["type"] == WaitType.RESOURCE_READY.value:
-                config_data[f"{prefix}_resource"] = condition["resource"]
-                config_data[f"{prefix}_name"] = condition["name"]
-                if condition.get("namespace"):
-                    config_data[f"{prefix}_namespace"] = condition["namespace"]
-            
-            elif condition["type"] == WaitType.HTTP_SUCCESS.value:
-                config_data[f"{prefix}_url"] = condition["url"]
-                config_data[f"{prefix}_method"] = condition["method"]
-                config_data[f"{prefix}_expected_status"] = str(condition["expected_status"])
-            
-            elif condition["type"] == WaitType.TCP_CONNECT.value:
-                config_data[f"{prefix}_host"] = condition["host"]
-                config_data[f"{prefix}_port"] = str(condition["port"])
-            
-            elif condition["type"] == WaitType.CUSTOM_COMMAND.value:
-                config_data[f"{prefix}_command"] = " ".join(condition["command"])
-                config_data[f"{prefix}_expected_exit_code"] = str(condition["expected_exit_code"])
+        config_data.update(
+            item
+            for i, condition in enumerate(self._wait_conditions)
+            for item in self._condition_config_items(f"condition_{i}", condition)
+        )
         
         config_map = {
             "apiVersion": "v1",
@@ -523,8 +848,6 @@ class WaitCondition(BaseBuilder):
         if self._namespace:
             config_map["metadata"]["namespace"] = self._namespace
         
-        resources.append(config_map)
-        
         # Generate Job for wait execution
         wait_job = {
             "apiVersion": "batch/v1",
@@ -557,9 +880,74 @@ class WaitCondition(BaseBuilder):
         if self._namespace:
             wait_job["metadata"]["namespace"] = self._namespace
         
-        resources.append(wait_job)
+        # Always exactly two resources, so build the list at its final size
+        return [config_map, wait_job]
+    
+    def _condition_config_items(
+        self,
+        prefix: str,
+        condition: Dict[str, Any]
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Yield ConfigMap data entries for a single wait condition.
+        
+        The per-condition timeout is omitted when it matches the global
+        ``timeout`` entry, which consumers fall back to.
         
-        return resources
+        Args:
+            prefix: Key prefix for the condition (e.g., "condition_0")
+            condition: Wait condition configuration
+            
+        Yields:
+            Tuple[str, str]: ConfigMap key and value
+        """
+        yield f"{prefix}_type", condition["type"]
+        timeout = condition.get("timeout", self._timeout)
+        if timeout != self._timeout:
+            yield f"{prefix}_timeout", timeout
+        
+        # Resolve the stored value to its enum singleton once, then compare by identity
+        wait_type = WaitType(condition["type"])
+        if wait_type is WaitType.RESOURCE_READY:
+            yield f"{prefix}_resource", condition["resource"]
+            yield f"{prefix}_name", condition["name"]
+            if condition.get("namespace"):
+                yield f"{prefix}_namespace", condition["namespace"]
+        
+        elif wait_type is WaitType.HTTP_SUCCESS:
+            yield f"{prefix}_url", condition["url"]
+            yield f"{prefix}_method", condition["method"]
+            yield f"{prefix}_expected_status", str(condition["expected_status"])
+        
+        elif wait_type is WaitType.TCP_CONNECT:
+            yield f"{prefix}_host", condition["host"]
+            yield f"{prefix}_port", str(condition["port"])
+        
+        elif wait_type is WaitType.CUSTOM_COMMAND:
+            yield f"{prefix}_command", " ".join(condition["command"])
+            yield f"{prefix}_expected_exit_code", str(condition["expected_exit_code"])
+        
+        elif wait_type is WaitType.LOG_PATTERN:
+            yield f"{prefix}_resource_name", condition["resource_name"]
+            yield f"{prefix}_pattern", condition["pattern"]
+            if condition.get("namespace"):
+                yield f"{prefix}_namespace", condition["namespace"]
+            if condition.get("container"):
+                yield f"{prefix}_container", condition["container"]
+        
+        elif wait_type is WaitType.METRIC_THRESHOLD:
+            yield f"{prefix}_metric_query", condition["metric_query"]
+            yield f"{prefix}_threshold", str(condition["threshold"])
+            yield f"{prefix}_comparison", condition["comparison"]
+            yield f"{prefix}_prometheus_url", condition["prometheus_url"]
+        
+        elif wait_type is WaitType.CONDITION_MET:
+            yield f"{prefix}_resource_type", condition["resource_type"]
+            yield f"{prefix}_resource_name", condition["resource_name"]
+            yield f"{prefix}_condition_type", condition["condition_type"]
+            yield f"{prefix}_status", condition["status"]
+            if condition.get("namespace"):
+                yield f"{prefix}_namespace", condition["namespace"]
     
     def _generate_wait_script(self) -> str:
         """
@@ -568,37 +956,25 @@ class WaitCondition(BaseBuilder):
         Returns:
             str: Shell script content
         """
-        script_lines = [
-            "#!/bin/sh",
-            "set -e",
-            "",
-            "echo 'Starting wait conditions...'",
-            ""
-        ]
+        body = "\n".join(
+            check for check in map(self._render_check, self._wait_conditions) if check
+        )
+        return self._SCRIPT_TEMPLATE.format(body=body)
+    
+    def _render_check(self, condition: Dict[str, Any]) -> str:
+        """
+        Render the script line that waits for a single condition.
         
-        for i, condition in enumerate(self._wait_conditions):
-            if condition["type"] == WaitType.TCP_CONNECT.value:
-                script_lines.extend([
-                    f"echo 'Waiting for TCP connection to {condition['host']}:{condition['port']}'",
-                    f"until nc -z {condition['host']} {condition['port']}; do",
-                    f"  echo 'Waiting for {condition['host']}:{condition['port']} to be ready'",
-                    f"  sleep 5",
-                    f"done",
-                    f"echo 'TCP connection to {condition['host']}:{condition['port']} is ready'",
-                    ""
-                ])
+        Args:
+            condition: Wait condition configuration
             
-            elif condition["type"] == WaitType.HTTP_SUCCESS.value:
-                script_lines.extend([
-                    f"echo 'Waiting for HTTP success from {condition['url']}'",
-                    f"until curl -s -f {condition['url']} > /dev/null; do",
-                    f"  echo 'Waiting for {condition['url']} to return success'",
-                    f"  sleep 10",
-                    f"done",
-                    f"echo 'HTTP endpoint {condition['url']} is ready'",
-                    ""
-                ])
-        
-        script_lines.append("echo 'All wait conditions completed successfully!'")
-        
-        return " && ".join([line for line in script_lines if line and not line.startswith("echo")]) 
\ No newline at end of file
+        Returns:
+            str: Call to one of the script's helper functions, or an empty
+            string for condition types the script does not check
+        """
+        wait_type = WaitType(condition["type"])
+        if wait_type is WaitType.TCP_CONNECT:
+            return f"wait_tcp {shlex.quote(condition['host'])} {condition['port']}"
+        if wait_type is WaitType.HTTP_SUCCESS:
+            return f"wait_http {shlex.quote(condition['url'])}"
+        return "" 
\ No newline at end of file
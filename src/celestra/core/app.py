@@ -5,9 +5,48 @@ This module contains the App class which represents stateless applications
 that don't require persistent storage.
 """
 
-from typing import Dict, List, Any, Optional, Union
-from .base_builder import BaseBuilder
-from ..utils.decorators import docker_compose_only, kubernetes_only, output_formats
+import sys
+from itertools import chain
+from typing import Dict, Hashable, List, Any, Optional, Union
+from .base_builder import BaseBuilder, child_resources, copy_resource
+from ..utils.decorators import (
+    docker_compose_only, kubernetes_only, output_formats, mutator, memoize_render
+)
+
+
+# Fixed top-level fields of each generated resource, copied on every render
+_DEPLOYMENT_SKELETON = {"apiVersion": "apps/v1", "kind": "Deployment"}
+_SERVICE_SKELETON = {"apiVersion": "v1", "kind": "Service"}
+_HPA_SKELETON = {"apiVersion": "autoscaling/v2", "kind": "HorizontalPodAutoscaler"}
+
+# Health probe attributes and the container fields they render to
+_PROBE_KEYS = (
+    ("liveness_probe", "livenessProbe"),
+    ("readiness_probe", "readinessProbe"),
+    ("startup_probe", "startupProbe"),
+)
+
+# Networking builders, imported on first use to avoid a circular import
+_Service = None
+_Ingress = None
+
+
+def _service_class():
+    """Get the Service builder class, importing it on first call."""
+    global _Service
+    if _Service is None:
+        from ..networking.service import Service
+        _Service = Service
+    return _Service
+
+
+def _ingress_class():
+    """Get the Ingress builder class, importing it on first call."""
+    global _Ingress
+    if _Ingress is None:
+        from ..networking.ingress import Ingress
+        _Ingress = Ingress
+    return _Ingress
 
 
 class App(BaseBuilder):
@@ -28,6 +67,33 @@ class App(BaseBuilder):
         ```
     """
     
+    __slots__ = (
+        "_image",
+        "_ports",
+        "_environment",
+        "_resources",
+        "_replicas",
+        "_companions",
+        "_secrets",
+        "_config_maps",
+        "_storage",
+        "_dependencies",
+        "_connections",
+        "_lifecycle",
+        "_health",
+        "_scaling",
+        "_ingress",
+        "_service",
+        "_jobs",
+        "_build_context",
+        "_dockerfile",
+        "_build_args",
+        "_extras",
+        "_env_cache",
+    )
+    
+    _TRACKS_MUTATIONS = True
+    
     def __init__(self, name: str):
         """
         Initialize the App builder.
@@ -37,28 +103,36 @@ class App(BaseBuilder):
         """
         super().__init__(name)
         self._image: Optional[str] = None
-        self._ports: List[Dict[str, Any]] = []
-        self._environment: Dict[str, str] = {}
-        self._resources: Dict[str, Any] = {}
         self._replicas: int = 1
-        self._companions: List[Any] = []
-        self._secrets: List[Any] = []
-        self._config_maps: List[Any] = []
-        self._storage: List[Any] = []
-        self._dependencies: List[str] = []
-        self._connections: List[str] = []
         self._lifecycle: Optional[Any] = None
         self._health: Optional[Any] = None
         self._scaling: Optional[Any] = None
-        self._ingress: List[Any] = []
         self._service: Optional[Any] = None
-        self._security_context: Optional[Dict[str, Any]] = None
-        self._service_account_name: Optional[str] = None
-        self._jobs: List[Any] = []
         self._build_context: Optional[str] = None
         self._dockerfile: Optional[str] = None
-        self._build_args: Dict[str, str] = {}
+        
+        # Collections are allocated by the first builder call that fills them
+        self._ports: Optional[List[Dict[str, Any]]] = None
+        self._environment: Optional[Dict[str, str]] = None
+        self._resources: Optional[Dict[str, Any]] = None
+        self._companions: Optional[List[Any]] = None
+        self._secrets: Optional[List[Any]] = None
+        self._config_maps: Optional[List[Any]] = None
+        self._storage: Optional[List[Any]] = None
+        self._dependencies: Optional[List[str]] = None
+        self._connections: Optional[List[str]] = None
+        self._ingress: Optional[List[Any]] = None
+        self._jobs: Optional[List[Any]] = None
+        self._build_args: Optional[Dict[str, str]] = None
+        
+        # Rarely used settings (security context, service account, node
+        # selector, tolerations) share one dict, allocated on first use
+        self._extras: Optional[Dict[str, Any]] = None
+        
+        # Rendered env var list, rebuilt after env()/environment() changes
+        self._env_cache: Optional[List[Dict[str, str]]] = None
     
+    @mutator
     def image(self, image: str) -> "App":
         """
         Set the container image.
@@ -73,9 +147,10 @@ class App(BaseBuilder):
         # Clear build context when using pre-built image
         self._build_context = None
         self._dockerfile = None
-        self._build_args = {}
+        self._build_args = None
         return self
 
+    @mutator
     def build(self, context: str, dockerfile: str = "Dockerfile", **build_args) -> "App":
         """
         Build container from local Dockerfile.
@@ -129,6 +204,7 @@ class App(BaseBuilder):
         return self.build(context, dockerfile, **build_args)
 
     @kubernetes_only  
+    @mutator
     def node_selector(self, selectors: Dict[str, str]) -> "App":
         """
         Set node selector for pod scheduling (Kubernetes only).
@@ -144,12 +220,13 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
-        if not hasattr(self, '_node_selector'):
-            self._node_selector = {}
-        self._node_selector.update(selectors)
+        if self._extras is None:
+            self._extras = {}
+        self._extras.setdefault("node_selector", {}).update(selectors)
         return self
 
     @kubernetes_only
+    @mutator
     def tolerations(self, tolerations: List[Dict[str, Any]]) -> "App":
         """
         Set pod tolerations for tainted nodes (Kubernetes only).
@@ -167,11 +244,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
-        if not hasattr(self, '_tolerations'):
-            self._tolerations = []
-        self._tolerations.extend(tolerations)
+        if self._extras is None:
+            self._extras = {}
+        self._extras.setdefault("tolerations", []).extend(tolerations)
         return self
     
+    @mutator
     def port(self, port: int, name: str = "http", protocol: str = "TCP") -> "App":
         """
         Add a port to the application.
@@ -184,14 +262,18 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._ports is None:
+            self._ports = []
+        # Port names and protocols repeat across apps, so share one copy
         self._ports.append({
             "containerPort": port,
-            "name": name,
-            "protocol": protocol
+            "name": sys.intern(name),
+            "protocol": sys.intern(protocol)
         })
         return self
 
     @docker_compose_only
+    @mutator
     def port_mapping(self, host_port: int, container_port: int, name: str = "http", protocol: str = "TCP") -> "App":
         """
         Add a port mapping (host:container) to the application.
@@ -214,15 +296,18 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._ports is None:
+            self._ports = []
         self._ports.append({
             "containerPort": container_port,
             "hostPort": host_port,
-            "name": name,
-            "protocol": protocol
+            "name": sys.intern(name),
+            "protocol": sys.intern(protocol)
         })
         return self
 
     @docker_compose_only
+    @mutator
     def expose_port(self, port: int, name: str = "http", protocol: str = "TCP", external_port: Optional[int] = None) -> "App":
         """
         Add a port and optionally expose it externally.
@@ -244,13 +329,15 @@ class App(BaseBuilder):
         """
         port_config = {
             "containerPort": port,
-            "name": name,
-            "protocol": protocol
+            "name": sys.intern(name),
+            "protocol": sys.intern(protocol)
         }
         
         if external_port is not None:
             port_config["hostPort"] = external_port
             
+        if self._ports is None:
+            self._ports = []
         self._ports.append(port_config)
         return self
     
@@ -268,6 +355,7 @@ class App(BaseBuilder):
         """
         return self.port(port, name, protocol)
     
+    @mutator
     def ports(self, ports: List[Dict[str, Any]]) -> "App":
         """
         Set multiple ports for the application.
@@ -287,105 +375,18 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
-        for port_config in ports:
-            self._ports.append({
+        if self._ports is None:
+            self._ports = []
+        self._ports.extend(
+            {
                 "containerPort": port_config.get("port"),
-                "name": port_config.get("name", "http"),
-                "protocol": port_config.get("protocol", "TCP")
-            })
+                "name": sys.intern(port_config.get("name", "http")),
+                "protocol": sys.intern(port_config.get("protocol", "TCP"))
+            }
+            for port_config in ports
+        )
         return self
     
-    def http_port(self, port: int = 8080, name: str = "http") -> "App":
-        """
-        Add HTTP port (convenience method).
-        
-        Args:
-            port: HTTP port number (default: 8080)
-            name: Port name (default: "http")
-            
-        Returns:
-            App: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def https_port(self, port: int = 8443, name: str = "https") -> "App":
-        """
-        Add HTTPS port (convenience method).
-        
-        Args:
-            port: HTTPS port number (default: 8443)
-            name: Port name (default: "https")
-            
-        Returns:
-            App: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def metrics_port(self, port: int = 9090, name: str = "metrics") -> "App":
-        """
-        Add metrics port (convenience method).
-        
-        Args:
-            port: Metrics port number (default: 9090)
-            name: Port name (default: "metrics")
-            
-        Returns:
-            App: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def health_port(self, port: int = 8081, name: str = "health") -> "App":
-        """
-        Add health check port (convenience method).
-        
-        Args:
-            port: Health check port number (default: 8081)
-            name: Port name (default: "health")
-            
-        Returns:
-            App: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def admin_port(self, port: int = 9000, name: str = "admin") -> "App":
-        """
-        Add admin/management port (convenience method).
-        
-        Args:
-            port: Admin port number (default: 9000)
-            name: Port name (default: "admin")
-            
-        Returns:
-            App: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def grpc_port(self, port: int = 9090, name: str = "grpc") -> "App":
-        """
-        Add gRPC port (convenience method).
-        
-        Args:
-            port: gRPC port number (default: 9090)
-            name: Port name (default: "grpc")
-            
-        Returns:
-            App: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def debug_port(self, port: int = 5005, name: str = "debug") -> "App":
-        """
-        Add debug port (convenience method).
-        
-        Args:
-            port: Debug port number (default: 5005)
-            name: Port name (default: "debug")
-            
-        Returns:
-            App: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
     def common_ports(self, http: int = 8080, metrics: int = 9090, health: int = 8081) -> "App":
         """
         Add common application ports (convenience method).
@@ -407,15 +408,25 @@ class App(BaseBuilder):
         """
         Set environment variables.
         
+        Variables that are already set to the same values are left alone,
+        so redundant calls keep the rendered output cached.
+        
         Args:
             env_vars: Dictionary of environment variables
             
         Returns:
             App: Self for method chaining
         """
+        if env_vars.items() <= (self._environment or {}).items():
+            return self
+        if self._environment is None:
+            self._environment = {}
         self._environment.update(env_vars)
+        self._env_cache = None
+        self._version += 1
         return self
     
+    @mutator
     def env(self, key: str, value: str) -> "App":
         """
         Add a single environment variable.
@@ -427,9 +438,13 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._environment is None:
+            self._environment = {}
         self._environment[key] = value
+        self._env_cache = None
         return self
     
+    @mutator
     def resources(
         self, 
         cpu: Optional[str] = None,
@@ -451,26 +466,23 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
-        if cpu or memory:
-            self._resources.setdefault("requests", {})
-            if cpu:
-                self._resources["requests"]["cpu"] = cpu
-            if memory:
-                self._resources["requests"]["memory"] = memory
-        
-        if cpu_limit or memory_limit:
-            self._resources.setdefault("limits", {})
-            if cpu_limit:
-                self._resources["limits"]["cpu"] = cpu_limit
-            if memory_limit:
-                self._resources["limits"]["memory"] = memory_limit
-        
+        requests = {key: value for key, value in (("cpu", cpu), ("memory", memory)) if value}
+        limits = {key: value for key, value in (("cpu", cpu_limit), ("memory", memory_limit)) if value}
         if gpu:
-            self._resources.setdefault("limits", {})
-            self._resources["limits"]["nvidia.com/gpu"] = str(gpu)
+            limits["nvidia.com/gpu"] = str(gpu)
+        
+        if requests or limits:
+            if self._resources is None:
+                self._resources = {}
+            # Merge into any previously configured values, one assignment each
+            if requests:
+                self._resources["requests"] = {**self._resources.get("requests", {}), **requests}
+            if limits:
+                self._resources["limits"] = {**self._resources.get("limits", {}), **limits}
         
         return self
     
+    @mutator
     def replicas(self, count: int) -> "App":
         """
         Set the number of replicas.
@@ -484,6 +496,7 @@ class App(BaseBuilder):
         self._replicas = count
         return self
     
+    @mutator
     def service_account(self, service_account_name: str) -> "App":
         """
         Set the service account name for the application.
@@ -494,9 +507,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
-        self._service_account_name = service_account_name
+        if self._extras is None:
+            self._extras = {}
+        self._extras["service_account_name"] = service_account_name
         return self
     
+    @mutator
     def scale(self, scaling_config: "Scaling") -> "App":
         """
         Set scaling configuration.
@@ -512,6 +528,7 @@ class App(BaseBuilder):
             self._replicas = scaling_config.replicas
         return self
     
+    @mutator
     def add_companion(self, companion: "Companion") -> "App":
         """
         Add a companion container (sidecar or init container).
@@ -522,9 +539,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._companions is None:
+            self._companions = []
         self._companions.append(companion)
         return self
     
+    @mutator
     def add_companions(self, companions: List["Companion"]) -> "App":
         """
         Add multiple companion containers.
@@ -535,9 +555,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._companions is None:
+            self._companions = []
         self._companions.extend(companions)
         return self
     
+    @mutator
     def add_secret(self, secret: "Secret") -> "App":
         """
         Add a secret to the application.
@@ -548,9 +571,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._secrets is None:
+            self._secrets = []
         self._secrets.append(secret)
         return self
     
+    @mutator
     def add_secrets(self, secrets: List["Secret"]) -> "App":
         """
         Add multiple secrets to the application.
@@ -561,9 +587,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._secrets is None:
+            self._secrets = []
         self._secrets.extend(secrets)
         return self
     
+    @mutator
     def add_config(self, config_map: "ConfigMap") -> "App":
         """
         Add a ConfigMap to the application.
@@ -574,9 +603,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._config_maps is None:
+            self._config_maps = []
         self._config_maps.append(config_map)
         return self
     
+    @mutator
     def add_configs(self, config_maps: List["ConfigMap"]) -> "App":
         """
         Add multiple ConfigMaps to the application.
@@ -587,9 +619,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._config_maps is None:
+            self._config_maps = []
         self._config_maps.extend(config_maps)
         return self
     
+    @mutator
     def add_storage(self, storage: "Storage") -> "App":
         """
         Add storage to the application.
@@ -600,9 +635,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._storage is None:
+            self._storage = []
         self._storage.append(storage)
         return self
     
+    @mutator
     def connect_to(self, services: List[str]) -> "App":
         """
         Connect to other services.
@@ -613,9 +651,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._connections is None:
+            self._connections = []
         self._connections.extend(services)
         return self
     
+    @mutator
     def depends_on(self, dependencies: List[str]) -> "App":
         """
         Set service dependencies.
@@ -626,9 +667,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._dependencies is None:
+            self._dependencies = []
         self._dependencies.extend(dependencies)
         return self
     
+    @mutator
     def lifecycle(self, lifecycle_config: "Lifecycle") -> "App":
         """
         Set lifecycle configuration.
@@ -642,6 +686,7 @@ class App(BaseBuilder):
         self._lifecycle = lifecycle_config
         return self
     
+    @mutator
     def health(self, health_config: "Health") -> "App":
         """
         Set health check configuration.
@@ -655,6 +700,7 @@ class App(BaseBuilder):
         self._health = health_config
         return self
     
+    @mutator
     def expose(
         self, 
         external_access: bool = False,
@@ -672,17 +718,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
-        from ..networking.service import Service
-        from ..networking.ingress import Ingress
-        
         # Create service
-        service = Service(f"{self._name}-service")
-        for port in self._ports:
-            service.add_port(
-                name=port["name"],
-                port=port["containerPort"], 
-                target_port=port["containerPort"]
-            )
+        ports = self._ports or ()
+        service = _service_class()(f"{self._name}-service")
+        service.add_ports([
+            {"name": port["name"], "port": port["containerPort"]} for port in ports
+        ])
         
         if external_access:
             service.type("LoadBalancer")
@@ -693,14 +734,19 @@ class App(BaseBuilder):
         
         # Create ingress if domain specified
         if domain:
-            ingress = Ingress(f"{self._name}-ingress")
+            ingress = _ingress_class()(f"{self._name}-ingress")
             ingress.host(domain)
-            for port in self._ports:
-                ingress.path("/", self._name, port["containerPort"])
+            ingress.paths([
+                {"path": "/", "service_name": self._name, "service_port": port["containerPort"]}
+                for port in ports
+            ])
+            if self._ingress is None:
+                self._ingress = []
             self._ingress.append(ingress)
         
         return self
     
+    @mutator
     def add_ingress(self, ingress: "Ingress") -> "App":
         """
         Add an ingress configuration.
@@ -711,9 +757,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._ingress is None:
+            self._ingress = []
         self._ingress.append(ingress)
         return self
     
+    @mutator
     def security_context(self, context: Dict[str, Any]) -> "App":
         """
         Set security context.
@@ -724,9 +773,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
-        self._security_context = context
+        if self._extras is None:
+            self._extras = {}
+        self._extras["security_context"] = context
         return self
     
+    @mutator
     def add_job(self, job: "Job") -> "App":
         """
         Add a related job.
@@ -737,9 +789,12 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._jobs is None:
+            self._jobs = []
         self._jobs.append(job)
         return self
     
+    @mutator
     def add_jobs(self, jobs: List["Job"]) -> "App":
         """
         Add multiple related jobs.
@@ -750,6 +805,8 @@ class App(BaseBuilder):
         Returns:
             App: Self for method chaining
         """
+        if self._jobs is None:
+            self._jobs = []
         self._jobs.extend(jobs)
         return self
     
@@ -767,43 +824,102 @@ class App(BaseBuilder):
         cloned.add_label("environment", environment)
         return cloned
     
-    def generate_kubernetes_resources(self) -> List[Dict[str, Any]]:
+    def render_for(self, environment: str) -> List[Dict[str, Any]]:
         """
-        Generate Kubernetes resources for the application.
+        Generate Kubernetes resources labelled for an environment.
         
+        Unlike for_environment(), this does not clone the app: resources
+        are rendered once and each gets a copy of its metadata with the
+        environment label added.
+        
+        Args:
+            environment: Environment name (dev, staging, prod)
+            
         Returns:
             List[Dict[str, Any]]: List of Kubernetes resource dictionaries
         """
         resources = []
+        for resource in self.generate_kubernetes_resources():
+            metadata = dict(resource.get("metadata") or {})
+            metadata["labels"] = {**(metadata.get("labels") or {}), "environment": environment}
+            resources.append({**resource, "metadata": metadata})
+        return resources
+    
+    def _extra(self, key: str) -> Any:
+        """
+        Get a rarely used setting without allocating the extras dict.
         
-        # Generate Deployment
-        deployment = self._generate_deployment()
-        resources.append(deployment)
+        Args:
+            key: Setting name (e.g., "security_context")
+            
+        Returns:
+            Any: Setting value, or None if it was never set
+        """
+        return self._extras.get(key) if self._extras else None
+    
+    def _render_version(self) -> Optional[Hashable]:
+        """
+        Get the render cache key for the app and the builders its renders embed.
         
-        # Generate Service
-        if self._service or self._ports:
-            service = self._generate_service()
-            resources.append(service)
+        Returns:
+            Optional[Hashable]: Versions of the app and its companions, health
+                check, lifecycle, scaling and service, or None if any of them
+                does not track its mutations
+        """
+        embedded = [
+            child for child in (self._health, self._lifecycle, self._scaling, self._service)
+            if child is not None
+        ]
+        if self._companions:
+            embedded.extend(self._companions)
+        return self._render_version_with(embedded)
+    
+    def _base_metadata(self, name_suffix: str = "") -> Dict[str, Any]:
+        """
+        Build the metadata shared by the app's generated resources.
         
-        # Generate Ingress
-        for ingress in self._ingress:
-            if hasattr(ingress, 'generate_kubernetes_resources'):
-                resources.extend(ingress.generate_kubernetes_resources())
+        Labels and annotations are shallow-copied so that callers editing
+        one generated resource do not change the app or its other resources.
         
-        # Generate ConfigMaps
-        for config_map in self._config_maps:
-            if hasattr(config_map, 'generate_kubernetes_resources'):
-                resources.extend(config_map.generate_kubernetes_resources())
+        Args:
+            name_suffix: Suffix appended to the app name (e.g., "-hpa")
+            
+        Returns:
+            Dict[str, Any]: Resource metadata
+        """
+        metadata = {
+            "name": self._name + name_suffix,
+            "labels": self._labels.copy(),
+            "annotations": self._annotations.copy()
+        }
+        if self._namespace:
+            metadata["namespace"] = self._namespace
+        return metadata
+    
+    def generate_kubernetes_resources(self) -> List[Dict[str, Any]]:
+        """
+        Generate Kubernetes resources for the application.
         
-        # Generate Secrets
-        for secret in self._secrets:
-            if hasattr(secret, 'generate_kubernetes_resources'):
-                resources.extend(secret.generate_kubernetes_resources())
+        The memoized renders are copied, so the result can be modified.
         
-        # Generate Jobs
-        for job in self._jobs:
-            if hasattr(job, 'generate_kubernetes_resources'):
-                resources.extend(job.generate_kubernetes_resources())
+        Returns:
+            List[Dict[str, Any]]: List of Kubernetes resource dictionaries
+        """
+        return [copy_resource(resource) for resource in self._shared_resources()]
+    
+    def _shared_resources(self) -> List[Dict[str, Any]]:
+        """Get the application's resources, sharing the memoized renders."""
+        resources = [self._generate_deployment()]
+        
+        # Generate Service
+        if self._service or self._ports:
+            resources.append(self._generate_service())
+        
+        # Generate Ingresses, ConfigMaps, Secrets and Jobs in one pass
+        children = chain(
+            self._ingress or (), self._config_maps or (), self._secrets or (), self._jobs or ()
+        )
+        resources.extend(chain.from_iterable(map(child_resources, children)))
         
         # Generate HPA if scaling is configured
         if self._scaling and hasattr(self._scaling, 'auto_scale_enabled'):
@@ -813,144 +929,126 @@ class App(BaseBuilder):
         
         return resources
     
+    @memoize_render
     def _generate_deployment(self) -> Dict[str, Any]:
         """Generate Kubernetes Deployment resource."""
+        # Optional container fields, spread into the container in one step
+        fragments = {}
+        if self._environment:
+            if self._env_cache is None:
+                self._env_cache = [
+                    {"name": k, "value": v} for k, v in self._environment.items()
+                ]
+            # Shared between renders; callers must copy before mutating
+            fragments["env"] = self._env_cache
+        if self._resources:
+            fragments["resources"] = self._resources
+        
+        health = self._health
+        if health is not None:
+            for attr, key in _PROBE_KEYS:
+                probe = getattr(health, attr, None)
+                if probe is not None:
+                    fragments[key] = probe
+        
+        lifecycle = self._lifecycle
+        if lifecycle is not None and hasattr(lifecycle, 'to_dict'):
+            fragments["lifecycle"] = lifecycle.to_dict()
+        
+        security_context = self._extra("security_context")
+        if security_context:
+            fragments["securityContext"] = security_context
+        
         container = {
             "name": self._name,
             "image": self._image or "nginx:latest",
-            "ports": self._ports if self._ports else [{"containerPort": 80, "name": "http"}]
+            "ports": self._ports or [{"containerPort": 80, "name": "http"}],
+            **fragments
         }
         
-        # Add environment variables
-        if self._environment:
-            container["env"] = [
-                {"name": k, "value": v} for k, v in self._environment.items()
-            ]
-        
-        # Add resources
-        if self._resources:
-            container["resources"] = self._resources
-        
-        # Add health checks
-        if self._health:
-            if hasattr(self._health, 'liveness_probe'):
-                container["livenessProbe"] = self._health.liveness_probe
-            if hasattr(self._health, 'readiness_probe'):
-                container["readiness_probe"] = self._health.readiness_probe
-            if hasattr(self._health, 'startup_probe'):
-                container["startupProbe"] = self._health.startup_probe
-        
-        # Add lifecycle
-        if self._lifecycle:
-            if hasattr(self._lifecycle, 'to_dict'):
-                container["lifecycle"] = self._lifecycle.to_dict()
-        
-        # Add security context
-        if self._security_context:
-            container["securityContext"] = self._security_context
-        
-        deployment = {
-            "apiVersion": "apps/v1",
-            "kind": "Deployment",
-            "metadata": {
-                "name": self._name,
-                "labels": self._labels,
-                "annotations": self._annotations
+        deployment = _DEPLOYMENT_SKELETON.copy()
+        deployment["metadata"] = self._base_metadata()
+        deployment["spec"] = {
+            "replicas": self._replicas,
+            "selector": {
+                "matchLabels": {"app": self._name}
             },
-            "spec": {
-                "replicas": self._replicas,
-                "selector": {
-                    "matchLabels": {"app": self._name}
+            "template": {
+                "metadata": {
+                    "labels": self._labels
                 },
-                "template": {
-                    "metadata": {
-                        "labels": self._labels
-                    },
-                    "spec": {
-                        "containers": [container]
-                    }
+                "spec": {
+                    "containers": [container]
                 }
             }
         }
         
-        if self._namespace:
-            deployment["metadata"]["namespace"] = self._namespace
+        # Split companions into init and sidecar containers in one pass
+        init_containers = []
+        sidecar_containers = []
+        for companion in self._companions or ():
+            companion_type = getattr(companion, 'type', None)
+            if companion_type == 'init':
+                init_containers.append(companion.to_dict())
+            elif companion_type == 'sidecar':
+                sidecar_containers.append(companion.to_dict())
         
         # Add init containers
-        init_containers = [c for c in self._companions if hasattr(c, 'type') and c.type == 'init']
         if init_containers:
-            deployment["spec"]["template"]["spec"]["initContainers"] = [
-                c.to_dict() for c in init_containers
-            ]
+            deployment["spec"]["template"]["spec"]["initContainers"] = init_containers
         
         # Add sidecar containers
-        sidecar_containers = [c for c in self._companions if hasattr(c, 'type') and c.type == 'sidecar']
         if sidecar_containers:
-            deployment["spec"]["template"]["spec"]["containers"].extend([
-                c.to_dict() for c in sidecar_containers
-            ])
+            deployment["spec"]["template"]["spec"]["containers"].extend(sidecar_containers)
         
         # Add service account
-        if self._service_account_name:
-            deployment["spec"]["template"]["spec"]["serviceAccountName"] = self._service_account_name
+        service_account_name = self._extra("service_account_name")
+        if service_account_name:
+            deployment["spec"]["template"]["spec"]["serviceAccountName"] = service_account_name
         
         return deployment
     
+    @memoize_render
     def _generate_service(self) -> Dict[str, Any]:
         """Generate Kubernetes Service resource."""
         if self._service:
             return self._service.generate_kubernetes_resources()[0]
         
         # Generate default service
-        ports = []
-        for port in self._ports:
-            ports.append({
+        ports = [
+            {
                 "name": port["name"],
                 "port": port["containerPort"],
                 "targetPort": port["containerPort"],
                 "protocol": port.get("protocol", "TCP")
-            })
-        
-        service = {
-            "apiVersion": "v1",
-            "kind": "Service",
-            "metadata": {
-                "name": self._name,
-                "labels": self._labels,
-                "annotations": self._annotations
-            },
-            "spec": {
-                "selector": {"app": self._name},
-                "ports": ports,
-                "type": "ClusterIP"
             }
+            for port in self._ports or ()
+        ]
+        
+        service = _SERVICE_SKELETON.copy()
+        service["metadata"] = self._base_metadata()
+        service["spec"] = {
+            "selector": {"app": self._name},
+            "ports": ports,
+            "type": "ClusterIP"
         }
         
-        if self._namespace:
-            service["metadata"]["namespace"] = self._namespace
-        
         return service
     
+    @memoize_render
     def _generate_hpa(self) -> Dict[str, Any]:
         """Generate Kubernetes HorizontalPodAutoscaler resource."""
-        hpa = {
-            "apiVersion": "autoscaling/v2",
-            "kind": "HorizontalPodAutoscaler",
-            "metadata": {
-                "name": f"{self._name}-hpa",
-                "labels": self._labels,
-                "annotations": self._annotations
+        hpa = _HPA_SKELETON.copy()
+        hpa["metadata"] = self._base_metadata("-hpa")
+        hpa["spec"] = {
+            "scaleTargetRef": {
+                "apiVersion": "apps/v1",
+                "kind": "Deployment",
+                "name": self._name
             },
-            "spec": {
-                "scaleTargetRef": {
-                    "apiVersion": "apps/v1",
-                    "kind": "Deployment",
-                    "name": self._name
-                },
-                "minReplicas": getattr(self._scaling, 'min_replicas', 1),
-                "maxReplicas": getattr(self._scaling, 'max_replicas', 10),
-                "metrics": []
-            }
+            "minReplicas": getattr(self._scaling, 'min_replicas', 1),
+            "maxReplicas": getattr(self._scaling, 'max_replicas', 10),
+            "metrics": []
         }
         
         if hasattr(self._scaling, 'cpu_target'):
@@ -965,7 +1063,41 @@ class App(BaseBuilder):
                 }
             })
         
-        if self._namespace:
-            hpa["metadata"]["namespace"] = self._namespace
+        return hpa 
+
+
+# Convenience port methods: method name -> (default port, default name, label)
+_PORT_PRESETS = {
+    "http_port": (8080, "http", "HTTP"),
+    "https_port": (8443, "https", "HTTPS"),
+    "metrics_port": (9090, "metrics", "metrics"),
+    "health_port": (8081, "health", "health check"),
+    "admin_port": (9000, "admin", "admin/management"),
+    "grpc_port": (9090, "grpc", "gRPC"),
+    "debug_port": (5005, "debug", "debug"),
+}
+
+
+def _make_port_preset(method_name: str, default_port: int, default_name: str, label: str):
+    """Build a convenience method that adds a TCP port with preset defaults."""
+    def preset(self, port: int = default_port, name: str = default_name) -> "App":
+        return self.port(port, name, "TCP")
+
+    preset.__name__ = method_name
+    preset.__qualname__ = f"App.{method_name}"
+    preset.__doc__ = f"""
+        Add {label} port (convenience method).
         
-        return hpa 
\ No newline at end of file
+        Args:
+            port: {label} port number (default: {default_port})
+            name: Port name (default: "{default_name}")
+            
+        Returns:
+            App: Self for method chaining
+        """
+    return preset
+
+
+for _method_name, _preset in _PORT_PRESETS.items():
+    setattr(App, _method_name, _make_port_preset(_method_name, *_preset))
+del _method_name, _preset
@@ -5,9 +5,54 @@ This module contains the AppGroup class which manages multiple related services
 and provides cross-service configuration capabilities.
 """
 
-from typing import Dict, List, Any, Optional, Union
-from .base_builder import BaseBuilder
-from ..utils.decorators import docker_compose_only, kubernetes_only
+import json
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, Iterator, List, Any, Hashable, Optional, Union
+from .base_builder import BaseBuilder, child_resources, copy_resource
+from ..utils.decorators import docker_compose_only, kubernetes_only, memoize_render, memoize_validation, mutator
+
+
+# Fixed top-level fields of each generated resource, copied on every render
+_NAMESPACE_SKELETON = {"apiVersion": "v1", "kind": "Namespace"}
+_RESOURCE_QUOTA_SKELETON = {"apiVersion": "v1", "kind": "ResourceQuota"}
+_SERVICE_MONITOR_SKELETON = {"apiVersion": "monitoring.coreos.com/v1", "kind": "ServiceMonitor"}
+_CONFIG_MAP_SKELETON = {"apiVersion": "v1", "kind": "ConfigMap"}
+
+# Label tying member resources to their group
+_PART_OF_LABEL = sys.intern("app.kubernetes.io/part-of")
+
+def _render_in_threads(members: List[Any]) -> List[List[Dict[str, Any]]]:
+    """Render members concurrently, returning their resource lists in member order."""
+    if len(members) < 2:
+        return [child_resources(member) for member in members]
+    with ThreadPoolExecutor(max_workers=min(32, len(members))) as executor:
+        return list(executor.map(child_resources, members))
+
+
+# Policy builders, imported on first use to avoid a circular import
+_NetworkPolicy = None
+_SecurityPolicy = None
+
+
+def _network_policy_class():
+    """Get the NetworkPolicy builder class, importing it on first call."""
+    global _NetworkPolicy
+    if _NetworkPolicy is None:
+        from ..networking.network_policy import NetworkPolicy
+        _NetworkPolicy = NetworkPolicy
+    return _NetworkPolicy
+
+
+def _security_policy_class():
+    """Get the SecurityPolicy builder class, importing it on first call."""
+    global _SecurityPolicy
+    if _SecurityPolicy is None:
+        from ..security.security_policy import SecurityPolicy
+        _SecurityPolicy = SecurityPolicy
+    return _SecurityPolicy
 
 
 class AppGroup(BaseBuilder):
@@ -31,6 +76,25 @@ class AppGroup(BaseBuilder):
         ```
     """
     
+    __slots__ = (
+        "_services",
+        "_service_index",
+        "_shared_secrets",
+        "_shared_configs",
+        "_network_policies",
+        "_service_mesh_config",
+        "_monitoring_config",
+        "_security_policies",
+        "_dependencies",
+        "_dependencies_applied_at",
+        "_environment_configs",
+        "_resource_quotas",
+        "_namespace_config",
+        "_parallel_render",
+    )
+    
+    _TRACKS_MUTATIONS = True
+    
     def __init__(self, name: str):
         """
         Initialize the AppGroup builder.
@@ -40,6 +104,8 @@ class AppGroup(BaseBuilder):
         """
         super().__init__(name)
         self._services: List[BaseBuilder] = []
+        # Name -> first service added under that name, kept in step with _services
+        self._service_index: Dict[str, BaseBuilder] = {}
         self._shared_secrets: List[Any] = []
         self._shared_configs: List[Any] = []
         self._network_policies: List[Any] = []
@@ -47,10 +113,14 @@ class AppGroup(BaseBuilder):
         self._monitoring_config: Optional[Dict[str, Any]] = None
         self._security_policies: List[Any] = []
         self._dependencies: Dict[str, List[str]] = {}
+        # Group version when dependencies were last pushed to the services
+        self._dependencies_applied_at: int = -1
         self._environment_configs: Dict[str, Dict[str, Any]] = {}
         self._resource_quotas: Optional[Dict[str, Any]] = None
         self._namespace_config: Optional[Dict[str, Any]] = None
+        self._parallel_render: bool = False
     
+    @mutator
     def add_service(self, service: BaseBuilder) -> "AppGroup":
         """
         Add a service to the group.
@@ -62,8 +132,10 @@ class AppGroup(BaseBuilder):
             AppGroup: Self for method chaining
         """
         self._services.append(service)
+        self._service_index.setdefault(service.name, service)
         return self
     
+    @mutator
     def add_services(self, services: List[BaseBuilder]) -> "AppGroup":
         """
         Add multiple services to the group.
@@ -75,8 +147,11 @@ class AppGroup(BaseBuilder):
             AppGroup: Self for method chaining
         """
         self._services.extend(services)
+        for service in services:
+            self._service_index.setdefault(service.name, service)
         return self
     
+    @mutator
     def remove_service(self, service_name: str) -> "AppGroup":
         """
         Remove a service from the group by name.
@@ -87,7 +162,15 @@ class AppGroup(BaseBuilder):
         Returns:
             AppGroup: Self for method chaining
         """
-        self._services = [s for s in self._services if s.name != service_name]
+        service = self._service_index.pop(service_name, None)
+        if service is None:
+            return self
+        
+        if len(self._service_index) + 1 == len(self._services):
+            # Names are unique, so only the indexed service needs to go
+            self._services.remove(service)
+        else:
+            self._services[:] = [s for s in self._services if s.name != service_name]
         return self
     
     def get_service(self, service_name: str) -> Optional[BaseBuilder]:
@@ -100,11 +183,9 @@ class AppGroup(BaseBuilder):
         Returns:
             Optional[BaseBuilder]: Service if found, None otherwise
         """
-        for service in self._services:
-            if service.name == service_name:
-                return service
-        return None
+        return self._service_index.get(service_name)
     
+    @mutator
     def add_shared_secret(self, secret: "Secret") -> "AppGroup":
         """
         Add a shared secret accessible by all services.
@@ -118,6 +199,7 @@ class AppGroup(BaseBuilder):
         self._shared_secrets.append(secret)
         return self
     
+    @mutator
     def add_shared_config(self, config_map: "ConfigMap") -> "AppGroup":
         """
         Add a shared ConfigMap accessible by all services.
@@ -131,12 +213,14 @@ class AppGroup(BaseBuilder):
         self._shared_configs.append(config_map)
         return self
     
+    @mutator
     def configure_networking(
         self,
         allow_internal_communication: bool = True,
         deny_external_access_except: Optional[List[str]] = None,
         service_mesh: bool = False,
-        mesh_config: Optional[Dict[str, Any]] = None
+        mesh_config: Optional[Dict[str, Any]] = None,
+        fuse_policies: bool = False
     ) -> "AppGroup":
         """
         Configure networking policies for the group.
@@ -146,30 +230,41 @@ class AppGroup(BaseBuilder):
             deny_external_access_except: List of services that can accept external traffic
             service_mesh: Enable service mesh integration
             mesh_config: Service mesh configuration
+            fuse_policies: When both policies are requested, emit a single policy
+                limiting the group's other services to in-namespace traffic
             
         Returns:
             AppGroup: Self for method chaining
         """
-        from ..networking.network_policy import NetworkPolicy
+        NetworkPolicy = _network_policy_class()
         
-        if allow_internal_communication:
-            # Create network policy allowing internal communication
-            internal_policy = (NetworkPolicy(f"{self._name}-internal")
+        if fuse_policies and allow_internal_communication and deny_external_access_except:
+            # Services open to external traffic are left out of the selector
+            fused_policy = (NetworkPolicy(f"{self._name}-netpol")
                 .allow_internal_communication()
-                .apply_to_services([s.name for s in self._services]))
-            self._network_policies.append(internal_policy)
-        
-        if deny_external_access_except:
-            # Create network policy denying external access except for specified services
-            external_policy = (NetworkPolicy(f"{self._name}-external")
-                .deny_external_access_except(deny_external_access_except))
-            self._network_policies.append(external_policy)
+                .apply_to_services([s.name for s in self._services])
+                .exclude_services(deny_external_access_except))
+            self._network_policies.append(fused_policy)
+        else:
+            if allow_internal_communication:
+                # Create network policy allowing internal communication
+                internal_policy = (NetworkPolicy(f"{self._name}-internal")
+                    .allow_internal_communication()
+                    .apply_to_services([s.name for s in self._services]))
+                self._network_policies.append(internal_policy)
+            
+            if deny_external_access_except:
+                # Create network policy denying external access except for specified services
+                external_policy = (NetworkPolicy(f"{self._name}-external")
+                    .deny_external_access_except(deny_external_access_except))
+                self._network_policies.append(external_policy)
         
         if service_mesh:
             self._service_mesh_config = mesh_config or {}
         
         return self
     
+    @mutator
     def configure_monitoring(
         self,
         prometheus_enabled: bool = True,
@@ -197,6 +292,7 @@ class AppGroup(BaseBuilder):
         }
         return self
     
+    @mutator
     def configure_security(
         self,
         rbac_enabled: bool = True,
@@ -216,7 +312,7 @@ class AppGroup(BaseBuilder):
         Returns:
             AppGroup: Self for method chaining
         """
-        from ..security.security_policy import SecurityPolicy
+        SecurityPolicy = _security_policy_class()
         
         security_policy = SecurityPolicy(f"{self._name}-security")
         
@@ -235,6 +331,7 @@ class AppGroup(BaseBuilder):
         self._security_policies.append(security_policy)
         return self
     
+    @mutator
     def set_dependencies(self, dependencies: Dict[str, List[str]]) -> "AppGroup":
         """
         Set dependencies between services in the group.
@@ -245,9 +342,11 @@ class AppGroup(BaseBuilder):
         Returns:
             AppGroup: Self for method chaining
         """
-        self._dependencies.update(dependencies)
+        for service, deps in dependencies.items():
+            self._dependencies[service] = list(dict.fromkeys(deps))
         return self
     
+    @mutator
     def add_dependency(self, service: str, depends_on: Union[str, List[str]]) -> "AppGroup":
         """
         Add a dependency for a service.
@@ -260,12 +359,11 @@ class AppGroup(BaseBuilder):
             AppGroup: Self for method chaining
         """
         if isinstance(depends_on, str):
-            depends_on = [depends_on]
-        
-        if service not in self._dependencies:
-            self._dependencies[service] = []
+            depends_on = (depends_on,)
         
-        self._dependencies[service].extend(depends_on)
+        existing = self._dependencies.setdefault(service, [])
+        # dict.fromkeys() drops repeats while keeping first-seen order
+        existing.extend(dep for dep in dict.fromkeys(depends_on) if dep not in existing)
         return self
     
     def for_environment(
@@ -289,15 +387,15 @@ class AppGroup(BaseBuilder):
         if config_overrides:
             cloned._environment_configs[environment] = config_overrides
         
-        # Apply environment config to all services
+        # The services were deep-copied with the group, so label them in
+        # place rather than cloning each one again via its for_environment()
         for service in cloned._services:
             service.add_label("environment", environment)
-            if hasattr(service, 'for_environment'):
-                service = service.for_environment(environment)
         
         return cloned
     
     @kubernetes_only
+    @mutator
     def set_resource_quotas(
         self,
         cpu_limit: Optional[str] = None,
@@ -336,6 +434,7 @@ class AppGroup(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def configure_namespace(
         self,
         create_namespace: bool = True,
@@ -366,115 +465,148 @@ class AppGroup(BaseBuilder):
         
         return self
     
+    def parallel_render(self, enabled: bool = True) -> "AppGroup":
+        """
+        Render group members on a thread pool.
+        
+        Output order is unchanged, so this only pays off when members spend
+        their render time in I/O or in C code that releases the GIL.
+        
+        Args:
+            enabled: Whether to render members concurrently
+            
+        Returns:
+            AppGroup: Self for method chaining
+        """
+        self._parallel_render = enabled
+        return self
+    
+    def _render_version(self) -> Optional[Hashable]:
+        """
+        Get the render cache key for the group and everything it renders.
+        
+        Returns:
+            Optional[Hashable]: Versions of the group and its members, or None
+                if any member does not track its own mutations
+        """
+        versions = [self._version]
+        for member in chain(self._services, self._shared_secrets, self._shared_configs,
+                            self._network_policies, self._security_policies):
+            version = member._render_version() if isinstance(member, BaseBuilder) else None
+            if version is None:
+                return None
+            versions.append(version)
+        return tuple(versions)
+    
     def generate_kubernetes_resources(self) -> List[Dict[str, Any]]:
         """
         Generate Kubernetes resources for all services in the group.
         
+        The rendered resources are reused until the group or one of its
+        members changes; each call returns its own copy.
+        
         Returns:
             List[Dict[str, Any]]: List of Kubernetes resource dictionaries
         """
-        resources = []
+        return list(self.iter_kubernetes_resources())
+    
+    def iter_kubernetes_resources(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the group's Kubernetes resources.
+        
+        Groups whose members all track their mutations reuse the memoized
+        render; other groups render each member only as it is reached,
+        unless parallel_render() is enabled, which renders them all up front
+        on a thread pool.
         
+        Returns:
+            Iterator[Dict[str, Any]]: Kubernetes resource dictionaries
+        """
+        return map(copy_resource, self._shared_resources())
+    
+    def _shared_resources(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the group's resources, sharing the memoized render."""
+        if self._render_version() is None:
+            return self._iter_resources()
+        return iter(self._render_resources())
+    
+    @memoize_render
+    def _render_resources(self) -> List[Dict[str, Any]]:
+        """Render the group's resources; see generate_kubernetes_resources."""
+        return list(self._iter_resources())
+    
+    def _iter_resources(self) -> Iterator[Dict[str, Any]]:
+        """Yield the group's resources in deployment order."""
         # Generate namespace if configured
         if self._namespace_config and self._namespace_config.get("create"):
-            namespace = self._generate_namespace()
-            resources.append(namespace)
+            yield self._generate_namespace()
         
         # Generate resource quota if configured
         if self._resource_quotas:
-            resource_quota = self._generate_resource_quota()
-            resources.append(resource_quota)
-        
-        # Generate shared secrets
-        for secret in self._shared_secrets:
-            if hasattr(secret, 'generate_kubernetes_resources'):
-                secret_resources = secret.generate_kubernetes_resources()
-                for resource in secret_resources:
-                    if self._namespace:
-                        resource.setdefault("metadata", {})["namespace"] = self._namespace
-                resources.extend(secret_resources)
-        
-        # Generate shared config maps
-        for config_map in self._shared_configs:
-            if hasattr(config_map, 'generate_kubernetes_resources'):
-                config_resources = config_map.generate_kubernetes_resources()
-                for resource in config_resources:
-                    if self._namespace:
-                        resource.setdefault("metadata", {})["namespace"] = self._namespace
-                resources.extend(config_resources)
-        
-        # Apply dependencies to services
+            yield self._generate_resource_quota()
+        
+        # Apply dependencies before the services are rendered
         self._apply_service_dependencies()
         
-        # Generate resources for each service
-        for service in self._services:
-            if hasattr(service, 'generate_kubernetes_resources'):
-                service_resources = service.generate_kubernetes_resources()
-                for resource in service_resources:
-                    if self._namespace:
-                        resource.setdefault("metadata", {})["namespace"] = self._namespace
-                resources.extend(service_resources)
-        
-        # Generate network policies
-        for policy in self._network_policies:
-            if hasattr(policy, 'generate_kubernetes_resources'):
-                policy_resources = policy.generate_kubernetes_resources()
-                for resource in policy_resources:
-                    if self._namespace:
-                        resource.setdefault("metadata", {})["namespace"] = self._namespace
-                resources.extend(policy_resources)
-        
-        # Generate security policies
-        for policy in self._security_policies:
-            if hasattr(policy, 'generate_kubernetes_resources'):
-                policy_resources = policy.generate_kubernetes_resources()
-                for resource in policy_resources:
-                    if self._namespace:
-                        resource.setdefault("metadata", {})["namespace"] = self._namespace
-                resources.extend(policy_resources)
+        # Shared secrets and configs, services, then network and security policies
+        members = chain(self._shared_secrets, self._shared_configs, self._services,
+                        self._network_policies, self._security_policies)
+        if self._parallel_render:
+            member_resources = chain.from_iterable(_render_in_threads(list(members)))
+        else:
+            member_resources = chain.from_iterable(map(child_resources, members))
+        
+        group_namespace = self._namespace
+        if group_namespace:
+            # Member renders may be memoized, so patch a copy of the metadata
+            for resource in member_resources:
+                yield {
+                    **resource,
+                    "metadata": {**resource.get("metadata", {}), "namespace": group_namespace}
+                }
+        else:
+            yield from member_resources
         
         # Generate monitoring resources
         if self._monitoring_config:
-            monitoring_resources = self._generate_monitoring_resources()
-            resources.extend(monitoring_resources)
-        
-        return resources
+            yield from self._generate_monitoring_resources()
     
     def _apply_service_dependencies(self) -> None:
         """Apply dependency configuration to services."""
+        # Dependencies and services only change through group mutators
+        if self._dependencies_applied_at == self._version:
+            return
+        self._dependencies_applied_at = self._version
+        
         for service_name, deps in self._dependencies.items():
-            service = self.get_service(service_name)
+            service = self._service_index.get(service_name)
             if service and hasattr(service, 'depends_on'):
-                service.depends_on(deps)
+                # Only pass new names so repeated renders leave the service unchanged
+                current = getattr(service, '_dependencies', None) or ()
+                missing = [dep for dep in deps if dep not in current]
+                if missing:
+                    service.depends_on(missing)
     
     def _generate_namespace(self) -> Dict[str, Any]:
         """Generate Kubernetes Namespace resource."""
-        namespace = {
-            "apiVersion": "v1",
-            "kind": "Namespace",
-            "metadata": {
-                "name": self._name,
-                "labels": {**self._labels, **self._namespace_config.get("labels", {})},
-                "annotations": {**self._annotations, **self._namespace_config.get("annotations", {})}
-            }
+        namespace = _NAMESPACE_SKELETON.copy()
+        namespace["metadata"] = {
+            "name": self._name,
+            "labels": {**self._labels, **self._namespace_config.get("labels", {})},
+            "annotations": {**self._annotations, **self._namespace_config.get("annotations", {})}
         }
         return namespace
     
     def _generate_resource_quota(self) -> Dict[str, Any]:
         """Generate Kubernetes ResourceQuota resource."""
-        resource_quota = {
-            "apiVersion": "v1",
-            "kind": "ResourceQuota",
-            "metadata": {
-                "name": f"{self._name}-quota",
-                "namespace": self._namespace or self._name,
-                "labels": self._labels,
-                "annotations": self._annotations
-            },
-            "spec": {
-                "hard": self._resource_quotas
-            }
+        resource_quota = _RESOURCE_QUOTA_SKELETON.copy()
+        resource_quota["metadata"] = {
+            "name": f"{self._name}-quota",
+            "namespace": self._namespace or self._name,
+            "labels": self._labels.copy(),
+            "annotations": self._annotations.copy()
         }
+        resource_quota["spec"] = {"hard": self._resource_quotas.copy()}
         return resource_quota
     
     def _generate_monitoring_resources(self) -> List[Dict[str, Any]]:
@@ -486,40 +618,34 @@ class AppGroup(BaseBuilder):
         
         # Generate ServiceMonitor for Prometheus
         if self._monitoring_config.get("prometheus"):
-            service_monitor = {
-                "apiVersion": "monitoring.coreos.com/v1",
-                "kind": "ServiceMonitor",
-                "metadata": {
-                    "name": f"{self._name}-monitoring",
-                    "namespace": self._namespace or self._name,
-                    "labels": self._labels
+            service_monitor = _SERVICE_MONITOR_SKELETON.copy()
+            service_monitor["metadata"] = {
+                "name": f"{self._name}-monitoring",
+                "namespace": self._namespace or self._name,
+                "labels": self._labels.copy()
+            }
+            service_monitor["spec"] = {
+                "selector": {
+                    "matchLabels": {_PART_OF_LABEL: self._name}
                 },
-                "spec": {
-                    "selector": {
-                        "matchLabels": {"app.kubernetes.io/part-of": self._name}
-                    },
-                    "endpoints": [{
-                        "port": "metrics",
-                        "path": "/metrics",
-                        "interval": "30s"
-                    }]
-                }
+                "endpoints": [{
+                    "port": "metrics",
+                    "path": "/metrics",
+                    "interval": "30s"
+                }]
             }
             resources.append(service_monitor)
         
         # Generate Grafana dashboard ConfigMap
         if self._monitoring_config.get("grafana"):
-            dashboard_config = {
-                "apiVersion": "v1",
-                "kind": "ConfigMap",
-                "metadata": {
-                    "name": f"{self._name}-grafana-dashboard",
-                    "namespace": self._namespace or self._name,
-                    "labels": {**self._labels, "grafana_dashboard": "1"}
-                },
-                "data": {
-                    "dashboard.json": self._generate_grafana_dashboard()
-                }
+            dashboard_config = _CONFIG_MAP_SKELETON.copy()
+            dashboard_config["metadata"] = {
+                "name": f"{self._name}-grafana-dashboard",
+                "namespace": self._namespace or self._name,
+                "labels": {**self._labels, "grafana_dashboard": "1"}
+            }
+            dashboard_config["data"] = {
+                "dashboard.json": self._generate_grafana_dashboard()
             }
             resources.append(dashboard_config)
         
@@ -529,7 +655,7 @@ class AppGroup(BaseBuilder):
         """Generate Grafana dashboard JSON."""
         # This would generate a complete Grafana dashboard
         # For brevity, returning a simple placeholder
-        return '{"dashboard": {"title": "' + self._name + ' Monitoring"}}'
+        return json.dumps({"dashboard": {"title": f"{self._name} Monitoring"}})
     
     def get_service_names(self) -> List[str]:
         """Get list of service names in the group."""
@@ -539,6 +665,36 @@ class AppGroup(BaseBuilder):
         """Get the number of services in the group."""
         return len(self._services)
     
+    def _find_dependency_cycle(self) -> List[str]:
+        """
+        Find services that cannot be ordered because of circular dependencies.
+        
+        Uses Kahn's topological sort, so deep dependency chains need no recursion.
+        Unknown services are ignored; validate() reports them separately.
+        
+        Returns:
+            List[str]: Services in or behind a dependency cycle, in group order
+        """
+        pending: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {}
+        for service_name, deps in self._dependencies.items():
+            if service_name not in self._service_index:
+                continue
+            known = {dep for dep in deps if dep in self._service_index}
+            pending[service_name] = len(known)
+            for dep in known:
+                dependents.setdefault(dep, []).append(service_name)
+        
+        ready = deque(name for name in self._service_index if not pending.get(name))
+        while ready:
+            for dependent in dependents.get(ready.popleft(), ()):
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    ready.append(dependent)
+        
+        return [name for name in self._service_index if pending.get(name)]
+    
+    @memoize_validation
     def validate(self) -> List[str]:
         """
         Validate the application group configuration.
@@ -553,8 +709,8 @@ class AppGroup(BaseBuilder):
             errors.append("AppGroup must contain at least one service")
         
         # Validate service names are unique
-        service_names = [s.name for s in self._services]
-        if len(service_names) != len(set(service_names)):
+        service_names = self._service_index
+        if len(service_names) != len(self._services):
             errors.append("Service names within AppGroup must be unique")
         
         # Validate dependencies
@@ -566,6 +722,10 @@ class AppGroup(BaseBuilder):
                 if dep not in service_names:
                     errors.append(f"Service {service_name} depends on unknown service: {dep}")
         
+        cyclic = self._find_dependency_cycle()
+        if cyclic:
+            errors.append(f"Circular dependency detected among: {', '.join(cyclic)}")
+        
         # Validate each service
         for service in self._services:
             if hasattr(service, 'validate'):
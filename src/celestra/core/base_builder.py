@@ -4,13 +4,116 @@ Base builder class for Celestraa DSL.
 This module contains the abstract base class for all DSL builders.
 """
 
+import copy
+import sys
+from itertools import chain
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .resource_generator import ResourceGenerator
 
-from ..utils.helpers import generate_labels, generate_annotations
+from ..utils.helpers import format_json_bytes, format_yaml, generate_labels, generate_annotations
+from ..utils.decorators import memoize_validation, mutator, specialize_for_format
+
+
+# generate_kubernetes_resources of each builder type, or None if it has none
+_RESOURCE_GENERATORS: Dict[type, Optional[Callable]] = {}
+
+
+def child_resources(child: Any) -> List[Dict[str, Any]]:
+    """
+    Generate the Kubernetes resources of a nested builder.
+    
+    The generator method is resolved once per child type rather than
+    through a full attribute lookup on every child. Builders hand over
+    their shared renders, so the result must be treated as read-only.
+    
+    Args:
+        child: Attached or grouped builder (service, ConfigMap, secret, policy, ...)
+        
+    Returns:
+        List[Dict[str, Any]]: Child resources (empty if it cannot generate any)
+    """
+    child_type = type(child)
+    try:
+        generate = _RESOURCE_GENERATORS[child_type]
+    except KeyError:
+        generate = _RESOURCE_GENERATORS[child_type] = (
+            getattr(child_type, '_shared_resources', None) or
+            getattr(child_type, 'generate_kubernetes_resources', None)
+        )
+    return list(generate(child)) if generate is not None else []
+
+
+def copy_resource(value: Any) -> Any:
+    """
+    Copy a rendered resource, so callers can modify it freely.
+    
+    Resources only hold dicts, lists and immutable scalars, so this is a
+    cheaper deep copy that rebuilds the containers and shares the scalars.
+    
+    Args:
+        value: Resource dictionary or any value nested in one
+        
+    Returns:
+        Any: Copy that shares no dicts or lists with the original
+    """
+    if isinstance(value, dict):
+        return {key: copy_resource(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_resource(item) for item in value]
+    return value
+
+
+def child_render_version(child: Any) -> Optional[Hashable]:
+    """
+    Get the render cache key of a nested builder.
+    
+    Args:
+        child: Builder embedded in a parent's render (companion, service, health check, ...)
+        
+    Returns:
+        Optional[Hashable]: Key that changes with the child's state, or None
+            if the child does not track its mutations
+    """
+    render_version = getattr(child, '_render_version', None)
+    return render_version() if render_version is not None else None
+
+
+def _intern_key(key: str) -> str:
+    """Intern a label or annotation key; the same few keys recur on every builder."""
+    return sys.intern(key) if type(key) is str else key
+
+
+def _metadata_errors(entries: Dict[str, str], kind: str, check_length: bool) -> List[str]:
+    """
+    Validate label or annotation entries.
+    
+    Args:
+        entries: Mapping to check
+        kind: "Label" or "Annotation", used in messages
+        check_length: Whether keys and values are limited to 63 characters
+        
+    Returns:
+        List[str]: Validation errors, in entry order
+    """
+    # Fast path: well-formed metadata needs one pass and no per-entry branching
+    if all(type(key) is str and type(value) is str for key, value in entries.items()):
+        if not check_length or max(map(len, chain(entries, entries.values())), default=0) <= 63:
+            return []
+    
+    errors = []
+    for key, value in entries.items():
+        if not isinstance(key, str) or not isinstance(value, str):
+            errors.append(f"{kind} {key} must have string key and value")
+        elif not check_length:
+            continue
+        elif len(key) > 63:
+            errors.append(f"{kind} key {key} must be 63 characters or less")
+        elif len(value) > 63:
+            errors.append(f"{kind} value {value} must be 63 characters or less")
+    return errors
 
 
 class BaseBuilder(ABC):
@@ -21,6 +124,25 @@ class BaseBuilder(ABC):
     builder classes in the Celestraa DSL.
     """
     
+    # Subclasses that declare their own __slots__ drop the per-instance
+    # __dict__; the method-tracking sets are filled in by utils.decorators
+    __slots__ = (
+        "_name",
+        "_namespace",
+        "_labels",
+        "_annotations",
+        "_config",
+        "_kubernetes_methods",
+        "_docker_compose_methods",
+        "_format_methods",
+        "_version",
+        "_render_cache",
+    )
+    
+    # True for builders whose mutating methods are all marked @mutator, so
+    # _version changes whenever their rendered output may change
+    _TRACKS_MUTATIONS = False
+    
     def __init__(self, name: str):
         """
         Initialize the base builder.
@@ -30,15 +152,16 @@ class BaseBuilder(ABC):
         """
         self._name = name
         self._namespace = "default"
-        self._labels: Dict[str, str] = {}
-        self._annotations: Dict[str, str] = {}
+        # Default labels and annotations; each call returns a fresh dict
+        self._labels: Dict[str, str] = generate_labels(name)
+        self._annotations: Dict[str, str] = generate_annotations()
         self._config: Dict[str, Any] = {}
-        
-        # Set default labels
-        self._labels.update(generate_labels(name))
-        
-        # Set default annotations
-        self._annotations.update(generate_annotations())
+        self._kubernetes_methods: Optional[Set[str]] = None
+        self._docker_compose_methods: Optional[Set[str]] = None
+        self._format_methods: Optional[Dict[str, Set[str]]] = None
+        # Bumped by @mutator methods; see utils.decorators.memoize_render
+        self._version: int = 0
+        self._render_cache: Optional[Dict[str, Tuple[int, Any]]] = None
     
     @property
     def name(self) -> str:
@@ -60,6 +183,7 @@ class BaseBuilder(ABC):
         """Get the resource annotations."""
         return self._annotations.copy()
     
+    @mutator
     def set_namespace(self, namespace: str) -> "BaseBuilder":
         """
         Set the namespace for the resource.
@@ -73,6 +197,7 @@ class BaseBuilder(ABC):
         self._namespace = namespace
         return self
     
+    @mutator
     def add_label(self, key: str, value: str) -> "BaseBuilder":
         """
         Add a label to the resource.
@@ -84,9 +209,10 @@ class BaseBuilder(ABC):
         Returns:
             BaseBuilder: Self for method chaining
         """
-        self._labels[key] = value
+        self._labels[_intern_key(key)] = value
         return self
     
+    @mutator
     def add_labels(self, labels: Dict[str, str]) -> "BaseBuilder":
         """
         Add multiple labels to the resource.
@@ -97,9 +223,10 @@ class BaseBuilder(ABC):
         Returns:
             BaseBuilder: Self for method chaining
         """
-        self._labels.update(labels)
+        self._labels.update((_intern_key(key), value) for key, value in labels.items())
         return self
     
+    @mutator
     def add_annotation(self, key: str, value: str) -> "BaseBuilder":
         """
         Add an annotation to the resource.
@@ -111,9 +238,10 @@ class BaseBuilder(ABC):
         Returns:
             BaseBuilder: Self for method chaining
         """
-        self._annotations[key] = value
+        self._annotations[_intern_key(key)] = value
         return self
     
+    @mutator
     def add_annotations(self, annotations: Dict[str, str]) -> "BaseBuilder":
         """
         Add multiple annotations to the resource.
@@ -124,9 +252,68 @@ class BaseBuilder(ABC):
         Returns:
             BaseBuilder: Self for method chaining
         """
-        self._annotations.update(annotations)
+        self._annotations.update((_intern_key(key), value) for key, value in annotations.items())
         return self
     
+    @classmethod
+    def configure_target(cls, output_format: Optional[str]) -> None:
+        """
+        Specialize this class's format-restricted methods for one output format.
+        
+        Use this when rendering many builders for a single known target.
+        Methods for that format run without decorator overhead, and methods
+        for other formats raise ValueError. The change applies to the whole
+        class until it is reset.
+        
+        Args:
+            output_format: Target output format ('kubernetes', 'docker-compose', ...),
+                or None to restore the default behaviour
+        """
+        specialize_for_format(cls, output_format)
+    
+    def _render_version(self) -> Optional[Hashable]:
+        """
+        Get the key that memoized renders of this builder are stored under.
+        
+        Returns:
+            Optional[Hashable]: Key that changes with the rendered output,
+                or None when renders must not be cached
+        """
+        return self._version if self._TRACKS_MUTATIONS else None
+    
+    def _render_version_with(self, children: Iterable[Any]) -> Optional[Hashable]:
+        """
+        Get the render cache key of a builder whose renders embed nested builders.
+        
+        Args:
+            children: Attached builders read by the memoized render methods
+            
+        Returns:
+            Optional[Hashable]: Versions of the builder and its children, or
+                None if any of them does not track its mutations
+        """
+        version = self._version if self._TRACKS_MUTATIONS else None
+        if version is None:
+            return None
+        versions = [version]
+        for child in children:
+            child_version = child_render_version(child)
+            if child_version is None:
+                return None
+            versions.append(child_version)
+        return tuple(versions) if len(versions) > 1 else version
+    
+    def clone(self) -> "BaseBuilder":
+        """
+        Create an independent copy of the builder.
+        
+        Returns:
+            BaseBuilder: Deep copy of this builder, without its render cache
+        """
+        # Seed the deepcopy memo so the cached renders are not copied
+        return copy.deepcopy(self, {id(self._render_cache): None})
+    
+    @memoize_validation
     def validate(self) -> List[str]:
         """
         Validate the builder configuration.
@@ -150,20 +337,33 @@ class BaseBuilder(ABC):
         elif not isinstance(self._namespace, str):
             errors.append("Namespace must be a string")
         
-        # Validate labels
-        for key, value in self._labels.items():
-            if not isinstance(key, str) or not isinstance(value, str):
-                errors.append(f"Label {key} must have string key and value")
-            elif len(key) > 63:
-                errors.append(f"Label key {key} must be 63 characters or less")
-            elif len(value) > 63:
-                errors.append(f"Label value {value} must be 63 characters or less")
+        # Validate labels and annotations
+        errors.extend(self._metadata_validation())
         
-        # Validate annotations
-        for key, value in self._annotations.items():
-            if not isinstance(key, str) or not isinstance(value, str):
-                errors.append(f"Annotation {key} must have string key and value")
+        return errors
+    
+    def _metadata_validation(self) -> List[str]:
+        """
+        Validate labels and annotations, reusing the result until they change.
+        
+        Labels and annotations are only changed by this class's @mutator
+        methods, so _version tracks them even in builders that do not mark
+        their own setters.
+        
+        Returns:
+            List[str]: Label and annotation errors (shared; do not modify)
+        """
+        cache = self._render_cache
+        if cache is None:
+            cache = self._render_cache = {}
         
+        cached = cache.get("_metadata_validation")
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        
+        errors = (_metadata_errors(self._labels, "Label", True) +
+                  _metadata_errors(self._annotations, "Annotation", False))
+        cache["_metadata_validation"] = (self._version, errors)
         return errors
     
     def _get(self, key: str, default: Any = None) -> Any:
@@ -179,6 +379,7 @@ class BaseBuilder(ABC):
         """
         return self._config.get(key, default)
     
+    @mutator
     def _set(self, key: str, value: Any) -> "BaseBuilder":
         """
         Set configuration value.
@@ -205,6 +406,7 @@ class BaseBuilder(ABC):
         """
         return key in self._config
     
+    @mutator
     def _merge_config(self, config: Dict[str, Any]) -> "BaseBuilder":
         """
         Merge configuration dictionary.
@@ -228,6 +430,59 @@ class BaseBuilder(ABC):
         """
         pass
     
+    def iter_kubernetes_resources(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the generated Kubernetes resources.
+        
+        Builders that can produce resources one at a time override this.
+        
+        Returns:
+            Iterator[Dict[str, Any]]: Kubernetes resource dictionaries
+        """
+        return iter(self.generate_kubernetes_resources())
+    
+    def _shared_resources(self) -> Iterable[Dict[str, Any]]:
+        """
+        Get the rendered resources without copying them.
+        
+        Builders that memoize their renders override this to return the
+        cached resources themselves and copy them in their public methods.
+        Callers must treat the result as read-only.
+        
+        Returns:
+            Iterable[Dict[str, Any]]: Kubernetes resource dictionaries
+        """
+        return self.iter_kubernetes_resources()
+    
+    def dump_to(self, stream: TextIO) -> "BaseBuilder":
+        """
+        Write the generated Kubernetes resources to a stream as YAML documents.
+        
+        Each resource is written as soon as it is rendered and the stream's
+        own buffering batches the writes, so the output can go straight to
+        a file or to ``kubectl apply -f -``.
+        
+        Args:
+            stream: Writable text stream (e.g., an open file or sys.stdout)
+            
+        Returns:
+            BaseBuilder: Self for method chaining
+        """
+        write = stream.write
+        for resource in self._shared_resources():
+            write("---\n")
+            write(format_yaml(resource))
+        return self
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the generated Kubernetes resources as a compact JSON list.
+        
+        Returns:
+            bytes: UTF-8 encoded JSON, ready to write to a binary stream
+        """
+        return format_json_bytes(list(self._shared_resources()))
+    
     def generate(self) -> "ResourceGenerator":
         """
         Generate resources using the generator pattern.
@@ -5,15 +5,54 @@ This module contains the ResourceGenerator class that handles the generation
 of multiple output formats from DSL builders.
 """
 
-from typing import Dict, List, Any, Optional, Union, TYPE_CHECKING
+import io
+import threading
+from importlib import import_module
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 
 if TYPE_CHECKING:
     from .base_builder import BaseBuilder
 
-from ..utils.helpers import ensure_directory
+from ..utils.helpers import as_path, ensure_directory, format_yaml
 from ..utils.decorators import show_format_warnings
 
+# Top-level fields every generated resource must have, in reporting order
+_REQUIRED_FIELDS = ("apiVersion", "kind", "metadata")
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+# Output format classes by name, as (module in ..output, class name)
+_OUTPUT_FORMATS = {
+    "kubernetes": ("kubernetes_output", "KubernetesOutput"),
+    "docker-compose": ("docker_compose_output", "DockerComposeOutput"),
+    "helm": ("helm_output", "HelmOutput"),
+    "kustomize": ("kustomize_output", "KustomizeOutput"),
+    "terraform": ("terraform_output", "TerraformOutput"),
+}
+
+# to_all_formats() targets by format: generator method and path under the output directory
+_ALL_FORMAT_TARGETS = {
+    "yaml": ("to_yaml", ("k8s",)),
+    "docker-compose": ("to_docker_compose", ("docker-compose.yml",)),
+    "helm": ("to_helm_chart", ("charts",)),
+    "kustomize": ("to_kustomize", ("kustomize", "base")),
+    "terraform": ("to_terraform", ("terraform",)),
+}
+
+# Output format classes already imported, by name
+_output_classes: Dict[str, type] = {}
+
+
+def _output_class(name: str) -> type:
+    """Get an output format class, importing its module on first call."""
+    output_class = _output_classes.get(name)
+    if output_class is None:
+        module_name, class_name = _OUTPUT_FORMATS[name]
+        module = import_module(f"..output.{module_name}", __package__)
+        output_class = _output_classes[name] = getattr(module, class_name)
+    return output_class
+
 
 class ResourceGenerator:
     """
@@ -23,6 +62,15 @@ class ResourceGenerator:
     of output format methods.
     """
     
+    __slots__ = (
+        "_builder",
+        "_resources",
+        "_resources_lock",
+        "_resource_errors",
+        "_by_kind",
+        "_by_api_version",
+    )
+    
     def __init__(self, builder: "BaseBuilder"):
         """
         Initialize the resource generator.
@@ -32,6 +80,13 @@ class ResourceGenerator:
         """
         self._builder = builder
         self._resources: Optional[List[Dict[str, Any]]] = None
+        # Guards the first render when several threads ask for resources at once
+        self._resources_lock = threading.Lock()
+        # Structural errors in the cached resources, checked once
+        self._resource_errors: Optional[List[str]] = None
+        # Cached resources grouped by kind and by apiVersion, built on first lookup
+        self._by_kind: Optional[Dict[str, Tuple[Dict[str, Any], ...]]] = None
+        self._by_api_version: Optional[Dict[str, Tuple[Dict[str, Any], ...]]] = None
     
     @property
     def resources(self) -> List[Dict[str, Any]]:
@@ -41,9 +96,27 @@ class ResourceGenerator:
         Returns:
             List[Dict[str, Any]]: List of Kubernetes resource dictionaries
         """
-        if self._resources is None:
-            self._resources = self._builder.generate_kubernetes_resources()
-        return self._resources
+        resources = self._resources
+        if resources is not None:
+            return resources
+        
+        with self._resources_lock:
+            if self._resources is None:
+                self._resources = self._builder.generate_kubernetes_resources()
+            return self._resources
+    
+    def generate_kubernetes_resources(self) -> List[Dict[str, Any]]:
+        """
+        Get the generated Kubernetes resources.
+        
+        Lets the generator be added to the chart, Kustomize and Terraform
+        outputs in place of its builder, so they reuse the resources
+        generated here instead of rendering the builder again.
+        
+        Returns:
+            List[Dict[str, Any]]: List of Kubernetes resource dictionaries
+        """
+        return self.resources
     
     def to_yaml(self, output_path: Union[str, Path] = "./k8s/") -> "ResourceGenerator":
         """
@@ -55,12 +128,10 @@ class ResourceGenerator:
         Returns:
             ResourceGenerator: Self for method chaining
         """
-        from ..output.kubernetes_output import KubernetesOutput
-        
         # Show warnings for incompatible methods
         show_format_warnings(self._builder, "kubernetes")
         
-        output = KubernetesOutput()
+        output = _output_class("kubernetes")()
         output.generate(self.resources, output_path)
         return self
     
@@ -81,12 +152,10 @@ class ResourceGenerator:
         Returns:
             ResourceGenerator: Self for method chaining
         """
-        from ..output.docker_compose_output import DockerComposeOutput
-        
         # Show warnings for incompatible methods
         show_format_warnings(self._builder, "docker-compose")
         
-        output = DockerComposeOutput()
+        output = _output_class("docker-compose")()
         output.generate(
             self._builder, 
             output_file,
@@ -105,10 +174,8 @@ class ResourceGenerator:
         Returns:
             ResourceGenerator: Self for method chaining
         """
-        from ..output.helm_output import HelmOutput
-        
-        output = HelmOutput()
-        output.generate(self._builder, output_path)
+        output = _output_class("helm")(self._builder.name).add_resource(self)
+        output.generate(output_path)
         return self
     
     def to_kustomize(
@@ -120,16 +187,26 @@ class ResourceGenerator:
         Generate Kustomize structure.
         
         Args:
-            base_path: Path to write base Kustomize files
+            base_path: Path to write base Kustomize files. A directory named
+                ``base`` is used as is, with overlays written next to it; any
+                other directory becomes the Kustomize root, holding ``base/``
+                and ``overlays/``
             overlays: List of overlay environments to generate
             
         Returns:
             ResourceGenerator: Self for method chaining
         """
-        from ..output.kustomize_output import KustomizeOutput
-        
-        output = KustomizeOutput()
-        output.generate(self._builder, base_path, overlays=overlays)
+        base_path = as_path(base_path)
+        # KustomizeOutput writes its base into <output_dir>/base
+        output_dir = base_path.parent if base_path.name == "base" else base_path
+        name = self._builder.name
+        kustomize_output = _output_class("kustomize")
+        output = kustomize_output(name).add_resource(self)
+        for environment in overlays or ():
+            output.add_overlay(environment, kustomize_output(f"{name}-{environment}")
+                               .add_common_label("environment", environment))
+        
+        output.generate(output_dir)
         return self
     
     def to_terraform(self, output_path: Union[str, Path] = "./terraform/") -> "ResourceGenerator":
@@ -142,16 +219,15 @@ class ResourceGenerator:
         Returns:
             ResourceGenerator: Self for method chaining
         """
-        from ..output.terraform_output import TerraformOutput
-        
-        output = TerraformOutput()
-        output.generate(self._builder, output_path)
+        output = _output_class("terraform")(self._builder.name).add_resource(self)
+        output.generate(output_path)
         return self
     
     def to_all_formats(
         self, 
         output_path: Union[str, Path] = "./output/",
-        formats: Optional[List[str]] = None
+        formats: Optional[List[str]] = None,
+        parallel: bool = False
     ) -> "ResourceGenerator":
         """
         Generate all supported output formats.
@@ -159,30 +235,33 @@ class ResourceGenerator:
         Args:
             output_path: Base directory path for all outputs
             formats: List of formats to generate (default: all)
+            parallel: Write the formats concurrently on a thread pool
             
         Returns:
             ResourceGenerator: Self for method chaining
         """
-        if formats is None:
-            formats = ["yaml", "docker-compose", "helm", "kustomize", "terraform"]
+        selected = _ALL_FORMAT_TARGETS.keys() if formats is None else set(formats)
         
-        output_path = Path(output_path)
+        output_path = as_path(output_path)
         ensure_directory(output_path)
         
-        if "yaml" in formats:
-            self.to_yaml(output_path / "k8s")
-        
-        if "docker-compose" in formats:
-            self.to_docker_compose(output_path / "docker-compose.yml")
+        jobs = [
+            (getattr(self, method), output_path.joinpath(*parts))
+            for output_format, (method, parts) in _ALL_FORMAT_TARGETS.items()
+            if output_format in selected
+        ]
         
-        if "helm" in formats:
-            self.to_helm_chart(output_path / "charts")
+        if not parallel or len(jobs) < 2:
+            for method, path in jobs:
+                method(path)
+            return self
         
-        if "kustomize" in formats:
-            self.to_kustomize(output_path / "kustomize" / "base")
-        
-        if "terraform" in formats:
-            self.to_terraform(output_path / "terraform")
+        # Render up front so the workers share the cached resources
+        self.resources
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(method, path) for method, path in jobs]
+        for future in futures:
+            future.result()
         
         return self
     
@@ -221,51 +300,102 @@ class ResourceGenerator:
         
         # Validate generated resources
         try:
-            resources = self.resources
-            for resource in resources:
-                if not isinstance(resource, dict):
-                    errors.append("Resource must be a dictionary")
-                    continue
-                
-                if "apiVersion" not in resource:
-                    errors.append("Resource missing apiVersion")
-                
-                if "kind" not in resource:
-                    errors.append("Resource missing kind")
-                
-                if "metadata" not in resource:
-                    errors.append("Resource missing metadata")
-                elif "name" not in resource["metadata"]:
-                    errors.append("Resource metadata missing name")
-        
+            errors.extend(self._check_resources())
         except Exception as e:
             errors.append(f"Error generating resources: {str(e)}")
         
         return errors
     
+    def _check_resources(self) -> List[str]:
+        """
+        Check the structure of the generated resources.
+        
+        The resources are generated once per ResourceGenerator, so the
+        result is computed on first use and reused afterwards.
+        
+        Returns:
+            List[str]: List of validation errors
+        """
+        if self._resource_errors is not None:
+            return self._resource_errors
+        
+        errors = []
+        append = errors.append
+        has_required = _REQUIRED_FIELD_SET.issubset
+        for resource in self.resources:
+            if not isinstance(resource, dict):
+                append("Resource must be a dictionary")
+                continue
+            
+            # One subset test covers the common case of a complete resource
+            if not has_required(resource):
+                for field in _REQUIRED_FIELDS:
+                    if field not in resource:
+                        append(f"Resource missing {field}")
+            
+            if "metadata" in resource and "name" not in resource["metadata"]:
+                append("Resource metadata missing name")
+        
+        self._resource_errors = errors
+        return errors
+    
     def security_scan(self) -> Dict[str, Any]:
         """
         Perform security scanning on generated resources.
         
         Returns:
-            Dict[str, Any]: Security scan results
+            Dict[str, Any]: Security findings and the formatted report
         """
         from ..validation.security_scanner import SecurityScanner
         
         scanner = SecurityScanner()
-        return scanner.scan(self.resources)
+        findings = scanner.scan_resources(self.resources)
+        return {
+            "findings": findings,
+            "report": scanner.generate_security_report(findings)
+        }
     
     def cost_estimate(self) -> Dict[str, Any]:
         """
         Estimate costs for the generated resources.
         
         Returns:
-            Dict[str, Any]: Cost estimation results
+            Dict[str, Any]: Per-resource costs and their total
         """
         from ..validation.cost_estimator import CostEstimator
         
         estimator = CostEstimator()
-        return estimator.estimate(self.resources)
+        resource_costs = estimator.estimate_resources(self.resources)
+        return {
+            "resources": resource_costs,
+            "total": estimator.calculate_total_cost(resource_costs)
+        }
+    
+    def analyze(self, parallel: bool = False) -> Dict[str, Any]:
+        """
+        Run validation, security scanning and cost estimation together.
+        
+        The three analyses share one set of generated resources.
+        
+        Args:
+            parallel: Run the analyses concurrently on a thread pool
+            
+        Returns:
+            Dict[str, Any]: Results keyed by "errors", "security" and "cost"
+        """
+        analyses = {
+            "errors": self.validate,
+            "security": self.security_scan,
+            "cost": self.cost_estimate
+        }
+        if not parallel:
+            return {key: analysis() for key, analysis in analyses.items()}
+        
+        # Render up front so the workers share the cached resources
+        self.resources
+        with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            futures = {key: executor.submit(analysis) for key, analysis in analyses.items()}
+        return {key: future.result() for key, future in futures.items()}
     
     def get_resources_by_kind(self, kind: str) -> List[Dict[str, Any]]:
         """
@@ -277,7 +407,21 @@ class ResourceGenerator:
         Returns:
             List[Dict[str, Any]]: Filtered resources
         """
-        return [r for r in self.resources if r.get("kind") == kind]
+        return list(self.iter_resources_by_kind(kind))
+    
+    def iter_resources_by_kind(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over resources of a Kubernetes kind without copying them.
+        
+        Args:
+            kind: Kubernetes resource kind
+            
+        Returns:
+            Iterator[Dict[str, Any]]: Matching resources in generation order
+        """
+        if self._by_kind is None:
+            self._index_resources()
+        return iter(self._by_kind.get(kind, ()))
     
     def get_resources_by_api_version(self, api_version: str) -> List[Dict[str, Any]]:
         """
@@ -289,7 +433,22 @@ class ResourceGenerator:
         Returns:
             List[Dict[str, Any]]: Filtered resources
         """
-        return [r for r in self.resources if r.get("apiVersion") == api_version]
+        if self._by_api_version is None:
+            self._index_resources()
+        return list(self._by_api_version.get(api_version, ()))
+    
+    def _index_resources(self) -> None:
+        """Group the cached resources by kind and by apiVersion in one pass."""
+        by_kind: Dict[str, List[Dict[str, Any]]] = {}
+        by_api_version: Dict[str, List[Dict[str, Any]]] = {}
+        for resource in self.resources:
+            by_kind.setdefault(resource.get("kind"), []).append(resource)
+            by_api_version.setdefault(resource.get("apiVersion"), []).append(resource)
+        # Frozen as tuples: the index is shared and must not be changed by callers
+        self._by_kind = {kind: tuple(group) for kind, group in by_kind.items()}
+        self._by_api_version = {
+            api_version: tuple(group) for api_version, group in by_api_version.items()
+        }
     
     def preview(self) -> str:
         """
@@ -298,11 +457,18 @@ class ResourceGenerator:
         Returns:
             str: YAML representation of resources
         """
-        from ..utils.helpers import format_yaml
-        
-        all_resources = {"---\n".join([format_yaml(r) for r in self.resources])}
-        return "---\n" + all_resources.pop()
+        # Write each document straight into one buffer instead of
+        # collecting every YAML string in a list before joining
+        buffer = io.StringIO()
+        buffer.write("---\n")
+        for index, resource in enumerate(self.resources):
+            if index:
+                buffer.write("---\n")
+            buffer.write(format_yaml(resource))
+        return buffer.getvalue()
     
     def __repr__(self) -> str:
         """String representation of the generator."""
-        return f"ResourceGenerator(builder={self._builder}, resources={len(self.resources)})" 
\ No newline at end of file
+        # Report the count only once generated; repr must not render the builder
+        count = "?" if self._resources is None else len(self._resources)
+        return f"ResourceGenerator(builder={self._builder}, resources={count})" 
\ No newline at end of file
@@ -5,9 +5,35 @@ This module contains the StatefulApp class which represents stateful application
 that require persistent storage and stable network identities.
 """
 
-from typing import Dict, List, Any, Optional, Union
-from .base_builder import BaseBuilder
-from ..utils.decorators import docker_compose_only, kubernetes_only
+import copy
+from itertools import chain
+from typing import Dict, Hashable, Iterator, List, Any, Optional, Union
+from .base_builder import BaseBuilder, child_resources, copy_resource
+from ..utils.decorators import docker_compose_only, kubernetes_only, memoize_render, mutator
+
+
+# Fixed top-level fields of each generated resource, copied on every render
+_STATEFULSET_SKELETON = {"apiVersion": "apps/v1", "kind": "StatefulSet"}
+_SERVICE_SKELETON = {"apiVersion": "v1", "kind": "Service"}
+_CRONJOB_SKELETON = {"apiVersion": "batch/v1", "kind": "CronJob"}
+
+# Settings configure() assigns directly; each has a single-assignment setter
+_CONFIGURABLE_FIELDS = frozenset({
+    "image", "replicas", "cluster_mode", "retention_hours", "security_context",
+    "service_type", "headless_service", "update_strategy", "partition",
+})
+
+# Of those, the ones whose setters are @kubernetes_only
+_KUBERNETES_ONLY_FIELDS = frozenset({
+    "cluster_mode", "retention_hours", "headless_service", "update_strategy",
+})
+
+# Health probe attributes and the container fields they render to
+_PROBE_KEYS = (
+    ("liveness_probe", "livenessProbe"),
+    ("readiness_probe", "readinessProbe"),
+    ("startup_probe", "startupProbe"),
+)
 
 
 class StatefulApp(BaseBuilder):
@@ -28,6 +54,36 @@ class StatefulApp(BaseBuilder):
         ```
     """
     
+    __slots__ = (
+        "_image",
+        "_ports",
+        "_environment",
+        "_resources",
+        "_replicas",
+        "_storage_size",
+        "_storage_class",
+        "_access_modes",
+        "_mount_path",
+        "_backup_schedule",
+        "_backup_retention",
+        "_cluster_mode",
+        "_persistence",
+        "_topics",
+        "_retention_hours",
+        "_companions",
+        "_secrets",
+        "_config_maps",
+        "_lifecycle",
+        "_health",
+        "_security_context",
+        "_service_type",
+        "_headless_service",
+        "_update_strategy",
+        "_partition",
+    )
+    
+    _TRACKS_MUTATIONS = True
+    
     def __init__(self, name: str):
         """
         Initialize the StatefulApp builder.
@@ -62,6 +118,7 @@ class StatefulApp(BaseBuilder):
         self._update_strategy: str = "RollingUpdate"
         self._partition: Optional[int] = None
     
+    @mutator
     def image(self, image: str) -> "StatefulApp":
         """
         Set the container image.
@@ -75,6 +132,47 @@ class StatefulApp(BaseBuilder):
         self._image = image
         return self
     
+    @mutator
+    def configure(self, **settings: Any) -> "StatefulApp":
+        """
+        Set several simple settings in one call.
+        
+        Equivalent to chaining the matching setters: ``configure(image="postgres:13",
+        replicas=3)`` does the same as ``image("postgres:13").replicas(3)``.
+        The fields are assigned in this one call rather than through each
+        setter, with Kubernetes-only settings recorded as their setters would.
+        As with ``update_strategy()``, a new strategy without ``partition``
+        clears the partition; ``partition`` on its own only changes the
+        partition of the current strategy.
+        
+        Args:
+            **settings: Values for image, replicas, cluster_mode, retention_hours,
+                security_context, service_type, headless_service, update_strategy
+                or partition
+            
+        Returns:
+            StatefulApp: Self for method chaining
+            
+        Raises:
+            ValueError: If a setting is not supported
+        """
+        unknown = settings.keys() - _CONFIGURABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Unsupported StatefulApp settings: {', '.join(sorted(unknown))}")
+        # update_strategy() resets the partition unless one is given with it
+        if "update_strategy" in settings and "partition" not in settings:
+            self._partition = None
+        for key, value in settings.items():
+            setattr(self, "_" + key, value)
+        
+        kubernetes_settings = _KUBERNETES_ONLY_FIELDS.intersection(settings)
+        if kubernetes_settings:
+            if self._kubernetes_methods is None:
+                self._kubernetes_methods = set()
+            self._kubernetes_methods.update(kubernetes_settings)
+        return self
+    
+    @mutator
     def port(self, port: int, name: str = "app", protocol: str = "TCP") -> "StatefulApp":
         """
         Add a port to the application.
@@ -108,6 +206,7 @@ class StatefulApp(BaseBuilder):
         """
         return self.port(port, name, protocol)
     
+    @mutator
     def ports(self, ports: List[Dict[str, Any]]) -> "StatefulApp":
         """
         Set multiple ports for the application.
@@ -127,12 +226,14 @@ class StatefulApp(BaseBuilder):
         Returns:
             StatefulApp: Self for method chaining
         """
-        for port_config in ports:
-            self._ports.append({
+        self._ports.extend(
+            {
                 "containerPort": port_config.get("port"),
                 "name": port_config.get("name", "app"),
                 "protocol": port_config.get("protocol", "TCP")
-            })
+            }
+            for port_config in ports
+        )
         return self
     
     def database_port(self, port: int, name: str = "database") -> "StatefulApp":
@@ -148,110 +249,6 @@ class StatefulApp(BaseBuilder):
         """
         return self.port(port, name, "TCP")
     
-    def postgres_port(self, port: int = 5432, name: str = "postgres") -> "StatefulApp":
-        """
-        Add PostgreSQL port (convenience method).
-        
-        Args:
-            port: PostgreSQL port number (default: 5432)
-            name: Port name (default: "postgres")
-            
-        Returns:
-            StatefulApp: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def mysql_port(self, port: int = 3306, name: str = "mysql") -> "StatefulApp":
-        """
-        Add MySQL port (convenience method).
-        
-        Args:
-            port: MySQL port number (default: 3306)
-            name: Port name (default: "mysql")
-            
-        Returns:
-            StatefulApp: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def redis_port(self, port: int = 6379, name: str = "redis") -> "StatefulApp":
-        """
-        Add Redis port (convenience method).
-        
-        Args:
-            port: Redis port number (default: 6379)
-            name: Port name (default: "redis")
-            
-        Returns:
-            StatefulApp: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def mongodb_port(self, port: int = 27017, name: str = "mongodb") -> "StatefulApp":
-        """
-        Add MongoDB port (convenience method).
-        
-        Args:
-            port: MongoDB port number (default: 27017)
-            name: Port name (default: "mongodb")
-            
-        Returns:
-            StatefulApp: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def elasticsearch_port(self, port: int = 9200, name: str = "elasticsearch") -> "StatefulApp":
-        """
-        Add Elasticsearch port (convenience method).
-        
-        Args:
-            port: Elasticsearch port number (default: 9200)
-            name: Port name (default: "elasticsearch")
-            
-        Returns:
-            StatefulApp: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def kafka_port(self, port: int = 9092, name: str = "kafka") -> "StatefulApp":
-        """
-        Add Kafka port (convenience method).
-        
-        Args:
-            port: Kafka port number (default: 9092)
-            name: Port name (default: "kafka")
-            
-        Returns:
-            StatefulApp: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def metrics_port(self, port: int = 9090, name: str = "metrics") -> "StatefulApp":
-        """
-        Add metrics port (convenience method).
-        
-        Args:
-            port: Metrics port number (default: 9090)
-            name: Port name (default: "metrics")
-            
-        Returns:
-            StatefulApp: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
-    def admin_port(self, port: int = 8080, name: str = "admin") -> "StatefulApp":
-        """
-        Add admin/management port (convenience method).
-        
-        Args:
-            port: Admin port number (default: 8080)
-            name: Port name (default: "admin")
-            
-        Returns:
-            StatefulApp: Self for method chaining
-        """
-        return self.port(port, name, "TCP")
-    
     def cluster_port(self, port: int, name: str = "cluster") -> "StatefulApp":
         """
         Add cluster communication port (convenience method).
@@ -265,6 +262,7 @@ class StatefulApp(BaseBuilder):
         """
         return self.port(port, name, "TCP")
     
+    @mutator
     def environment(self, env_vars: Dict[str, str]) -> "StatefulApp":
         """
         Set environment variables.
@@ -278,6 +276,7 @@ class StatefulApp(BaseBuilder):
         self._environment.update(env_vars)
         return self
     
+    @mutator
     def env(self, key: str, value: str) -> "StatefulApp":
         """
         Add a single environment variable.
@@ -292,6 +291,7 @@ class StatefulApp(BaseBuilder):
         self._environment[key] = value
         return self
     
+    @mutator
     def resources(
         self, 
         cpu: Optional[str] = None,
@@ -313,26 +313,20 @@ class StatefulApp(BaseBuilder):
         Returns:
             StatefulApp: Self for method chaining
         """
-        if cpu or memory:
-            self._resources.setdefault("requests", {})
-            if cpu:
-                self._resources["requests"]["cpu"] = cpu
-            if memory:
-                self._resources["requests"]["memory"] = memory
-        
-        if cpu_limit or memory_limit:
-            self._resources.setdefault("limits", {})
-            if cpu_limit:
-                self._resources["limits"]["cpu"] = cpu_limit
-            if memory_limit:
-                self._resources["limits"]["memory"] = memory_limit
-        
+        requests = {key: value for key, value in (("cpu", cpu), ("memory", memory)) if value}
+        limits = {key: value for key, value in (("cpu", cpu_limit), ("memory", memory_limit)) if value}
         if gpu:
-            self._resources.setdefault("limits", {})
-            self._resources["limits"]["nvidia.com/gpu"] = str(gpu)
+            limits["nvidia.com/gpu"] = str(gpu)
+        
+        # Merge into any previously configured values, one assignment each
+        if requests:
+            self._resources["requests"] = {**self._resources.get("requests", {}), **requests}
+        if limits:
+            self._resources["limits"] = {**self._resources.get("limits", {}), **limits}
         
         return self
     
+    @mutator
     def replicas(self, count: int) -> "StatefulApp":
         """
         Set the number of replicas.
@@ -347,6 +341,7 @@ class StatefulApp(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def storage(
         self, 
         size: str,
@@ -376,6 +371,7 @@ class StatefulApp(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def backup_schedule(self, schedule: str, retention: int = 7) -> "StatefulApp":
         """
         Configure backup schedule.
@@ -392,6 +388,7 @@ class StatefulApp(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def cluster_mode(self, enabled: bool = True) -> "StatefulApp":
         """
         Enable cluster mode for the application.
@@ -406,6 +403,7 @@ class StatefulApp(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def persistence(self, **config) -> "StatefulApp":
         """
         Configure persistence settings.
@@ -420,6 +418,7 @@ class StatefulApp(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def topics(self, topic_list: List[str]) -> "StatefulApp":
         """
         Configure topics for message queue applications.
@@ -434,6 +433,7 @@ class StatefulApp(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def retention_hours(self, hours: int) -> "StatefulApp":
         """
         Set data retention period in hours.
@@ -447,6 +447,7 @@ class StatefulApp(BaseBuilder):
         self._retention_hours = hours
         return self
     
+    @mutator
     def add_companion(self, companion: "Companion") -> "StatefulApp":
         """
         Add a companion container (sidecar or init container).
@@ -460,6 +461,7 @@ class StatefulApp(BaseBuilder):
         self._companions.append(companion)
         return self
     
+    @mutator
     def add_secret(self, secret: "Secret") -> "StatefulApp":
         """
         Add a secret to the application.
@@ -473,6 +475,7 @@ class StatefulApp(BaseBuilder):
         self._secrets.append(secret)
         return self
     
+    @mutator
     def add_secrets(self, secrets: List["Secret"]) -> "StatefulApp":
         """
         Add multiple secrets to the application.
@@ -486,6 +489,7 @@ class StatefulApp(BaseBuilder):
         self._secrets.extend(secrets)
         return self
     
+    @mutator
     def add_config(self, config_map: "ConfigMap") -> "StatefulApp":
         """
         Add a ConfigMap to the application.
@@ -499,6 +503,7 @@ class StatefulApp(BaseBuilder):
         self._config_maps.append(config_map)
         return self
     
+    @mutator
     def add_configs(self, config_maps: List["ConfigMap"]) -> "StatefulApp":
         """
         Add multiple ConfigMaps to the application.
@@ -512,6 +517,7 @@ class StatefulApp(BaseBuilder):
         self._config_maps.extend(config_maps)
         return self
     
+    @mutator
     def lifecycle(self, lifecycle_config: "Lifecycle") -> "StatefulApp":
         """
         Set lifecycle configuration.
@@ -525,6 +531,7 @@ class StatefulApp(BaseBuilder):
         self._lifecycle = lifecycle_config
         return self
     
+    @mutator
     def health(self, health_config: "Health") -> "StatefulApp":
         """
         Set health check configuration.
@@ -538,6 +545,7 @@ class StatefulApp(BaseBuilder):
         self._health = health_config
         return self
     
+    @mutator
     def security_context(self, context: Dict[str, Any]) -> "StatefulApp":
         """
         Set security context.
@@ -551,6 +559,7 @@ class StatefulApp(BaseBuilder):
         self._security_context = context
         return self
     
+    @mutator
     def service_type(self, service_type: str) -> "StatefulApp":
         """
         Set the service type.
@@ -565,6 +574,7 @@ class StatefulApp(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def headless_service(self, enabled: bool = True) -> "StatefulApp":
         """
         Configure headless service.
@@ -579,6 +589,7 @@ class StatefulApp(BaseBuilder):
         return self
     
     @kubernetes_only
+    @mutator
     def update_strategy(self, strategy: str, partition: Optional[int] = None) -> "StatefulApp":
         """
         Set update strategy.
@@ -594,6 +605,48 @@ class StatefulApp(BaseBuilder):
         self._partition = partition
         return self
     
+    def clone(self) -> "StatefulApp":
+        """
+        Create an independent copy of the stateful application.
+        
+        Flat settings are copied field by field rather than deep-copying the
+        whole builder; nested configuration and attached companions,
+        secrets, ConfigMaps, health and lifecycle objects are copied too, so
+        changes to the clone never reach the original.
+        
+        Returns:
+            StatefulApp: Copy of this app, without its render cache
+        """
+        cloned = copy.copy(self)
+        cloned._render_cache = None
+        cloned._labels = dict(self._labels)
+        cloned._annotations = dict(self._annotations)
+        cloned._config = copy.deepcopy(self._config)
+        if self._kubernetes_methods is not None:
+            cloned._kubernetes_methods = set(self._kubernetes_methods)
+        if self._docker_compose_methods is not None:
+            cloned._docker_compose_methods = set(self._docker_compose_methods)
+        if self._format_methods is not None:
+            cloned._format_methods = {
+                output_format: set(methods) for output_format, methods in self._format_methods.items()
+            }
+        
+        cloned._ports = [dict(port) for port in self._ports]
+        cloned._environment = dict(self._environment)
+        cloned._resources = {section: dict(values) for section, values in self._resources.items()}
+        cloned._access_modes = list(self._access_modes)
+        cloned._persistence = copy.deepcopy(self._persistence)
+        cloned._topics = list(self._topics)
+        cloned._security_context = copy.deepcopy(self._security_context)
+        
+        # Attached builders; BaseBuilder.clone() leaves their render caches behind
+        cloned._companions = [_clone_child(companion) for companion in self._companions]
+        cloned._secrets = [_clone_child(secret) for secret in self._secrets]
+        cloned._config_maps = [_clone_child(config_map) for config_map in self._config_maps]
+        cloned._health = _clone_child(self._health)
+        cloned._lifecycle = _clone_child(self._lifecycle)
+        return cloned
+    
     def for_environment(self, environment: str) -> "StatefulApp":
         """
         Create environment-specific configuration.
@@ -608,6 +661,40 @@ class StatefulApp(BaseBuilder):
         cloned.add_label("environment", environment)
         return cloned
     
+    def _render_version(self) -> Optional[Hashable]:
+        """
+        Get the render cache key for the app and the builders its renders embed.
+        
+        Returns:
+            Optional[Hashable]: Versions of the app and its companions, health
+                check, lifecycle, secrets and ConfigMaps, or None if any of
+                them does not track its mutations
+        """
+        embedded = [child for child in (self._health, self._lifecycle) if child is not None]
+        embedded.extend(self._companions)
+        embedded.extend(self._secrets)
+        embedded.extend(self._config_maps)
+        return self._render_version_with(embedded)
+    
+    def _base_metadata(self, name_suffix: str = "") -> Dict[str, Any]:
+        """
+        Build the metadata shared by the app's generated resources.
+        
+        Args:
+            name_suffix: Suffix appended to the app name (e.g., "-backup")
+            
+        Returns:
+            Dict[str, Any]: Resource metadata
+        """
+        metadata = {
+            "name": self._name + name_suffix,
+            "labels": self._labels.copy(),
+            "annotations": self._annotations.copy()
+        }
+        if self._namespace:
+            metadata["namespace"] = self._namespace
+        return metadata
+    
     def generate_kubernetes_resources(self) -> List[Dict[str, Any]]:
         """
         Generate Kubernetes resources for the stateful application.
@@ -615,33 +702,36 @@ class StatefulApp(BaseBuilder):
         Returns:
             List[Dict[str, Any]]: List of Kubernetes resource dictionaries
         """
-        resources = []
+        return list(self.iter_kubernetes_resources())
+    
+    def iter_kubernetes_resources(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the stateful application's Kubernetes resources.
         
-        # Generate StatefulSet
-        statefulset = self._generate_statefulset()
-        resources.append(statefulset)
+        Each resource is rendered only as it is reached, so callers that
+        write resources out one by one can start before the rest are built.
+        The memoized renders are copied, so the resources can be modified.
         
-        # Generate Service
-        service = self._generate_service()
-        resources.append(service)
+        Returns:
+            Iterator[Dict[str, Any]]: Kubernetes resource dictionaries
+        """
+        return map(copy_resource, self._shared_resources())
+    
+    def _shared_resources(self) -> Iterator[Dict[str, Any]]:
+        """Yield the stateful application's resources, sharing the memoized renders."""
+        yield self._generate_statefulset()
+        yield self._generate_service()
         
         # Generate backup CronJob if configured
         if self._backup_schedule:
-            backup_job = self._generate_backup_cronjob()
-            resources.append(backup_job)
-        
-        # Generate ConfigMaps
-        for config_map in self._config_maps:
-            if hasattr(config_map, 'generate_kubernetes_resources'):
-                resources.extend(config_map.generate_kubernetes_resources())
-        
-        # Generate Secrets
-        for secret in self._secrets:
-            if hasattr(secret, 'generate_kubernetes_resources'):
-                resources.extend(secret.generate_kubernetes_resources())
+            yield self._generate_backup_cronjob()
         
-        return resources
+        # Generate ConfigMaps and Secrets
+        if self._config_maps or self._secrets:
+            for child in chain(self._config_maps, self._secrets):
+                yield from child_resources(child)
     
+    @memoize_render
     def _generate_statefulset(self) -> Dict[str, Any]:
         """Generate Kubernetes StatefulSet resource."""
         container = {
@@ -668,35 +758,50 @@ class StatefulApp(BaseBuilder):
                 "mountPath": self._mount_path
             })
         
-        # Add ConfigMap mounts
+        # Mount ConfigMaps and Secrets, collecting their pod volumes in the same pass
+        volumes = []
         for config_map in self._config_maps:
-            if hasattr(config_map, 'mount_path') and config_map.mount_path:
+            mount_path = getattr(config_map, 'mount_path', None)
+            if mount_path:
+                volume_name = f"{config_map.name}-volume"
                 volume_mounts.append({
-                    "name": f"{config_map.name}-volume",
-                    "mountPath": config_map.mount_path,
+                    "name": volume_name,
+                    "mountPath": mount_path,
                     "readOnly": True
                 })
+                volumes.append({
+                    "name": volume_name,
+                    "configMap": {
+                        "name": config_map.name
+                    }
+                })
         
-        # Add Secret mounts
         for secret in self._secrets:
-            if hasattr(secret, 'mount_path') and secret.mount_path:
+            mount_path = getattr(secret, 'mount_path', None)
+            if mount_path:
+                volume_name = f"{secret.name}-volume"
                 volume_mounts.append({
-                    "name": f"{secret.name}-volume",
-                    "mountPath": secret.mount_path,
+                    "name": volume_name,
+                    "mountPath": mount_path,
                     "readOnly": True
                 })
+                volumes.append({
+                    "name": volume_name,
+                    "secret": {
+                        "secretName": secret.name
+                    }
+                })
         
         if volume_mounts:
             container["volumeMounts"] = volume_mounts
         
         # Add health checks
-        if self._health:
-            if hasattr(self._health, 'liveness_probe'):
-                container["livenessProbe"] = self._health.liveness_probe
-            if hasattr(self._health, 'readiness_probe'):
-                container["readinessProbe"] = self._health.readiness_probe
-            if hasattr(self._health, 'startup_probe'):
-                container["startupProbe"] = self._health.startup_probe
+        health = self._health
+        if health is not None:
+            for attr, key in _PROBE_KEYS:
+                probe = getattr(health, attr, None)
+                if probe is not None:
+                    container[key] = probe
         
         # Add lifecycle
         if self._lifecycle:
@@ -707,34 +812,25 @@ class StatefulApp(BaseBuilder):
         if self._security_context:
             container["securityContext"] = self._security_context
         
-        statefulset = {
-            "apiVersion": "apps/v1",
-            "kind": "StatefulSet",
-            "metadata": {
-                "name": self._name,
-                "labels": self._labels,
-                "annotations": self._annotations
+        statefulset = _STATEFULSET_SKELETON.copy()
+        statefulset["metadata"] = self._base_metadata()
+        statefulset["spec"] = {
+            "serviceName": self._name,
+            "replicas": self._replicas,
+            "selector": {
+                "matchLabels": {"app": self._name}
             },
-            "spec": {
-                "serviceName": self._name,
-                "replicas": self._replicas,
-                "selector": {
-                    "matchLabels": {"app": self._name}
+            "template": {
+                "metadata": {
+                    # Own copy, always carrying the label the selector matches
+                    "labels": {**self._labels, "app": self._name}
                 },
-                "template": {
-                    "metadata": {
-                        "labels": self._labels
-                    },
-                    "spec": {
-                        "containers": [container]
-                    }
+                "spec": {
+                    "containers": [container]
                 }
             }
         }
         
-        if self._namespace:
-            statefulset["metadata"]["namespace"] = self._namespace
-        
         # Add update strategy
         update_strategy = {"type": self._update_strategy}
         if self._update_strategy == "RollingUpdate" and self._partition is not None:
@@ -763,123 +859,134 @@ class StatefulApp(BaseBuilder):
             statefulset["spec"]["volumeClaimTemplates"] = [volume_claim_template]
         
         # Add volumes for ConfigMaps and Secrets
-        volumes = []
-        for config_map in self._config_maps:
-            if hasattr(config_map, 'mount_path') and config_map.mount_path:
-                volumes.append({
-                    "name": f"{config_map.name}-volume",
-                    "configMap": {
-                        "name": config_map.name
-                    }
-                })
-        
-        for secret in self._secrets:
-            if hasattr(secret, 'mount_path') and secret.mount_path:
-                volumes.append({
-                    "name": f"{secret.name}-volume",
-                    "secret": {
-                        "secretName": secret.name
-                    }
-                })
-        
         if volumes:
             statefulset["spec"]["template"]["spec"]["volumes"] = volumes
         
+        # Split companions into init and sidecar containers in one pass
+        init_containers = []
+        sidecar_containers = []
+        for companion in self._companions:
+            companion_type = getattr(companion, 'type', None)
+            if companion_type == 'init':
+                init_containers.append(companion.to_dict())
+            elif companion_type == 'sidecar':
+                sidecar_containers.append(companion.to_dict())
+        
         # Add init containers
-        init_containers = [c for c in self._companions if hasattr(c, 'type') and c.type == 'init']
         if init_containers:
-            statefulset["spec"]["template"]["spec"]["initContainers"] = [
-                c.to_dict() for c in init_containers
-            ]
+            statefulset["spec"]["template"]["spec"]["initContainers"] = init_containers
         
         # Add sidecar containers
-        sidecar_containers = [c for c in self._companions if hasattr(c, 'type') and c.type == 'sidecar']
         if sidecar_containers:
-            statefulset["spec"]["template"]["spec"]["containers"].extend([
-                c.to_dict() for c in sidecar_containers
-            ])
+            statefulset["spec"]["template"]["spec"]["containers"].extend(sidecar_containers)
         
         return statefulset
     
+    @memoize_render
     def _generate_service(self) -> Dict[str, Any]:
         """Generate Kubernetes Service resource."""
-        ports = []
-        for port in self._ports:
-            ports.append({
+        ports = [
+            {
                 "name": port["name"],
                 "port": port["containerPort"],
                 "targetPort": port["name"],
                 "protocol": port.get("protocol", "TCP")
-            })
-        
-        service = {
-            "apiVersion": "v1",
-            "kind": "Service",
-            "metadata": {
-                "name": self._name,
-                "labels": self._labels,
-                "annotations": self._annotations
-            },
-            "spec": {
-                "selector": {"app": self._name},
-                "ports": ports,
-                "type": self._service_type
             }
+            for port in self._ports
+        ]
+        
+        service = _SERVICE_SKELETON.copy()
+        service["metadata"] = self._base_metadata()
+        service["spec"] = {
+            "selector": {"app": self._name},
+            "ports": ports,
+            "type": self._service_type
         }
         
         if self._headless_service:
             service["spec"]["clusterIP"] = "None"
         
-        if self._namespace:
-            service["metadata"]["namespace"] = self._namespace
-        
         return service
     
+    @memoize_render
     def _generate_backup_cronjob(self) -> Dict[str, Any]:
         """Generate backup CronJob resource."""
-        cronjob = {
-            "apiVersion": "batch/v1",
-            "kind": "CronJob",
-            "metadata": {
-                "name": f"{self._name}-backup",
-                "labels": self._labels,
-                "annotations": self._annotations
-            },
-            "spec": {
-                "schedule": self._backup_schedule,
-                "successfulJobsHistoryLimit": self._backup_retention,
-                "failedJobsHistoryLimit": 3,
-                "jobTemplate": {
-                    "spec": {
-                        "template": {
-                            "spec": {
-                                "containers": [{
-                                    "name": "backup",
-                                    "image": self._image or "backup-tools:latest",
-                                    "command": [
-                                        "sh", "-c",
-                                        f"backup_tool --source {self._name} --dest /backup/backup-$(date +%Y%m%d).sql"
-                                    ],
-                                    "volumeMounts": [{
-                                        "name": "backup-storage",
-                                        "mountPath": "/backup"
-                                    }]
-                                }],
-                                "volumes": [{
+        cronjob = _CRONJOB_SKELETON.copy()
+        metadata = cronjob["metadata"] = self._base_metadata("-backup")
+        cronjob["spec"] = {
+            "schedule": self._backup_schedule,
+            "successfulJobsHistoryLimit": self._backup_retention,
+            "failedJobsHistoryLimit": 3,
+            "jobTemplate": {
+                "spec": {
+                    "template": {
+                        "spec": {
+                            "containers": [{
+                                "name": "backup",
+                                "image": self._image or "backup-tools:latest",
+                                "command": [
+                                    "sh", "-c",
+                                    f"backup_tool --source {self._name} --dest /backup/backup-$(date +%Y%m%d).sql"
+                                ],
+                                "volumeMounts": [{
                                     "name": "backup-storage",
-                                    "persistentVolumeClaim": {
-                                        "claimName": f"{self._name}-backup"
-                                    }
-                                }],
-                                "restartPolicy": "OnFailure"
-                            }
+                                    "mountPath": "/backup"
+                                }]
+                            }],
+                            "volumes": [{
+                                "name": "backup-storage",
+                                "persistentVolumeClaim": {
+                                    "claimName": metadata["name"]
+                                }
+                            }],
+                            "restartPolicy": "OnFailure"
                         }
                     }
                 }
             }
         }
         
-        if self._namespace:
-            cronjob["metadata"]["namespace"] = self._namespace
+        return cronjob 
+
+
+def _clone_child(child: Any) -> Any:
+    """Copy a builder attached to a StatefulApp, using its own clone() if it has one."""
+    return child.clone() if isinstance(child, BaseBuilder) else copy.deepcopy(child)
+
+
+# Convenience port methods: method name -> (default port, default name, label)
+_PORT_PRESETS = {
+    "postgres_port": (5432, "postgres", "PostgreSQL"),
+    "mysql_port": (3306, "mysql", "MySQL"),
+    "redis_port": (6379, "redis", "Redis"),
+    "mongodb_port": (27017, "mongodb", "MongoDB"),
+    "elasticsearch_port": (9200, "elasticsearch", "Elasticsearch"),
+    "kafka_port": (9092, "kafka", "Kafka"),
+    "metrics_port": (9090, "metrics", "metrics"),
+    "admin_port": (8080, "admin", "admin/management"),
+}
+
+
+def _make_port_preset(method_name: str, default_port: int, default_name: str, label: str):
+    """Build a convenience method that adds a TCP port with preset defaults."""
+    def preset(self, port: int = default_port, name: str = default_name) -> "StatefulApp":
+        return self.port(port, name, "TCP")
+
+    preset.__name__ = method_name
+    preset.__qualname__ = f"StatefulApp.{method_name}"
+    preset.__doc__ = f"""
+        Add {label} port (convenience method).
         
-        return cronjob 
\ No newline at end of file
+        Args:
+            port: {label} port number (default: {default_port})
+            name: Port name (default: "{default_name}")
+            
+        Returns:
+            StatefulApp: Self for method chaining
+        """
+    return preset
+
+
+for _method_name, _preset in _PORT_PRESETS.items():
+    setattr(StatefulApp, _method_name, _make_port_preset(_method_name, *_preset))
+del _method_name, _preset
@@ -1,17 +1,36 @@
 """Networking module for Celestraa DSL."""
 
-from .service import Service
-from .ingress import Ingress
-from .companion import Companion
-from .scaling import Scaling
-from .health import Health
-from .network_policy import NetworkPolicy
+import importlib
+
+# Public name -> submodule defining it; loaded on first attribute access
+_LAZY_IMPORTS = {
+    "Service": ".service",
+    "Ingress": ".ingress",
+    "Companion": ".companion",
+    "Scaling": ".scaling",
+    "Health": ".health",
+    "NetworkPolicy": ".network_policy",
+}
 
 __all__ = [
-    "Service", 
-    "Ingress", 
-    "Companion", 
-    "Scaling", 
-    "Health", 
+    "Service",
+    "Ingress",
+    "Companion",
+    "Scaling",
+    "Health",
     "NetworkPolicy"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a networking builder from its submodule on first use."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
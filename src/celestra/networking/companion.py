@@ -5,7 +5,12 @@ This module contains the Companion class for managing sidecar containers
 and init containers that support the main application.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Hashable, List, Any, Optional, Tuple, Union
+
+
+# Accepted values for the container type and image pull policy
+_CONTAINER_TYPES = frozenset({"sidecar", "init"})
+_PULL_POLICIES = frozenset({"Always", "IfNotPresent", "Never"})
 
 
 class Companion:
@@ -31,6 +36,26 @@ class Companion:
         ```
     """
     
+    __slots__ = (
+        "name",
+        "type",
+        "_image",
+        "_command",
+        "_args",
+        "_environment",
+        "_resources",
+        "_volume_mounts",
+        "_ports",
+        "_security_context",
+        "_working_dir",
+        "_restart_policy",
+        "_image_pull_policy",
+        "_stdin",
+        "_tty",
+        "_version",
+        "_dict_cache",
+    )
+    
     def __init__(self, name: str, container_type: str = "sidecar"):
         """
         Initialize the Companion builder.
@@ -39,24 +64,54 @@ class Companion:
             name: Name of the companion container
             container_type: Type of container ("sidecar" or "init")
         """
-        if container_type not in ["sidecar", "init"]:
+        if container_type not in _CONTAINER_TYPES:
             raise ValueError("Container type must be 'sidecar' or 'init'")
         
         self.name = name
         self.type = container_type
         self._image: Optional[str] = None
-        self._command: List[str] = []
-        self._args: List[str] = []
-        self._environment: Dict[str, str] = {}
-        self._resources: Dict[str, Any] = {}
-        self._volume_mounts: List[Dict[str, Any]] = []
-        self._ports: List[Dict[str, Any]] = []
+        # Collections are allocated by the first builder call that fills them
+        self._command: Optional[List[str]] = None
+        self._args: Optional[List[str]] = None
+        self._environment: Optional[Dict[str, str]] = None
+        self._resources: Optional[Dict[str, Any]] = None
+        self._volume_mounts: Optional[List[Dict[str, Any]]] = None
+        self._ports: Optional[List[Dict[str, Any]]] = None
         self._security_context: Optional[Dict[str, Any]] = None
         self._working_dir: Optional[str] = None
         self._restart_policy: Optional[str] = None
         self._image_pull_policy: str = "IfNotPresent"
         self._stdin: bool = False
         self._tty: bool = False
+        # Bumped by every builder method; see _render_version()
+        self._version: int = 0
+        # (render version, spec) from the last to_dict()
+        self._dict_cache: Optional[Tuple[Hashable, Dict[str, Any]]] = None
+    
+    def _render_version(self) -> Hashable:
+        """
+        Get the key that changes whenever to_dict() output may change.
+        
+        Covers the builder methods and direct assignment of ``name`` or
+        ``type``, so builders that embed this companion can cache their
+        renders against it.
+        
+        Returns:
+            Hashable: Render cache key
+        """
+        return (self._version, self.name, self.type)
+    
+    @property
+    def container_type(self) -> str:
+        """Get the container type ("sidecar" or "init")."""
+        return self.type
+    
+    @container_type.setter
+    def container_type(self, container_type: str) -> None:
+        """Set the container type ("sidecar" or "init")."""
+        if container_type not in _CONTAINER_TYPES:
+            raise ValueError("Container type must be 'sidecar' or 'init'")
+        self.type = container_type
     
     def image(self, image: str) -> "Companion":
         """
@@ -69,6 +124,7 @@ class Companion:
             Companion: Self for method chaining
         """
         self._image = image
+        self._version += 1
         return self
     
     def command(self, command: List[str]) -> "Companion":
@@ -82,6 +138,7 @@ class Companion:
             Companion: Self for method chaining
         """
         self._command = command
+        self._version += 1
         return self
     
     def args(self, args: List[str]) -> "Companion":
@@ -95,6 +152,7 @@ class Companion:
             Companion: Self for method chaining
         """
         self._args = args
+        self._version += 1
         return self
     
     def environment(self, env_vars: Dict[str, str]) -> "Companion":
@@ -107,7 +165,10 @@ class Companion:
         Returns:
             Companion: Self for method chaining
         """
+        if self._environment is None:
+            self._environment = {}
         self._environment.update(env_vars)
+        self._version += 1
         return self
     
     def env(self, key: str, value: str) -> "Companion":
@@ -121,7 +182,10 @@ class Companion:
         Returns:
             Companion: Self for method chaining
         """
+        if self._environment is None:
+            self._environment = {}
         self._environment[key] = value
+        self._version += 1
         return self
     
     def resources(
@@ -143,6 +207,8 @@ class Companion:
         Returns:
             Companion: Self for method chaining
         """
+        if self._resources is None:
+            self._resources = {}
         if cpu or memory:
             self._resources.setdefault("requests", {})
             if cpu:
@@ -157,6 +223,7 @@ class Companion:
             if memory_limit:
                 self._resources["limits"]["memory"] = memory_limit
         
+        self._version += 1
         return self
     
     def mount_volume(self, volume_name: str, mount_path: str, read_only: bool = False) -> "Companion":
@@ -171,11 +238,14 @@ class Companion:
         Returns:
             Companion: Self for method chaining
         """
+        if self._volume_mounts is None:
+            self._volume_mounts = []
         self._volume_mounts.append({
             "name": volume_name,
             "mountPath": mount_path,
             "readOnly": read_only
         })
+        self._version += 1
         return self
     
     def port(self, port: int, name: str = "http", protocol: str = "TCP") -> "Companion":
@@ -190,11 +260,14 @@ class Companion:
         Returns:
             Companion: Self for method chaining
         """
+        if self._ports is None:
+            self._ports = []
         self._ports.append({
             "containerPort": port,
             "name": name,
             "protocol": protocol
         })
+        self._version += 1
         return self
     
     def security_context(self, context: Dict[str, Any]) -> "Companion":
@@ -208,6 +281,7 @@ class Companion:
             Companion: Self for method chaining
         """
         self._security_context = context
+        self._version += 1
         return self
     
     def working_directory(self, workdir: str) -> "Companion":
@@ -221,6 +295,7 @@ class Companion:
             Companion: Self for method chaining
         """
         self._working_dir = workdir
+        self._version += 1
         return self
     
     def image_pull_policy(self, policy: str) -> "Companion":
@@ -233,9 +308,10 @@ class Companion:
         Returns:
             Companion: Self for method chaining
         """
-        if policy not in ["Always", "IfNotPresent", "Never"]:
+        if policy not in _PULL_POLICIES:
             raise ValueError("Image pull policy must be 'Always', 'IfNotPresent', or 'Never'")
         self._image_pull_policy = policy
+        self._version += 1
         return self
     
     def stdin(self, enabled: bool = True) -> "Companion":
@@ -249,6 +325,7 @@ class Companion:
             Companion: Self for method chaining
         """
         self._stdin = enabled
+        self._version += 1
         return self
     
     def tty(self, enabled: bool = True) -> "Companion":
@@ -262,6 +339,7 @@ class Companion:
             Companion: Self for method chaining
         """
         self._tty = enabled
+        self._version += 1
         return self
     
     # Pre-built companion configurations
@@ -451,9 +529,17 @@ class Companion:
         """
         Convert companion configuration to dictionary for Kubernetes spec.
         
+        The spec is reused until a builder method changes the companion or
+        its name or type is reassigned, so treat it as read-only.
+        
         Returns:
             Dict[str, Any]: Container specification
         """
+        version = self._render_version()
+        cached = self._dict_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
         container_spec = {
             "name": self.name,
             "image": self._image or "busybox:latest"
@@ -501,4 +587,5 @@ class Companion:
         if self._tty:
             container_spec["tty"] = self._tty
         
+        self._dict_cache = (version, container_spec)
         return container_spec 
\ No newline at end of file
@@ -50,6 +50,37 @@ class Ingress(BaseBuilder):
         self._rules[-1]["http"]["paths"].append(path_config)
         return self
     
+    @kubernetes_only
+    def paths(self, paths: List[Dict[str, Any]]) -> "Ingress":
+        """
+        Add several paths to the ingress at once.
+        
+        Args:
+            paths: Path configurations with 'path', 'service_name',
+                'service_port' and optional 'path_type' (default: "Prefix")
+            
+        Returns:
+            Ingress: Self for method chaining
+        """
+        # Add to the last rule or create a new one
+        if not self._rules:
+            self._rules.append({"http": {"paths": []}})
+        
+        self._rules[-1]["http"]["paths"].extend(
+            {
+                "path": path_config["path"],
+                "pathType": path_config.get("path_type", "Prefix"),
+                "backend": {
+                    "service": {
+                        "name": path_config["service_name"],
+                        "port": {"number": path_config["service_port"]}
+                    }
+                }
+            }
+            for path_config in paths
+        )
+        return self
+    
     @kubernetes_only
     def tls(self, secret_name: str, hosts: List[str]) -> "Ingress":
         """Add TLS configuration."""
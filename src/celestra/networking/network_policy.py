@@ -88,6 +88,24 @@ class NetworkPolicy(BaseBuilder):
             }
         return self
     
+    def exclude_services(self, service_names: List[str]) -> "NetworkPolicy":
+        """
+        Narrow the current pod selector to leave out specific services.
+        
+        Args:
+            service_names: List of service names to exclude
+            
+        Returns:
+            NetworkPolicy: Self for method chaining
+        """
+        expressions = self._pod_selector.setdefault("matchExpressions", [])
+        expressions.append({
+            "key": "app",
+            "operator": "NotIn",
+            "values": service_names
+        })
+        return self
+    
     def deny_all_ingress(self) -> "NetworkPolicy":
         """
         Deny all ingress traffic (default deny).
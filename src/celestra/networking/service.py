@@ -31,6 +31,29 @@ class Service(BaseBuilder):
         })
         return self
     
+    @kubernetes_only
+    def add_ports(self, ports: List[Dict[str, Any]]) -> "Service":
+        """
+        Add several ports to the service at once.
+        
+        Args:
+            ports: Port configurations with 'name', 'port', and optional
+                'target_port' (defaults to 'port') and 'protocol'
+            
+        Returns:
+            Service: Self for method chaining
+        """
+        self._ports.extend(
+            {
+                "name": port_config["name"],
+                "port": port_config["port"],
+                "targetPort": port_config.get("target_port", port_config["port"]),
+                "protocol": port_config.get("protocol", "TCP")
+            }
+            for port_config in ports
+        )
+        return self
+    
     @kubernetes_only
     def type(self, service_type: str) -> "Service":
         """Set the service type."""
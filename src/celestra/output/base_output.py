@@ -6,10 +6,10 @@ for all output format implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Set, Union
 from pathlib import Path
 
-from ..utils.helpers import ensure_directory
+from ..utils.helpers import as_path, ensure_directory
 
 
 class OutputFormat(ABC):
@@ -23,6 +23,9 @@ class OutputFormat(ABC):
     def __init__(self):
         """Initialize the output format."""
         self._options: Dict[str, Any] = {}
+        # Directories created by _ensure_output_directory(); files written
+        # straight into them skip the per-file mkdir in write_file()
+        self._ensured_dirs: Set[Path] = set()
     
     def set_option(self, key: str, value: Any) -> "OutputFormat":
         """
@@ -86,7 +89,9 @@ class OutputFormat(ABC):
         Returns:
             Path: Path object
         """
-        return ensure_directory(path)
+        path_obj = ensure_directory(path)
+        self._ensured_dirs.add(path_obj)
+        return path_obj
     
     def _write_file(self, path: Union[str, Path], content: str) -> None:
         """
@@ -96,8 +101,13 @@ class OutputFormat(ABC):
             path: File path
             content: Content to write
         """
+        path_obj = as_path(path)
+        if path_obj.parent in self._ensured_dirs:
+            path_obj.write_text(content)
+            return
+        
         from ..utils.helpers import write_file
-        write_file(path, content)
+        write_file(path_obj, content)
     
     def _format_filename(self, name: str, extension: str) -> str:
         """
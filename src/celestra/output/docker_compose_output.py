@@ -11,6 +11,7 @@ import subprocess
 import os
 
 from .base_output import OutputFormat
+from ..utils.helpers import as_path
 from ..utils.decorators import docker_compose_only
 
 
@@ -69,7 +70,7 @@ class DockerComposeOutput(OutputFormat):
         compose_config = self._convert_builder_to_compose(builder)
         
         # Create output directory if needed
-        output_path = Path(output_file)
+        output_path = as_path(output_file)
         self._ensure_output_directory(output_path.parent)
         
         # Generate main compose file
@@ -84,7 +85,7 @@ class DockerComposeOutput(OutputFormat):
         if override_files:
             for env_name, override_path in override_files.items():
                 override_config = self._generate_override_config(builder, env_name)
-                self._write_compose_file(override_config, Path(override_path))
+                self._write_compose_file(override_config, as_path(override_path))
         
         print(f"Generated Docker Compose file: {output_path}")
         self._update_last_compose_file(output_path)
@@ -247,7 +248,7 @@ class DockerComposeOutput(OutputFormat):
         """Get port mappings for a service."""
         ports = []
         
-        if hasattr(service, '_ports'):
+        if getattr(service, '_ports', None):
             for port_config in service._ports:
                 container_port = port_config.get("containerPort", port_config.get("port", 80))
                 
@@ -266,11 +267,11 @@ class DockerComposeOutput(OutputFormat):
         environment = {}
         
         # Direct environment variables
-        if hasattr(service, '_environment'):
+        if getattr(service, '_environment', None):
             environment.update(service._environment)
         
         # Environment from secrets (simplified for Docker Compose)
-        if hasattr(service, '_secrets'):
+        if getattr(service, '_secrets', None):
             for secret in service._secrets:
                 if hasattr(secret, '_string_data'):
                     for key, value in secret._string_data.items():
@@ -278,7 +279,7 @@ class DockerComposeOutput(OutputFormat):
                         environment[env_key] = value
         
         # Environment from config maps
-        if hasattr(service, '_config_maps'):
+        if getattr(service, '_config_maps', None):
             for config_map in service._config_maps:
                 if hasattr(config_map, '_data'):
                     for key, value in config_map._data.items():
@@ -298,14 +299,14 @@ class DockerComposeOutput(OutputFormat):
             volumes.append(f"{volume_name}:{mount_path}")
         
         # ConfigMap volumes
-        if hasattr(service, '_config_maps'):
+        if getattr(service, '_config_maps', None):
             for config_map in service._config_maps:
                 if hasattr(config_map, '_mount_path') and config_map._mount_path:
                     volume_name = f"{config_map.name}-config"
                     volumes.append(f"./{config_map.name}:{config_map._mount_path}:ro")
         
         # Secret volumes (for development only)
-        if hasattr(service, '_secrets'):
+        if getattr(service, '_secrets', None):
             for secret in service._secrets:
                 if hasattr(secret, '_mount_path') and secret._mount_path:
                     volume_name = f"{secret.name}-secret"
@@ -523,7 +524,7 @@ class DockerComposeOutput(OutputFormat):
         env_vars = []
         
         # Extract environment variables from the builder
-        if hasattr(builder, '_environment'):
+        if getattr(builder, '_environment', None):
             for key, value in builder._environment.items():
                 env_vars.append(f"{key}={value}")
         
@@ -783,7 +784,7 @@ class DockerComposeOutput(OutputFormat):
             ValueError: If no compose file path is available
         """
         if compose_file:
-            return Path(compose_file)
+            return as_path(compose_file)
         elif self._last_compose_file:
             return self._last_compose_file
         else:
@@ -849,4 +850,4 @@ class DockerComposeOutput(OutputFormat):
         Args:
             compose_file: Path to the compose file
         """
-        self._last_compose_file = Path(compose_file) 
\ No newline at end of file
+        self._last_compose_file = as_path(compose_file) 
\ No newline at end of file
@@ -6,15 +6,15 @@ and proper chart structure following Helm best practices.
 """
 
 import os
-import yaml
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 from .base_output import OutputFormat
+from ..utils.helpers import as_path, format_yaml
 
 
 class HelmOutput(OutputFormat):
     
-    def generate(self, output_dir: str) -> None:
+    def generate(self, output_dir: Union[str, Path]) -> None:
         """Generate method required by OutputFormat base class."""
         return self.generate_files(output_dir)
     """
@@ -375,14 +375,14 @@ class HelmOutput(OutputFormat):
         self.add_values_override("image.pullPolicy", pull_policy)
         return self
     
-    def generate_files(self, output_dir: str) -> None:
+    def generate_files(self, output_dir: Union[str, Path]) -> None:
         """
         Generate Helm chart files.
         
         Args:
             output_dir: Output directory path
         """
-        chart_dir = Path(output_dir) / self._name
+        chart_dir = as_path(output_dir) / self._name
         chart_dir.mkdir(parents=True, exist_ok=True)
         
         # Create chart structure
@@ -436,7 +436,7 @@ class HelmOutput(OutputFormat):
             chart_yaml["dependencies"] = self._dependencies
         
         with open(chart_dir / "Chart.yaml", "w") as f:
-            yaml.dump(chart_yaml, f, default_flow_style=False, sort_keys=False)
+            f.write(format_yaml(chart_yaml))
     
     def _generate_values_yaml(self, chart_dir: Path) -> None:
         """Generate values.yaml file."""
@@ -444,7 +444,7 @@ class HelmOutput(OutputFormat):
         values = self._merge_dictionaries(self._default_values, self._values_overrides)
         
         with open(chart_dir / "values.yaml", "w") as f:
-            yaml.dump(values, f, default_flow_style=False, sort_keys=False)
+            f.write(format_yaml(values))
     
     def _generate_templates(self, chart_dir: Path) -> None:
         """Generate basic template files."""
@@ -749,7 +749,7 @@ Create the name of the service account to use
         filename = f"{kind}-{resource.get('metadata', {}).get('name', 'resource')}.yaml"
         
         with open(templates_dir / filename, "w") as f:
-            yaml.dump(resource, f, default_flow_style=False, sort_keys=False)
+            f.write(format_yaml(resource))
     
     def _generate_requirements_yaml(self, chart_dir: Path) -> None:
         """Generate requirements.yaml for Helm v2 compatibility."""
@@ -758,7 +758,7 @@ Create the name of the service account to use
         }
         
         with open(chart_dir / "requirements.yaml", "w") as f:
-            yaml.dump(requirements, f, default_flow_style=False, sort_keys=False)
+            f.write(format_yaml(requirements))
     
     def _generate_notes(self, chart_dir: Path) -> None:
         """Generate NOTES.txt file."""
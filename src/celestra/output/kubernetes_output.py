@@ -12,6 +12,7 @@ import os
 
 from .base_output import FileOutputFormat
 from ..utils.decorators import show_format_warnings, kubernetes_only
+from ..utils.helpers import as_path
 
 
 class KubernetesOutput(FileOutputFormat):
@@ -680,7 +681,7 @@ class KubernetesOutput(FileOutputFormat):
             ValueError: If no resources directory path is available
         """
         if resources_dir:
-            return Path(resources_dir)
+            return as_path(resources_dir)
         elif self._last_output_dir:
             return self._last_output_dir
         else:
@@ -791,4 +792,4 @@ class KubernetesOutput(FileOutputFormat):
         Args:
             output_dir: Path to the output directory
         """
-        self._last_output_dir = Path(output_dir) 
\ No newline at end of file
+        self._last_output_dir = as_path(output_dir) 
\ No newline at end of file
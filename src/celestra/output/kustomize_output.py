@@ -10,11 +10,12 @@ import yaml
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 from .base_output import OutputFormat
+from ..utils.helpers import as_path, format_yaml
 
 
 class KustomizeOutput(OutputFormat):
     
-    def generate(self, output_dir: str) -> None:
+    def generate(self, output_dir: Union[str, Path]) -> None:
         """Generate method required by OutputFormat base class."""
         return self.generate_files(output_dir)
     """
@@ -423,14 +424,15 @@ class KustomizeOutput(OutputFormat):
             .add_prefix("prod-")
             .add_replica_patch("app", 5))
     
-    def generate_files(self, output_dir: str) -> None:
+    def generate_files(self, output_dir: Union[str, Path]) -> None:
         """
         Generate Kustomize files.
         
         Args:
             output_dir: Output directory path
         """
-        base_dir = Path(output_dir) / "base"
+        output_dir = as_path(output_dir)
+        base_dir = output_dir / "base"
         base_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate base resources
@@ -441,7 +443,7 @@ class KustomizeOutput(OutputFormat):
         
         # Generate overlays
         for overlay_name, overlay in self._overlays.items():
-            overlay_dir = Path(output_dir) / "overlays" / overlay_name
+            overlay_dir = output_dir / "overlays" / overlay_name
             overlay_dir.mkdir(parents=True, exist_ok=True)
             overlay._generate_overlay(overlay_dir, "../../../base")
         
@@ -460,17 +462,19 @@ class KustomizeOutput(OutputFormat):
                 filename = f"{kind}-{name}.yaml"
                 
                 with open(base_dir / filename, "w") as f:
-                    yaml.dump(k8s_resource, f, default_flow_style=False, sort_keys=False)
+                    f.write(format_yaml(k8s_resource))
     
     def _generate_base_kustomization(self, base_dir: Path) -> None:
         """Generate base kustomization.yaml."""
         kustomization = {"apiVersion": "kustomize.config.k8s.io/v1beta1", "kind": "Kustomization"}
         
-        # Add resources
-        resources = []
-        for resource_file in base_dir.glob("*.yaml"):
-            if resource_file.name != "kustomization.yaml":
-                resources.append(resource_file.name)
+        # Add resources, listing the base directory in a single scandir pass
+        with os.scandir(base_dir) as entries:
+            resources = [
+                entry.name for entry in entries
+                if entry.name.endswith(".yaml") and not entry.name.startswith(".")
+                and entry.name != "kustomization.yaml"
+            ]
         
         if resources:
             kustomization["resources"] = sorted(resources)
@@ -531,7 +535,7 @@ class KustomizeOutput(OutputFormat):
             kustomization["transformers"] = self._transformers
         
         with open(base_dir / "kustomization.yaml", "w") as f:
-            yaml.dump(kustomization, f, default_flow_style=False, sort_keys=False)
+            f.write(format_yaml(kustomization))
     
     def _generate_overlay(self, overlay_dir: Path, base_path: str) -> None:
         """Generate overlay kustomization."""
@@ -576,7 +580,7 @@ class KustomizeOutput(OutputFormat):
         self._generate_patches(overlay_dir)
         
         with open(overlay_dir / "kustomization.yaml", "w") as f:
-            yaml.dump(kustomization, f, default_flow_style=False, sort_keys=False)
+            f.write(format_yaml(kustomization))
     
     def _generate_patches(self, output_dir: Path) -> None:
         """Generate patch files."""
@@ -585,4 +589,4 @@ class KustomizeOutput(OutputFormat):
             patch_content = patch["content"]
             
             with open(output_dir / patch_file, "w") as f:
-                yaml.dump(patch_content, f, default_flow_style=False, sort_keys=False) 
\ No newline at end of file
+                f.write(format_yaml(patch_content)) 
\ No newline at end of file
@@ -10,11 +10,12 @@ import json
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 from .base_output import OutputFormat
+from ..utils.helpers import as_path
 
 
 class TerraformOutput(OutputFormat):
     
-    def generate(self, output_dir: str) -> None:
+    def generate(self, output_dir: Union[str, Path]) -> None:
         """Generate method required by OutputFormat base class."""
         return self.generate_files(output_dir)
     """
@@ -321,14 +322,14 @@ class TerraformOutput(OutputFormat):
             "Container image"
         )
     
-    def generate_files(self, output_dir: str) -> None:
+    def generate_files(self, output_dir: Union[str, Path]) -> None:
         """
         Generate Terraform module files.
         
         Args:
             output_dir: Output directory path
         """
-        module_dir = Path(output_dir)
+        module_dir = as_path(output_dir)
         module_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate main.tf
@@ -13,6 +13,11 @@ from pathlib import Path
 from ..core.base_builder import BaseBuilder
 
 
+# Builder bookkeeping derived from other state; never serialized
+_INTERNAL_STATE = frozenset({
+    "_version", "_render_cache", "_env_cache", "_service_index", "_dependencies_applied_at"
+})
+
 # Global cache for discovered classes - initialized once
 _CLASS_MAP: Dict[str, Type[BaseBuilder]] = None
 
@@ -89,6 +94,8 @@ def serialize(obj: Any) -> str:
     for attr_name in dir(obj):
         if (attr_name.startswith('_') and 
             not attr_name.startswith('__') and 
+            not attr_name.isupper() and  # class-level constants such as _PROBES
+            attr_name not in _INTERNAL_STATE and
             not callable(getattr(obj, attr_name))):
             
             try:
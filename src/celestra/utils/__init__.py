@@ -8,6 +8,7 @@ __all__ = [
     "merge_dicts",
     "format_yaml",
     "format_json",
+    "format_json_bytes",
     "generate_labels",
     "generate_annotations"
 ] 
\ No newline at end of file
@@ -7,7 +7,7 @@ output formats or deployment targets.
 
 import functools
 import warnings
-from typing import Set, Callable, Any, List
+from typing import Set, Callable, Any, Dict, List, Optional
 
 
 def docker_compose_only(func: Callable) -> Callable:
@@ -28,7 +28,7 @@ def docker_compose_only(func: Callable) -> Callable:
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         # Mark this instance as having Docker Compose-specific config
-        if not hasattr(self, '_docker_compose_methods'):
+        if getattr(self, '_docker_compose_methods', None) is None:
             self._docker_compose_methods = set()
         self._docker_compose_methods.add(func.__name__)
         
@@ -54,7 +54,7 @@ def kubernetes_only(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        if not hasattr(self, '_kubernetes_methods'):
+        if getattr(self, '_kubernetes_methods', None) is None:
             self._kubernetes_methods = set()
         self._kubernetes_methods.add(func.__name__)
         
@@ -82,7 +82,7 @@ def output_formats(*formats: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            if not hasattr(self, '_format_methods'):
+            if getattr(self, '_format_methods', None) is None:
                 self._format_methods = {}
             self._format_methods[func.__name__] = set(formats)
             
@@ -95,6 +95,159 @@ def output_formats(*formats: str) -> Callable:
     return decorator
 
 
+def mutator(func: Callable) -> Callable:
+    """
+    Decorator to mark builder methods that change rendered output.
+    
+    Each call bumps the builder's version so renders memoized with
+    ``memoize_render`` are recomputed on next use.
+    
+    Example:
+        ```python
+        @mutator
+        def replicas(self, count: int):
+            self._replicas = count
+            return self
+        ```
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._version += 1
+        return func(self, *args, **kwargs)
+    
+    return wrapper
+
+
+def memoize_render(func: Callable) -> Callable:
+    """
+    Decorator to memoize a builder's render method until the next mutation.
+    
+    The result is cached per builder and reused while the builder's
+    ``_render_version()`` is unchanged; builders that return None are
+    rendered on every call. Callers must treat the returned resource as
+    read-only; public methods such as ``generate_kubernetes_resources()``
+    hand out copies (see ``core.base_builder.copy_resource``). Builders whose renders embed nested builders include those
+    in ``_render_version()`` so that changing a child invalidates the cache.
+    
+    Example:
+        ```python
+        @memoize_render
+        def _generate_service(self):
+            return {...}
+        ```
+    """
+    # Qualified name, so an override and the super() method it calls keep separate entries
+    key = func.__qualname__
+    
+    @functools.wraps(func)
+    def wrapper(self):
+        version = self._render_version()
+        if version is None:
+            return func(self)
+        
+        cache = self._render_cache
+        if cache is None:
+            cache = self._render_cache = {}
+        
+        cached = cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        result = func(self)
+        # Rendering may itself touch nested builders (AppGroup applies
+        # service dependencies), so key the result on the state it left
+        cache[key] = (self._render_version(), result)
+        return result
+    
+    return wrapper
+
+
+def memoize_validation(func: Callable) -> Callable:
+    """
+    Decorator to memoize a builder's validate() until the next mutation.
+    
+    Works like ``memoize_render`` but hands each caller its own copy of the
+    error list, since validate() overrides extend the list from super().
+    
+    Example:
+        ```python
+        @memoize_validation
+        def validate(self) -> List[str]:
+            errors = super().validate()
+            ...
+            return errors
+        ```
+    """
+    cached_validate = memoize_render(func)
+    
+    @functools.wraps(func)
+    def wrapper(self):
+        return list(cached_validate(self))
+    
+    return wrapper
+
+
+# Format-restricted methods of each class specialized by specialize_for_format()
+_FORMAT_RESTRICTED: Dict[type, Dict[str, Callable]] = {}
+
+
+def specialize_for_format(cls: type, output_format: Optional[str]) -> None:
+    """
+    Rebind a class's format-restricted methods for a single output format.
+    
+    Methods decorated for ``output_format`` are replaced by their undecorated
+    implementation, skipping the per-call usage tracking; methods for other
+    formats are replaced by stubs that raise ValueError. Only methods defined
+    directly on ``cls`` are affected.
+    
+    Args:
+        cls: Builder class to specialize
+        output_format: Target output format, or None to restore the decorated methods
+    """
+    restricted = _FORMAT_RESTRICTED.get(cls)
+    if restricted is None:
+        restricted = _FORMAT_RESTRICTED[cls] = {
+            name: attr for name, attr in vars(cls).items()
+            if hasattr(attr, '_output_formats') and hasattr(attr, '__wrapped__')
+        }
+    
+    for name, decorated in restricted.items():
+        if output_format is None:
+            setattr(cls, name, decorated)
+        elif output_format in decorated._output_formats:
+            setattr(cls, name, decorated.__wrapped__)
+        else:
+            setattr(cls, name, _unsupported_method(decorated, output_format))
+
+
+def _unsupported_method(decorated: Callable, output_format: str) -> Callable:
+    """Build a stub for a method that does not apply to ``output_format``."""
+    @functools.wraps(decorated.__wrapped__)
+    def stub(self, *args, **kwargs):
+        raise ValueError(
+            f"Method '{decorated.__name__}()' only supports: "
+            f"{', '.join(decorated._output_formats)}, not {output_format}"
+        )
+    
+    return stub
+
+
+@functools.lru_cache(maxsize=None)
+def _method_warning(method: str, output_format: str, supported: Optional[tuple] = None) -> str:
+    """Build the warning for one method used with an output format it does not support."""
+    if supported is not None:
+        return (
+            f"⚠️  Method '{method}()' only supports: {', '.join(supported)}. "
+            f"Will be ignored in {output_format} output."
+        )
+    if output_format == 'kubernetes':
+        return (
+            f"⚠️  Method '{method}()' is Docker Compose-specific and will be ignored in Kubernetes output. "
+            f"For Kubernetes, use 'port()' + 'Service' instead of 'port_mapping()'."
+        )
+    return f"⚠️  Method '{method}()' is Kubernetes-specific and will be ignored in Docker Compose output."
+
+
 def format_warning(builder, output_format: str) -> List[str]:
     """
     Generate warnings for methods that don't apply to the specified output format.
@@ -109,27 +262,21 @@ def format_warning(builder, output_format: str) -> List[str]:
     warnings_list = []
     
     # Check Docker Compose-only methods used with Kubernetes
-    if output_format == 'kubernetes' and hasattr(builder, '_docker_compose_methods'):
+    if output_format == 'kubernetes' and getattr(builder, '_docker_compose_methods', None):
         for method in builder._docker_compose_methods:
-            warnings_list.append(
-                f"⚠️  Method '{method}()' is Docker Compose-specific and will be ignored in Kubernetes output. "
-                f"For Kubernetes, use 'port()' + 'Service' instead of 'port_mapping()'."
-            )
+            warnings_list.append(_method_warning(method, output_format))
     
     # Check Kubernetes-only methods used with Docker Compose
-    if output_format == 'docker-compose' and hasattr(builder, '_kubernetes_methods'):
+    if output_format == 'docker-compose' and getattr(builder, '_kubernetes_methods', None):
         for method in builder._kubernetes_methods:
-            warnings_list.append(
-                f"⚠️  Method '{method}()' is Kubernetes-specific and will be ignored in Docker Compose output."
-            )
+            warnings_list.append(_method_warning(method, output_format))
     
     # Check format-specific methods
-    if hasattr(builder, '_format_methods'):
+    if getattr(builder, '_format_methods', None):
         for method, supported_formats in builder._format_methods.items():
             if output_format not in supported_formats:
                 warnings_list.append(
-                    f"⚠️  Method '{method}()' only supports: {', '.join(supported_formats)}. "
-                    f"Will be ignored in {output_format} output."
+                    _method_warning(method, output_format, tuple(supported_formats))
                 )
     
     return warnings_list
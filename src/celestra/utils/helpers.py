@@ -11,6 +11,20 @@ import json
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 
+# libyaml's C emitter when PyYAML was built with it (not under PyScript);
+# it shares Dumper's representers, so the output is the same
+try:
+    from yaml import CDumper as _YamlDumper
+except ImportError:
+    from yaml import Dumper as _YamlDumper
+
+# orjson when installed (the "fast" extra); both emit compact UTF-8 JSON
+try:
+    from orjson import dumps as _json_bytes
+except ImportError:
+    def _json_bytes(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 def validate_name(name: str) -> bool:
     """
@@ -155,7 +169,7 @@ def format_yaml(data: Dict[str, Any]) -> str:
     Returns:
         str: YAML formatted string
     """
-    return yaml.dump(data, default_flow_style=False, sort_keys=False)
+    return yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
 
 def format_json(data: Dict[str, Any], indent: int = 2) -> str:
@@ -172,6 +186,21 @@ def format_json(data: Dict[str, Any], indent: int = 2) -> str:
     return json.dumps(data, indent=indent, sort_keys=False)
 
 
+def format_json_bytes(data: Any) -> bytes:
+    """
+    Format data as compact UTF-8 encoded JSON.
+    
+    Uses orjson when it is installed and the standard library otherwise.
+    
+    Args:
+        data: Data to format
+        
+    Returns:
+        bytes: Compact JSON document
+    """
+    return _json_bytes(data)
+
+
 def safe_load_yaml(yaml_str: str) -> Dict[str, Any]:
     """
     Safely load YAML string.
@@ -198,6 +227,19 @@ def safe_load_json(json_str: str) -> Dict[str, Any]:
     return json.loads(json_str)
 
 
+def as_path(path: Union[str, Path]) -> Path:
+    """
+    Convert a path argument to a Path, reusing it if it already is one.
+    
+    Args:
+        path: File or directory path
+        
+    Returns:
+        Path: Path object
+    """
+    return path if isinstance(path, Path) else Path(path)
+
+
 def ensure_directory(path: Union[str, Path]) -> Path:
     """
     Ensure directory exists, create if it doesn't.
@@ -208,7 +250,7 @@ def ensure_directory(path: Union[str, Path]) -> Path:
     Returns:
         Path: Path object
     """
-    path_obj = Path(path)
+    path_obj = as_path(path)
     path_obj.mkdir(parents=True, exist_ok=True)
     return path_obj
 
@@ -221,7 +263,7 @@ def write_file(path: Union[str, Path], content: str) -> None:
         path: File path
         content: Content to write
     """
-    path_obj = Path(path)
+    path_obj = as_path(path)
     path_obj.parent.mkdir(parents=True, exist_ok=True)
     path_obj.write_text(content)
 
@@ -262,6 +304,13 @@ def sanitize_env_var_name(name: str) -> str:
     return sanitized
 
 
+# Annotations every generated resource starts with
+_BASE_ANNOTATIONS = {
+    "celestra.io/generated": "true",
+    "celestra.io/version": "1.0.0",
+}
+
+
 def generate_labels(name: str, app_type: str = "app", **extra_labels) -> Dict[str, str]:
     """
     Generate standard Kubernetes labels.
@@ -282,7 +331,8 @@ def generate_labels(name: str, app_type: str = "app", **extra_labels) -> Dict[st
         "app.kubernetes.io/managed-by": "Celestra",
     }
     
-    labels.update(extra_labels)
+    if extra_labels:
+        labels.update(extra_labels)
     return labels
 
 
@@ -296,10 +346,8 @@ def generate_annotations(**annotations) -> Dict[str, str]:
     Returns:
         Dict[str, str]: Generated annotations
     """
-    base_annotations = {
-        "celestra.io/generated": "true",
-"celestra.io/version": "1.0.0",
-    }
+    base_annotations = _BASE_ANNOTATIONS.copy()
     
-    base_annotations.update({k: str(v) for k, v in annotations.items()})
+    if annotations:
+        base_annotations.update({k: str(v) for k, v in annotations.items()})
     return base_annotations 
\ No newline at end of file
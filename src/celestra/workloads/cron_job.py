@@ -335,12 +335,14 @@ class CronJob(BaseBuilder):
         Returns:
             CronJob: Self for method chaining
         """
-        for port_config in ports:
-            self._ports.append({
+        self._ports.extend(
+            {
                 "containerPort": port_config.get("port"),
                 "name": port_config.get("name", "http"),
                 "protocol": port_config.get("protocol", "TCP")
-            })
+            }
+            for port_config in ports
+        )
         return self
     
     def metrics_port(self, port: int = 9090, name: str = "metrics") -> "CronJob":
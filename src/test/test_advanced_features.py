@@ -10,6 +10,9 @@ Tests for Celestra advanced features:
 """
 
 import pytest
+import socket
+import threading
+import time
 import yaml
 
 from src.celestra import (
@@ -103,6 +106,146 @@ class TestWaitCondition:
         wait_condition = WaitCondition("multi-wait")
         assert wait_condition._name == "multi-wait"
 
+    def test_config_map_data(self):
+        wait_condition = (WaitCondition("data-wait")
+                          .wait_for_deployment_ready("api")
+                          .wait_for_http_success("http://api/health")
+                          .wait_for_tcp_connect("postgres", 5432))
+
+        config_map = wait_condition.generate_kubernetes_resources()[0]
+        data = config_map["data"]
+
+        assert config_map["kind"] == "ConfigMap"
+        assert data["conditions_count"] == "3"
+        assert data["condition_0_resource"] == "deployment"
+        assert data["condition_1_url"] == "http://api/health"
+        assert data["condition_1_expected_status"] == "200"
+        assert data["condition_2_host"] == "postgres"
+        assert data["condition_2_port"] == "5432"
+
+    def test_config_map_data_for_log_and_metric_conditions(self):
+        wait_condition = (WaitCondition("observed-wait")
+                          .wait_for_log_pattern("api", "Server started", container="app")
+                          .wait_for_metric_threshold("up{job='api'}", 1, comparison="==")
+                          .wait_for_condition("deployment", "api", "Available"))
+
+        data = wait_condition.generate_kubernetes_resources()[0]["data"]
+
+        assert data["condition_0_pattern"] == "Server started"
+        assert data["condition_0_container"] == "app"
+        assert data["condition_1_metric_query"] == "up{job='api'}"
+        assert data["condition_1_threshold"] == "1"
+        assert data["condition_1_comparison"] == "=="
+        assert data["condition_2_condition_type"] == "Available"
+        assert data["condition_2_status"] == "True"
+
+    def test_condition_timeout_only_emitted_when_overridden(self):
+        wait_condition = (WaitCondition("timeout-data-wait")
+                          .wait_for_tcp_connect("postgres", 5432)
+                          .wait_for_tcp_connect("redis", 6379, timeout="30s"))
+
+        data = wait_condition.generate_kubernetes_resources()[0]["data"]
+
+        assert data["timeout"] == "5m"
+        assert "condition_0_timeout" not in data
+        assert data["condition_1_timeout"] == "30s"
+
+    def test_wait_script(self):
+        wait_condition = (WaitCondition("script-wait")
+                          .wait_for_tcp_connect("postgres", 5432)
+                          .wait_for_http_success("http://api/health"))
+
+        job = wait_condition.generate_kubernetes_resources()[1]
+        script = job["spec"]["template"]["spec"]["containers"][0]["args"][1]
+        lines = script.splitlines()
+
+        assert lines[0] == "#!/bin/sh"
+        assert "wait_tcp postgres 5432" in lines
+        assert "wait_http http://api/health" in lines
+        assert " && " not in script
+
+    def test_no_conditions_generates_nothing(self):
+        wait_condition = WaitCondition("empty-wait").enable_retry()
+        assert wait_condition.generate_kubernetes_resources() == []
+
+    def test_invalid_settings_rejected(self):
+        wait_condition = WaitCondition("invalid-wait")
+
+        with pytest.raises(ValueError):
+            wait_condition.set_failure_policy("retry_forever")
+        with pytest.raises(ValueError):
+            wait_condition.wait_for_metric_threshold("up", 1, comparison="=~")
+        with pytest.raises(ValueError):
+            wait_condition.wait_for_http_success("http://api/health", method="FETCH")
+
+    def test_slots_without_instance_dict(self):
+        wait_condition = WaitCondition("slots-wait").wait_for_tcp_connect("postgres", 5432)
+        wait_condition.generate_kubernetes_resources()
+
+        assert not hasattr(wait_condition, "__dict__")
+        assert wait_condition._kubernetes_methods == {"generate_kubernetes_resources"}
+
+    def test_execute_tcp_conditions(self):
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+
+            wait_condition = (WaitCondition("tcp-exec-wait")
+                              .wait_for_tcp_connect("127.0.0.1", port)
+                              .wait_for_tcp_connect("127.0.0.1", port)
+                              .enable_parallel_checks())
+
+            assert wait_condition.execute() is True
+
+    def test_execute_fails_after_timeout(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        wait_condition = (WaitCondition("closed-port-wait")
+                          .set_timeout("1s")
+                          .wait_for_tcp_connect("127.0.0.1", port))
+
+        assert wait_condition.execute() is False
+
+    def test_execute_stops_probes_at_global_timeout(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        wait_condition = (WaitCondition("bounded-wait")
+                          .set_timeout("1s")
+                          .wait_for_tcp_connect("127.0.0.1", port, timeout="30s"))
+
+        before = set(threading.enumerate())
+        started = time.monotonic()
+        assert wait_condition.execute() is False
+        assert time.monotonic() - started < 5
+        assert set(threading.enumerate()) <= before
+
+    def test_execute_async_stops_probes_at_global_timeout(self):
+        pytest.importorskip("aiohttp")
+        import asyncio
+
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        wait_condition = (WaitCondition("bounded-async-wait")
+                          .set_timeout("1s")
+                          .wait_for_tcp_connect("127.0.0.1", port, timeout="30s"))
+
+        started = time.monotonic()
+        assert asyncio.run(wait_condition.execute_async()) is False
+        assert time.monotonic() - started < 5
+
+    def test_execute_rejects_cluster_only_conditions(self):
+        wait_condition = WaitCondition("cluster-wait").wait_for_deployment_ready("api")
+
+        with pytest.raises(ValueError):
+            wait_condition.execute()
+
 
 class TestDeploymentStrategy:
     def test_rolling_update_strategy(self):
@@ -59,6 +59,20 @@ class TestApp:
         assert port_map["https"] == 8443
         assert port_map["metrics"] == 9090
 
+    def test_app_convenience_ports(self):
+        app = (App("preset-port-app")
+               .image("preset:latest")
+               .https_port()
+               .grpc_port(50051)
+               .debug_port(name="jdwp")
+               .common_ports())
+
+        ports = [(port["name"], port["containerPort"]) for port in app._ports]
+        assert ports == [("https", 8443), ("grpc", 50051), ("jdwp", 5005),
+                         ("http", 8080), ("metrics", 9090), ("health", 8081)]
+        assert App.admin_port.__name__ == "admin_port"
+        assert "(default: 9000)" in App.admin_port.__doc__
+
     def test_app_port_mapping(self):
         """Test new port mapping functionality."""
         app = (App("port-mapped-app")
@@ -123,6 +137,107 @@ class TestApp:
         finally:
             os.unlink(compose_file)
 
+    def test_resource_generator_repr_and_validate_reuse_resources(self, monkeypatch):
+        app = App("generator-app").image("nginx:latest").port(8080)
+        generator = app.generate()
+
+        assert "resources=?" in repr(generator)
+        assert generator._resources is None
+        assert not hasattr(generator, "__dict__")
+
+        assert generator.validate() == []
+        monkeypatch.setattr(App, "generate_kubernetes_resources",
+                            lambda self: pytest.fail("resources generated twice"))
+        assert generator.validate() == []
+        assert f"resources={len(generator.resources)}" in repr(generator)
+
+    def test_resource_generator_renders_once_across_threads(self, monkeypatch):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        app = App("threaded-app").image("nginx:latest").port(8080)
+        rendered = app.generate_kubernetes_resources()
+        calls = []
+
+        def slow_render(self):
+            calls.append(threading.get_ident())
+            time.sleep(0.05)
+            return rendered
+
+        monkeypatch.setattr(App, "generate_kubernetes_resources", slow_render)
+        generator = app.generate()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: generator.resources, range(4)))
+
+        assert len(calls) == 1
+        assert all(result is rendered for result in results)
+
+    def test_resource_generator_preview_documents(self):
+        generator = App("preview-app").image("nginx:latest").port(8080).generate()
+        documents = [doc for doc in yaml.safe_load_all(generator.preview()) if doc]
+
+        assert generator.preview().startswith("---\n")
+        assert [doc["kind"] for doc in documents] == [r["kind"] for r in generator.resources]
+
+    def test_resource_generator_lookups_by_kind_and_api_version(self):
+        generator = App("lookup-app").image("nginx:latest").port(8080).generate()
+
+        deployments = generator.get_resources_by_kind("Deployment")
+        assert [r["kind"] for r in deployments] == ["Deployment"]
+        assert generator.get_resources_by_kind("CronJob") == []
+        assert generator.get_resources_by_api_version("apps/v1") == deployments
+
+        deployments.clear()
+        assert len(generator.get_resources_by_kind("Deployment")) == 1
+        assert [r["kind"] for r in generator.iter_resources_by_kind("Service")] == ["Service"]
+        assert list(generator.iter_resources_by_kind("CronJob")) == []
+
+    def test_resource_generator_reports_malformed_resources(self):
+        generator = App("malformed-app").image("nginx:latest").generate()
+        generator._resources = [
+            {"kind": "Service", "metadata": {}},
+            {"apiVersion": "v1", "kind": "ConfigMap"},
+            "not-a-resource",
+        ]
+
+        assert generator.validate() == [
+            "Resource missing apiVersion",
+            "Resource metadata missing name",
+            "Resource missing metadata",
+            "Resource must be a dictionary",
+        ]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_resource_generator_analyze(self, parallel):
+        generator = (App("analyze-app").image("nginx:latest").port(8080)
+                     .resources(cpu="500m", memory="512Mi").generate())
+
+        results = generator.analyze(parallel=parallel)
+
+        assert results["errors"] == generator.validate()
+        assert isinstance(results["security"]["report"], str)
+        assert results["cost"]["total"].total_cost >= 0
+        assert ([cost.resource_name for cost in results["cost"]["resources"]]
+                == [cost.resource_name for cost in generator.cost_estimate()["resources"]])
+
+    def test_format_warnings_follow_methods_used(self):
+        from src.celestra.utils.decorators import format_warning
+
+        plain = App("plain-app").image("nginx:latest")
+        mixed = (App("mixed-app").image("nginx:latest")
+                 .port_mapping(8080, 80).node_selector({"disk": "ssd"}))
+
+        assert format_warning(plain, "kubernetes") == []
+        assert format_warning(mixed, "kubernetes") == [
+            "⚠️  Method 'port_mapping()' is Docker Compose-specific and will be ignored in "
+            "Kubernetes output. For Kubernetes, use 'port()' + 'Service' instead of 'port_mapping()'."
+        ]
+        assert format_warning(mixed, "docker-compose") == [
+            "⚠️  Method 'node_selector()' is Kubernetes-specific and will be ignored in Docker Compose output."
+        ]
+        assert format_warning(mixed, "kubernetes")[0] is format_warning(mixed, "kubernetes")[0]
+
     def test_app_environment_variables(self):
         app = (App("env-app")
                .image("test:latest")
@@ -145,6 +260,16 @@ class TestApp:
         assert app._resources["limits"]["cpu"] == "500m"
         assert app._resources["limits"]["memory"] == "512Mi"
 
+    def test_app_resources_merge_across_calls(self):
+        app = (App("merged-resource-app")
+               .resources(cpu="200m", gpu=1)
+               .resources(memory="256Mi", cpu_limit="500m"))
+        
+        assert app._resources == {
+            "requests": {"cpu": "200m", "memory": "256Mi"},
+            "limits": {"nvidia.com/gpu": "1", "cpu": "500m"},
+        }
+
     def test_app_scaling_configuration(self):
         from celestra import Scaling
         
@@ -210,6 +335,192 @@ class TestApp:
         assert len(app._secrets) == 1
         assert len(app._config_maps) == 1
 
+    def test_app_child_resources_order(self):
+        from celestra import Job
+        
+        app = (App("parent-app")
+               .image("app:latest")
+               .port(8080)
+               .add_job(Job("migrate").image("app:latest"))
+               .add_secret(Secret("app-secret").add("password", "secret123"))
+               .add_config(ConfigMap("app-config").add("setting", "value")))
+        
+        kinds = [r["kind"] for r in app.generate_kubernetes_resources()]
+        assert kinds == ["Deployment", "Service", "ConfigMap", "Secret", "Job"]
+
+    def test_app_output_copies_memoized_render(self):
+        app = App("copied-app").image("app:1.0").port(8080)
+
+        deployment = app.generate_kubernetes_resources()[0]
+        deployment["metadata"]["labels"]["patched"] = "yes"
+        deployment["spec"]["replicas"] = 9
+
+        fresh = app.generate_kubernetes_resources()[0]
+        assert "patched" not in fresh["metadata"]["labels"]
+        assert fresh["spec"]["replicas"] == 1
+        assert app._generate_deployment() == fresh
+
+    def test_app_render_memoized_until_mutation(self):
+        app = App("memo-app").image("app:1.0").port(8080)
+        
+        first = app._generate_deployment()
+        assert app._generate_deployment() is first
+        
+        app.image("app:2.0")
+        second = app._generate_deployment()
+        assert second is not first
+        assert second["spec"]["template"]["spec"]["containers"][0]["image"] == "app:2.0"
+        
+        app.set_namespace("staging")
+        assert app._generate_deployment()["metadata"]["namespace"] == "staging"
+
+    def test_app_render_follows_nested_builders(self):
+        from src.celestra import Companion, Health, Scaling
+
+        sidecar = Companion("side").image("a:1")
+        health = Health().liveness_tcp(8080)
+        scaling = Scaling().horizontal(min_replicas=1, max_replicas=3)
+        app = (App("nested-app").image("app:1.0").port(8080)
+               .add_companion(sidecar).health(health).scale(scaling))
+
+        def render():
+            resources = app.generate_kubernetes_resources()
+            return resources[0]["spec"]["template"]["spec"]["containers"], resources[-1]
+
+        render()
+        sidecar.image("a:2")
+        health.readiness_tcp(8080)
+        scaling.horizontal(min_replicas=2, max_replicas=6)
+        containers, hpa = render()
+
+        assert containers[1]["image"] == "a:2"
+        assert "readinessProbe" in containers[0]
+        assert hpa["spec"]["maxReplicas"] == 6
+
+        tracked = App("tracked-app").image("app:1.0").add_companion(Companion("side").image("a:1"))
+        first = tracked._generate_deployment()
+        assert tracked._generate_deployment() is first
+        tracked._companions[0].image("a:2")
+        assert tracked._generate_deployment()["spec"]["template"]["spec"]["containers"][1]["image"] == "a:2"
+
+    def test_app_metadata_not_shared_with_builder(self):
+        app = App("metadata-app").image("app:latest").port(8080).set_namespace("web")
+        
+        deployment, service = app.generate_kubernetes_resources()
+        deployment["metadata"]["labels"]["patched"] = "true"
+        
+        assert "patched" not in app.labels
+        assert "patched" not in service["metadata"]["labels"]
+        assert service["metadata"]["namespace"] == "web"
+
+    def test_app_labels_are_copies(self):
+        app = App("labels-app")
+        labels = app.labels
+        labels["team"] = "web"
+
+        assert "team" not in app._labels
+        assert app.annotations == app._annotations
+        assert app.annotations is not app._annotations
+
+    def test_app_default_metadata_not_shared(self):
+        first = App("first").add_annotation("celestra.io/version", "2.0.0")
+        second = App("second")
+
+        assert second.annotations["celestra.io/version"] == "1.0.0"
+        assert second.labels["app.kubernetes.io/name"] == "second"
+        assert first._labels is not second._labels
+
+    def test_app_metadata_keys_interned(self):
+        prefix = "example.com/"
+        first = App("first").add_label(prefix + "team", "a")
+        second = App("second").add_labels({prefix + "team": "b"}).add_annotations({prefix + "owner": 1})
+
+        first_key = next(k for k in first._labels if k.startswith(prefix))
+        second_key = next(k for k in second._labels if k.startswith(prefix))
+        assert first_key is second_key
+        assert second._annotations[prefix + "owner"] == 1
+
+    def test_app_for_environment_clones(self):
+        app = App("env-app").image("app:latest").port(8080)
+        
+        prod_app = app.for_environment("prod").port(9090)
+        
+        assert prod_app.labels["environment"] == "prod"
+        assert "environment" not in app.labels
+        assert len(app._ports) == 1
+        assert len(prod_app._ports) == 2
+
+    def test_app_render_for_environment(self):
+        app = App("render-env-app").image("app:latest").port(8080)
+        
+        resources = app.render_for("staging")
+        
+        assert [r["kind"] for r in resources] == ["Deployment", "Service"]
+        assert all(r["metadata"]["labels"]["environment"] == "staging" for r in resources)
+        assert "environment" not in app.generate_kubernetes_resources()[0]["metadata"]["labels"]
+
+    def test_app_configure_target(self):
+        App.configure_target("kubernetes")
+        try:
+            app = App("targeted-app").node_selector({"disktype": "ssd"})
+            assert app._kubernetes_methods is None
+            assert app._extras["node_selector"] == {"disktype": "ssd"}
+            
+            with pytest.raises(ValueError):
+                app.port_mapping(8080, 80)
+        finally:
+            App.configure_target(None)
+        
+        app = App("default-app").port_mapping(8080, 80)
+        assert app._docker_compose_methods == {"port_mapping"}
+
+    def test_app_rarely_used_settings(self):
+        app = App("extras-app").image("app:latest")
+        assert app._extras is None
+        
+        app.service_account("app-sa").security_context({"runAsNonRoot": True})
+        pod_spec = app.generate_kubernetes_resources()[0]["spec"]["template"]["spec"]
+        
+        assert pod_spec["serviceAccountName"] == "app-sa"
+        assert pod_spec["containers"][0]["securityContext"] == {"runAsNonRoot": True}
+
+    def test_app_env_list_reused_until_env_changes(self):
+        app = App("env-cache-app").image("app:1.0").env("MODE", "a")
+        
+        def container_env():
+            return app._generate_deployment()["spec"]["template"]["spec"]["containers"][0]["env"]
+        
+        first = container_env()
+        app.image("app:2.0")
+        assert container_env() is first
+        
+        app.env("MODE", "b")
+        assert container_env() == [{"name": "MODE", "value": "b"}]
+
+    def test_app_redundant_environment_keeps_render_cache(self):
+        app = App("env-noop-app").image("app:1.0").environment({"MODE": "a", "LEVEL": "1"})
+        deployment = app._generate_deployment()
+
+        app.environment({"MODE": "a"}).environment({})
+        assert app._generate_deployment() is deployment
+
+        app.environment({"MODE": "a", "LEVEL": "2"})
+        assert app._generate_deployment() is not deployment
+        assert app._environment == {"MODE": "a", "LEVEL": "2"}
+
+    def test_app_collections_allocated_on_first_use(self):
+        app = App("lazy-app").image("app:latest")
+        
+        assert app._ports is None
+        assert app._environment is None
+        
+        resources = app.generate_kubernetes_resources()
+        assert [r["kind"] for r in resources] == ["Deployment"]
+        
+        app.port(8080).env("MODE", "lazy")
+        assert app._ports[0]["containerPort"] == 8080
+        assert app._environment == {"MODE": "lazy"}
+
 
 class TestStatefulApp:
     """Test cases for the StatefulApp class (stateful applications)."""
@@ -306,6 +617,204 @@ class TestStatefulApp:
         
         # Note: Volume assertions may need adjustment based on actual implementation
 
+    def test_stateful_app_companion_containers(self):
+        from src.celestra import Companion
+
+        app = (StatefulApp("companion-db").image("postgres:13")
+               .add_companion(Companion("exporter", "sidecar").image("exporter:v1"))
+               .add_companion(Companion("init-perms", "init").image("busybox"))
+               .add_companion(Companion("backup-agent", "sidecar").image("agent:v1")))
+
+        pod_spec = app.generate_kubernetes_resources()[0]["spec"]["template"]["spec"]
+        assert [c["name"] for c in pod_spec["initContainers"]] == ["init-perms"]
+        assert [c["name"] for c in pod_spec["containers"]] == [
+            "companion-db", "exporter", "backup-agent"]
+
+    def test_stateful_app_health_probes(self):
+        from src.celestra import Health
+
+        health = Health().liveness_tcp(5432)
+        app = StatefulApp("probe-db").image("postgres:13").health(health)
+
+        container = app.generate_kubernetes_resources()[0]["spec"]["template"]["spec"]["containers"][0]
+        assert container["livenessProbe"] == health.liveness_probe
+        assert "readinessProbe" not in container
+        assert "startupProbe" not in container
+
+    def test_stateful_app_iter_resources(self):
+        app = StatefulApp("iter-db").image("postgres:13").port(5432).backup_schedule("0 2 * * *")
+
+        resources = app.iter_kubernetes_resources()
+        assert next(resources)["kind"] == "StatefulSet"
+        assert [r["kind"] for r in resources] == ["Service", "CronJob"]
+        assert list(app.iter_kubernetes_resources()) == app.generate_kubernetes_resources()
+
+    def test_stateful_app_dump_to_stream(self):
+        import io
+
+        app = StatefulApp("dump-db").image("postgres:13").port(5432).backup_schedule("0 2 * * *")
+        stream = io.StringIO()
+
+        assert app.dump_to(stream) is app
+        documents = list(yaml.safe_load_all(stream.getvalue()))
+        assert documents == app.generate_kubernetes_resources()
+
+    def test_stateful_app_clone_is_independent(self):
+        secret = Secret("db-creds").add("password", "s3cret")
+        app = (StatefulApp("clone-db").image("postgres:13").port(5432)
+               .resources(cpu="500m").add_secrets([secret]))
+        first = app.generate_kubernetes_resources()
+
+        staging = app.for_environment("staging")
+        staging.port(9187, "metrics").resources(cpu="1").env("MODE", "replica")
+
+        assert staging._render_cache is None
+        assert staging._secrets[0] is not secret
+        staging._secrets[0].add("replica-password", "0ther")
+        assert "replica-password" not in secret._string_data
+        assert "environment" not in app._labels
+        assert [p["containerPort"] for p in app._ports] == [5432]
+        assert app._resources == {"requests": {"cpu": "500m"}}
+        assert app._environment == {}
+        assert app.generate_kubernetes_resources()[0] == first[0]
+        assert staging.generate_kubernetes_resources()[0]["metadata"]["labels"]["environment"] == "staging"
+
+    def test_stateful_app_configure(self):
+        app = StatefulApp("configured-db").configure(image="postgres:13", replicas=3, headless_service=False)
+        chained = StatefulApp("configured-db").image("postgres:13").replicas(3).headless_service(False)
+
+        assert app.generate_kubernetes_resources() == chained.generate_kubernetes_resources()
+        with pytest.raises(ValueError):
+            app.configure(replicas=5, storage_size="10Gi")
+        assert app._replicas == 3
+
+        tuned = StatefulApp("tuned-db").update_strategy("RollingUpdate", 2).configure(
+            update_strategy="OnDelete", cluster_mode=True)
+        assert tuned._partition is None
+        assert {"update_strategy", "cluster_mode"} <= tuned._kubernetes_methods
+
+        version = tuned._version
+        tuned.configure(replicas=2, retention_hours=24, partition=1)
+        assert tuned._version == version + 1
+        assert (tuned._update_strategy, tuned._partition) == ("OnDelete", 1)
+        assert "retention_hours" in tuned._kubernetes_methods
+
+    def test_stateful_app_resources_merge(self):
+        app = (StatefulApp("sized-db")
+               .resources(cpu="500m", memory_limit="2Gi")
+               .resources(memory="1Gi", gpu=1))
+
+        assert app._resources == {
+            "requests": {"cpu": "500m", "memory": "1Gi"},
+            "limits": {"memory": "2Gi", "nvidia.com/gpu": "1"},
+        }
+
+    def test_stateful_app_to_json_bytes(self):
+        import json
+
+        app = StatefulApp("json-db").image("postgres:13").port(5432).add_label("owner", "équipe")
+        payload = app.to_json_bytes()
+
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == app.generate_kubernetes_resources()
+
+    def test_stateful_app_pod_labels_not_shared(self):
+        app = StatefulApp("label-db").image("postgres:13").add_label("app", "database")
+
+        spec = app.generate_kubernetes_resources()[0]["spec"]
+        pod_labels = spec["template"]["metadata"]["labels"]
+        assert pod_labels is not app._labels
+        assert spec["selector"]["matchLabels"].items() <= pod_labels.items()
+
+        pod_labels["tier"] = "db"
+        assert "tier" not in app._labels
+
+    def test_stateful_app_state_in_slots(self):
+        app = StatefulApp("slots-db").image("postgres:13").postgres_port().storage("10Gi")
+        app.generate_kubernetes_resources()
+
+        assert not hasattr(app, "__dict__")
+        assert app._storage_size == "10Gi"
+
+    def test_stateful_app_port_presets(self):
+        app = StatefulApp("preset-db").image("redis:7").redis_port().metrics_port(9121)
+
+        assert app._ports == [
+            {"containerPort": 6379, "name": "redis", "protocol": "TCP"},
+            {"containerPort": 9121, "name": "metrics", "protocol": "TCP"},
+        ]
+        assert StatefulApp.redis_port.__name__ == "redis_port"
+        assert "Redis port" in StatefulApp.redis_port.__doc__
+
+        service = app.generate_kubernetes_resources()[1]
+        app.admin_port()
+        assert app.generate_kubernetes_resources()[1] is not service
+
+        calls = []
+
+        class RecordingPorts(StatefulApp):
+            __slots__ = ()
+
+            def port(self, port, name="app", protocol="TCP"):
+                calls.append((port, name))
+                return super().port(port, name, protocol)
+
+        RecordingPorts("recorded-db").postgres_port().metrics_port(9187)
+        assert calls == [(5432, "postgres"), (9187, "metrics")]
+
+    def test_stateful_app_render_memoized_until_change(self):
+        app = (StatefulApp("memo-db")
+               .image("postgres:13")
+               .port(5432, "postgres")
+               .backup_schedule("0 2 * * *"))
+
+        first = list(app._shared_resources())
+        second = list(app._shared_resources())
+        assert [a is b for a, b in zip(first, second)] == [True, True, True]
+        assert app.generate_kubernetes_resources()[0] is not first[0]
+
+        app.metrics_port().replicas(3)
+        third = list(app._shared_resources())
+        statefulset, service = third[0], third[1]
+        assert statefulset is not first[0]
+        assert statefulset["spec"]["replicas"] == 3
+        assert [p["name"] for p in service["spec"]["ports"]] == ["postgres", "metrics"]
+
+    def test_stateful_app_output_copies_memoized_render(self):
+        app = StatefulApp("copied-db").image("postgres:13").port(5432)
+
+        statefulset = app.generate_kubernetes_resources()[0]
+        statefulset["metadata"]["labels"]["tier"] = "db"
+        statefulset["spec"]["template"]["spec"]["containers"][0]["ports"].clear()
+
+        fresh = app.generate_kubernetes_resources()[0]
+        assert "tier" not in fresh["metadata"]["labels"]
+        assert fresh["spec"]["template"]["spec"]["containers"][0]["ports"] == app._ports
+
+    def test_stateful_app_render_follows_nested_builders(self):
+        from src.celestra import Companion, Health
+
+        exporter = Companion("exporter").image("exporter:v1")
+        health = Health().liveness_tcp(5432)
+        config = ConfigMap("db-config").add("mode", "primary")
+        app = StatefulApp("nested-db").image("postgres:13").port(5432).add_companion(exporter)
+
+        first = app._generate_statefulset()
+        assert app._generate_statefulset() is first
+
+        app.health(health)
+        app.generate_kubernetes_resources()
+        exporter.image("exporter:v2")
+        health.readiness_tcp(5432)
+        containers = app.generate_kubernetes_resources()[0]["spec"]["template"]["spec"]["containers"]
+        assert containers[1]["image"] == "exporter:v2"
+        assert "readinessProbe" in containers[0]
+
+        app.add_config(config)
+        config.add("replicas", "2")
+        resources = app.generate_kubernetes_resources()
+        assert resources[-1]["data"] == {"mode": "primary", "replicas": "2"}
+
 
 class TestAppGroup:
     def test_basic_app_group_creation(self):
@@ -333,6 +842,104 @@ class TestAppGroup:
         # Note: Dependencies are handled differently in actual implementation
         assert len(group._services) == 2
 
+    def test_app_group_service_lookup(self):
+        first = App("api").image("api:v1")
+        duplicate = App("api").image("api:v2")
+        worker = App("worker").image("worker:v1")
+
+        group = AppGroup("lookup-group").add_services([first, worker]).add_service(duplicate)
+
+        assert group.get_service("api") is first
+        assert "Service names within AppGroup must be unique" in group.validate()
+
+        group.remove_service("api").remove_service("missing")
+        assert group.get_service("api") is None
+        assert group.get_service_names() == ["worker"]
+
+    def test_app_group_slots_without_instance_dict(self):
+        group = AppGroup("slotted-group").add_service(App("api").image("api:v1"))
+        prod = group.for_environment("prod")
+
+        assert not hasattr(group, "__dict__")
+        assert prod.get_service("api") is prod._services[0]
+        assert prod.get_service("api") is not group.get_service("api")
+
+    def test_app_group_for_environment_labels_copy(self):
+        group = AppGroup("env-group").add_services(
+            [App("api").image("api:v1"), App("worker").image("worker:v1")])
+        prod = group.for_environment("prod")
+
+        assert prod.labels["environment"] == "prod"
+        assert [s.labels["environment"] for s in prod._services] == ["prod", "prod"]
+        assert "environment" not in group.labels
+        assert all("environment" not in s.labels for s in group._services)
+
+    def test_app_group_remove_service_keeps_order(self):
+        group = AppGroup("ordered-group").add_services(
+            [App(name).image(f"{name}:v1") for name in ("a", "b", "c", "d")])
+        services = group._services
+
+        group.remove_service("b")
+
+        assert group._services is services
+        assert group.get_service_names() == ["a", "c", "d"]
+        assert group.get_service("c").name == "c"
+
+    def test_app_group_dependency_cycles(self):
+        group = AppGroup("cycle-group").add_services(
+            [App(name).image(f"{name}:v1") for name in ("db", "api", "web", "jobs")])
+
+        group.add_dependency("api", "db").add_dependency("web", "api")
+        assert group.validate() == []
+
+        group.add_dependency("db", "web").add_dependency("jobs", ["jobs", "queue"])
+        assert group.validate() == [
+            "Service jobs depends on unknown service: queue",
+            "Circular dependency detected among: db, api, web, jobs",
+        ]
+
+    def test_app_group_validation_memoized_until_change(self):
+        api = App("api").image("api:v1")
+        group = AppGroup("validated-group").add_service(api)
+
+        first = group.validate()
+        first.append("caller-owned")
+        assert group.validate() == []
+        assert group._render_cache["AppGroup.validate"][1] == []
+
+        api.add_label("owner", "z" * 64)
+        assert group.validate() == [f"api: Label value {'z' * 64} must be 63 characters or less"]
+
+    def test_app_group_validates_member_metadata(self):
+        api = App("api").image("api:v1").add_label("team", "x" * 64).add_annotation("note", 1)
+
+        group = AppGroup("metadata-group").add_service(api).add_annotation("docs", "y" * 100)
+
+        assert group.validate() == [
+            f"api: Label value {'x' * 64} must be 63 characters or less",
+            "api: Annotation note must have string key and value",
+        ]
+
+    def test_app_group_fused_network_policy(self):
+        def group():
+            return AppGroup("net-group").add_services(
+                [App(name).image(f"{name}:v1") for name in ("gateway", "api", "db")])
+
+        separate = group().configure_networking(deny_external_access_except=["gateway"])
+        assert [p.name for p in separate._network_policies] == ["net-group-internal", "net-group-external"]
+
+        fused = group().configure_networking(deny_external_access_except=["gateway"], fuse_policies=True)
+        policies = [r for r in fused.generate_kubernetes_resources() if r["kind"] == "NetworkPolicy"]
+        assert len(policies) == 1
+        assert policies[0]["spec"]["podSelector"]["matchExpressions"] == [
+            {"key": "app", "operator": "In", "values": ["gateway", "api", "db"]},
+            {"key": "app", "operator": "NotIn", "values": ["gateway"]},
+        ]
+
+        external_only = group().configure_networking(
+            allow_internal_communication=False, deny_external_access_except=["gateway"], fuse_policies=True)
+        assert [p.name for p in external_only._network_policies] == ["net-group-external"]
+
     def test_app_group_shared_configuration(self):
         group = (AppGroup("shared-config")
                  .set_namespace("production"))
@@ -370,6 +977,142 @@ class TestAppGroup:
         assert "app1" in deployment_names
         assert "app2" in deployment_names
 
+    def test_app_group_render_memoized_until_member_changes(self):
+        api = App("api").image("api:v1").port(8080)
+        worker = App("worker").image("worker:v1")
+
+        group = (AppGroup("memo-group")
+                 .add_services([api, worker])
+                 .add_dependency("api", "worker"))
+
+        first = list(group._shared_resources())
+        second = list(group._shared_resources())
+        assert second == first and second is not first
+        assert all(a is b for a, b in zip(first, second))
+        assert api._dependencies == ["worker"]
+
+        worker.image("worker:v2")
+        images = [r["spec"]["template"]["spec"]["containers"][0]["image"]
+                  for r in group.generate_kubernetes_resources() if r["kind"] == "Deployment"]
+        assert images == ["api:v1", "worker:v2"]
+
+        group.configure_monitoring(grafana_enabled=False)
+        assert group.generate_kubernetes_resources()[-1]["kind"] == "ServiceMonitor"
+
+    def test_app_group_output_copies_memoized_render(self):
+        group = AppGroup("copied-group").add_service(App("api").image("api:v1").port(8080))
+
+        group.generate_kubernetes_resources()[0]["metadata"]["labels"]["patched"] = "yes"
+        assert "patched" not in group.generate_kubernetes_resources()[0]["metadata"]["labels"]
+        assert "patched" not in next(group.iter_kubernetes_resources())["metadata"]["labels"]
+
+    def test_app_group_level_resources(self):
+        group = (AppGroup("platform")
+                 .add_service(App("api").image("api:v1"))
+                 .configure_namespace(namespace_labels={"team": "core"})
+                 .set_resource_quotas(cpu_limit="4", pod_limit=20)
+                 .configure_monitoring())
+
+        resources = group.generate_kubernetes_resources()
+        by_kind = {r["kind"]: r for r in resources}
+
+        assert [r["kind"] for r in resources][:2] == ["Namespace", "ResourceQuota"]
+        assert by_kind["Namespace"]["metadata"]["labels"]["team"] == "core"
+        assert by_kind["ResourceQuota"]["spec"]["hard"]["count/pods"] == "20"
+        assert by_kind["ServiceMonitor"]["apiVersion"] == "monitoring.coreos.com/v1"
+        assert resources[-1]["metadata"]["labels"]["grafana_dashboard"] == "1"
+
+        by_kind["ResourceQuota"]["metadata"]["labels"]["patched"] = "true"
+        assert "patched" not in group.labels
+
+    def test_app_group_grafana_dashboard_is_valid_json(self):
+        import json
+
+        group = AppGroup('quoted "edge" group').configure_monitoring(prometheus_enabled=False)
+        dashboard = group.generate_kubernetes_resources()[-1]["data"]["dashboard.json"]
+
+        assert json.loads(dashboard) == {"dashboard": {"title": 'quoted "edge" group Monitoring'}}
+
+    def test_app_group_namespace_applied_to_members(self):
+        group = (AppGroup("ns-group")
+                 .set_namespace("shop")
+                 .add_shared_config(ConfigMap("settings").add("mode", "prod"))
+                 .add_service(App("api").image("api:v1").port(8080)))
+
+        resources = group.generate_kubernetes_resources()
+
+        assert [r["kind"] for r in resources] == ["ConfigMap", "Deployment", "Service"]
+        assert {r["metadata"]["namespace"] for r in resources} == {"shop"}
+
+        api = group.get_service("api")
+        db = StatefulApp("db").image("postgres:13").port(5432)
+        group.add_service(db).generate_kubernetes_resources()
+        assert {r["metadata"]["namespace"] for r in api.generate_kubernetes_resources()} == {"default"}
+        assert {r["metadata"]["namespace"] for r in db.generate_kubernetes_resources()} == {"default"}
+
+    def test_app_group_dependencies_deduplicated(self):
+        group = AppGroup("dedupe-group").add_services(
+            [App(name).image(f"{name}:v1") for name in ("db", "cache", "api")])
+
+        group.add_dependency("api", ["db", "cache", "db"]).add_dependency("api", "db")
+        assert group._dependencies == {"api": ["db", "cache"]}
+
+        group.set_dependencies({"api": ["cache", "cache", "db"]})
+        assert group._dependencies == {"api": ["cache", "db"]}
+
+    def test_app_group_dependencies_applied_once_per_change(self, monkeypatch):
+        api = App("api").image("api:v1")
+        group = (AppGroup("deps-group")
+                 .add_shared_secret(Secret("deps-secret").add("token", "abc"))
+                 .add_services([api, App("db").image("db:v1"), App("cache").image("cache:v1")])
+                 .add_dependency("api", "db"))
+
+        group.generate_kubernetes_resources()
+        calls = []
+        monkeypatch.setattr(App, "depends_on", lambda self, deps: calls.append((self.name, deps)) or self)
+
+        group.generate_kubernetes_resources()
+        assert calls == []
+
+        group.add_dependency("api", "cache")
+        group.generate_kubernetes_resources()
+        assert calls == [("api", ["cache"])]
+
+    def test_app_group_iter_resources_streams_untracked_groups(self):
+        secret = Secret("stream-secret").add("token", "abc")
+        group = (AppGroup("stream-group")
+                 .add_shared_secret(secret)
+                 .add_service(App("api").image("api:v1")))
+
+        resources = group.iter_kubernetes_resources()
+        assert next(resources)["kind"] == "Secret"
+
+        group.add_service(App("worker").image("worker:v1"))
+        assert [r["metadata"]["name"] for r in resources] == ["api", "worker"]
+
+        tracked = AppGroup("tracked-group").add_service(App("api").image("api:v1"))
+        assert list(tracked.iter_kubernetes_resources()) == tracked.generate_kubernetes_resources()
+
+    def test_app_group_parallel_render_keeps_order(self):
+        def build():
+            return (AppGroup("parallel-group")
+                    .add_shared_config(ConfigMap("settings").add("mode", "prod"))
+                    .add_services([App(f"svc-{i}").image("svc:v1").port(8080) for i in range(6)]))
+
+        sequential = build().generate_kubernetes_resources()
+        assert build().parallel_render().generate_kubernetes_resources() == sequential
+
+    def test_app_group_untracked_members_rendered_every_time(self):
+        secret = Secret("group-secret").add("token", "abc")
+        group = AppGroup("secret-group").add_service(App("api").image("api:v1"))
+        group.add_shared_secret(secret)
+
+        group.generate_kubernetes_resources()
+        secret.add("password", "xyz")
+
+        rendered = [r for r in group.generate_kubernetes_resources() if r["kind"] == "Secret"]
+        assert set(rendered[0]["stringData"]) == {"token", "password"}
+
 
 class TestSecret:
     """Test cases for the Secret class (secrets management)."""
@@ -432,6 +1175,23 @@ class TestSecret:
         assert secret_resource["stringData"]["username"] == "admin"
         assert secret_resource["stringData"]["password"] == "secret123"
 
+    def test_secret_metadata_checks_reused_until_labels_change(self, monkeypatch):
+        from src.celestra.core import base_builder
+
+        calls = []
+        check = base_builder._metadata_errors
+        monkeypatch.setattr(base_builder, "_metadata_errors",
+                            lambda *args: calls.append(args[1]) or check(*args))
+
+        secret = Secret("checked-secret").add("token", "abc")
+        secret.validate()
+        secret.add("password", "xyz").validate()
+        assert calls == ["Label", "Annotation"]
+
+        secret.add_label("team", "t" * 64)
+        assert f"Label value {'t' * 64} must be 63 characters or less" in secret.validate()
+        assert len(calls) == 4
+
 
 class TestConfigMap:
     def test_basic_configmap_creation(self):
@@ -66,6 +66,25 @@ class TestService:
         assert port_mapping["metrics"] == (9090, 9090)
         assert port_mapping["admin"] == (9000, 9000)
     
+    def test_networking_package_exports(self):
+        from src.celestra import networking
+
+        assert networking.Service is Service
+        assert networking.NetworkPolicy is NetworkPolicy
+        assert set(networking.__all__) <= set(dir(networking))
+        with pytest.raises(AttributeError):
+            networking.Router
+    
+    def test_service_add_ports(self):
+        """Test adding several Service ports in one call."""
+        service = Service("bulk-service").add_ports([
+            {"name": "http", "port": 80, "target_port": 8080},
+            {"name": "grpc", "port": 9090, "protocol": "TCP"},
+        ])
+        
+        port_mapping = {p["name"]: (p["port"], p["targetPort"]) for p in service._ports}
+        assert port_mapping == {"http": (80, 8080), "grpc": (9090, 9090)}
+    
     def test_service_types(self):
         # Test ClusterIP service
         cluster_service = Service("cluster-service").type("ClusterIP")
@@ -146,6 +165,19 @@ class TestIngress:
         assert ingress._name == "web-ingress"
         assert ingress._ingress_class == "nginx"
 
+    def test_ingress_bulk_paths(self):
+        ingress = (Ingress("bulk-ingress")
+                   .host("example.com")
+                   .paths([
+                       {"path": "/api", "service_name": "api", "service_port": 8080},
+                       {"path": "/", "service_name": "web", "service_port": 80, "path_type": "Exact"},
+                   ]))
+        
+        paths = ingress._rules[0]["http"]["paths"]
+        assert [p["path"] for p in paths] == ["/api", "/"]
+        assert paths[1]["pathType"] == "Exact"
+        assert paths[0]["backend"]["service"]["port"]["number"] == 8080
+
     def test_ingress_multiple_hosts_and_paths(self):
         ingress = (Ingress("multi-host-ingress")
                    .host("api.example.com")
@@ -230,6 +262,7 @@ class TestCompanion:
         companion.image("init:latest")
         
         assert companion.name == "init-container"
+        assert companion.type == "init"
 
     def test_companion_volume_sharing(self):
         companion = (Companion("volume-companion")
@@ -255,6 +288,61 @@ class TestCompanion:
         
         assert len(app._companions) == 1
 
+    def test_companions_rendered_by_type(self):
+        app = (App("companion-app")
+               .image("app:latest")
+               .add_companions([
+                   Companion("log-shipper").image("log-agent:latest"),
+                   Companion("db-migrate", "init").image("migrate:latest"),
+               ]))
+        
+        pod_spec = app.generate_kubernetes_resources()[0]["spec"]["template"]["spec"]
+        
+        assert [c["name"] for c in pod_spec["initContainers"]] == ["db-migrate"]
+        assert [c["name"] for c in pod_spec["containers"]] == ["companion-app", "log-shipper"]
+
+    def test_companion_invalid_settings_rejected(self):
+        with pytest.raises(ValueError):
+            Companion("bad-type", "daemon")
+        with pytest.raises(ValueError):
+            Companion("bad-policy").image_pull_policy("Sometimes")
+
+        assert Companion("puller").image_pull_policy("Always").to_dict()["imagePullPolicy"] == "Always"
+
+    def test_companion_collections_allocated_on_use(self):
+        companion = Companion("minimal").image("busybox")
+        assert companion._ports is None and companion._volume_mounts is None
+        assert companion.to_dict() == {"name": "minimal", "image": "busybox"}
+
+        companion.mount_volume("data", "/data").resources(cpu="50m")
+        spec = companion.to_dict()
+        assert spec["volumeMounts"] == [{"name": "data", "mountPath": "/data", "readOnly": False}]
+        assert spec["resources"] == {"requests": {"cpu": "50m"}}
+
+    def test_companion_state_in_slots(self):
+        companion = Companion("log-shipper").image("log-agent:latest").env("LEVEL", "info")
+        companion.to_dict()
+
+        assert not hasattr(companion, "__dict__")
+        assert companion._environment == {"LEVEL": "info"}
+
+    def test_companion_spec_reused_until_changed(self):
+        companion = Companion("exporter").image("exporter:v1").env("PORT", "9100")
+
+        spec = companion.to_dict()
+        assert companion.to_dict() is spec
+
+        companion.port(9100, "metrics")
+        updated = companion.to_dict()
+        assert updated is not spec
+        assert updated["ports"] == [{"containerPort": 9100, "name": "metrics", "protocol": "TCP"}]
+        assert updated["env"] == [{"name": "PORT", "value": "9100"}]
+
+        companion.type = "init"
+        assert "ports" not in companion.to_dict()
+        companion.name = "renamed-exporter"
+        assert companion.to_dict()["name"] == "renamed-exporter"
+
 
 class TestScaling:
     """Test cases for the Scaling class (horizontal and vertical scaling)."""
@@ -334,6 +422,16 @@ class TestHealth:
         # Note: Metrics endpoints may not be implemented
         assert health is not None
 
+    def test_app_renders_configured_probes(self):
+        health = Health().readiness_http("/ready", 8080)
+        app = App("probed-app").image("app:latest").health(health)
+        
+        container = app.generate_kubernetes_resources()[0]["spec"]["template"]["spec"]["containers"][0]
+        
+        assert container["readinessProbe"]["httpGet"]["path"] == "/ready"
+        assert "readiness_probe" not in container
+        assert "livenessProbe" not in container
+
 
 class TestNetworkPolicy:
     """Test cases for the NetworkPolicy class (network security)."""
@@ -375,4 +473,14 @@ class TestNetworkPolicy:
         policy = NetworkPolicy("k8s-policy")
         
         resources = policy.generate_kubernetes_resources()
-        assert len(resources) >= 0  # May or may not generate resources 
\ No newline at end of file
+        assert len(resources) >= 0  # May or may not generate resources
+
+    def test_network_policy_exclude_services(self):
+        policy = (NetworkPolicy("narrowed-policy")
+                  .apply_to_services(["api"])
+                  .exclude_services(["gateway"]))
+
+        assert policy._pod_selector == {
+            "matchLabels": {"app": "api"},
+            "matchExpressions": [{"key": "app", "operator": "NotIn", "values": ["gateway"]}],
+        }
@@ -59,6 +59,23 @@ class TestKubernetesOutput:
             # Check that files exist
             assert len(os.listdir(temp_dir)) > 0
 
+    def test_yaml_files_skip_per_file_mkdir(self, monkeypatch):
+        app = App("mkdir-app").image("nginx:1.21").port(8080)
+        output = KubernetesOutput()
+        mkdir_calls = []
+        original_mkdir = Path.mkdir
+
+        def counting_mkdir(path, *args, **kwargs):
+            mkdir_calls.append(path)
+            return original_mkdir(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output.generate(app, temp_dir)
+
+            assert len(os.listdir(temp_dir)) > 1
+            assert mkdir_calls == [Path(temp_dir)]
+
     def test_yaml_namespace_organization(self):
         app = (App("ns-app")
                .image("nginx:1.21")
@@ -267,4 +284,61 @@ class TestMultiFormatOutput:
                 output = output_class(name)
                 output.add_resource(app)
                 output.generate(temp_dir)
-                assert len(os.listdir(temp_dir)) > 0 
\ No newline at end of file
+                assert len(os.listdir(temp_dir)) > 0 
+
+    def test_generate_all_formats_in_parallel(self):
+        app = App("parallel-format-app").image("nginx:1.21").port(8080)
+        
+        with tempfile.TemporaryDirectory() as serial_dir, \
+                tempfile.TemporaryDirectory() as parallel_dir:
+            formats = ["yaml", "docker-compose"]
+            app.generate().to_all_formats(serial_dir, formats=formats)
+            app.generate().to_all_formats(parallel_dir, formats=formats, parallel=True)
+            
+            for name in ("docker-compose.yml", "k8s"):
+                assert os.path.exists(os.path.join(parallel_dir, name))
+            assert (sorted(os.listdir(os.path.join(parallel_dir, "k8s")))
+                    == sorted(os.listdir(os.path.join(serial_dir, "k8s"))))
+
+    def test_generate_all_formats_renders_builder_once(self, monkeypatch):
+        app = App("shared-format-app").image("nginx:1.21").port(8080)
+        generator = app.generate()
+        resources = app.generate_kubernetes_resources()
+        calls = []
+        
+        def counting_render(self):
+            calls.append(1)
+            return resources
+        
+        monkeypatch.setattr(App, "generate_kubernetes_resources", counting_render)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generator.to_all_formats(temp_dir)
+            
+            for name in ("k8s", "docker-compose.yml", "charts", "kustomize", "terraform"):
+                assert os.path.exists(os.path.join(temp_dir, name))
+            assert os.path.exists(os.path.join(temp_dir, "kustomize", "base", "kustomization.yaml"))
+        
+        assert len(calls) == 1
+
+    def test_output_classes_resolved_once(self):
+        from src.celestra.core import resource_generator
+        
+        assert resource_generator._output_class("helm") is HelmOutput
+        assert resource_generator._output_class("kubernetes") is KubernetesOutput
+        assert resource_generator._output_classes["helm"] is HelmOutput
+
+    def test_to_kustomize_writes_base_at_base_path(self):
+        generator = App("kustomize-path-app").image("nginx:1.21").port(8080).generate()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generator.to_kustomize(os.path.join(temp_dir, "k8s", "base"), overlays=["staging"])
+            
+            assert os.path.exists(os.path.join(temp_dir, "k8s", "base", "kustomization.yaml"))
+            assert os.path.isdir(os.path.join(temp_dir, "k8s", "overlays", "staging"))
+
+    def test_to_kustomize_documented_root(self, monkeypatch):
+        generator = App("kustomize-root-app").image("nginx:1.21").port(8080).generate()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.chdir(temp_dir)
+            generator.to_kustomize("./kustomize/")
+            
+            assert os.path.exists(os.path.join(temp_dir, "kustomize", "base", "kustomization.yaml"))